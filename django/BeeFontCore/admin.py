@@ -8,6 +8,7 @@ from .models import (
     Glyph,
     FontBuild,
     JobPalette,
+    PageAnalysisTask,
 )
 
 
@@ -162,3 +163,22 @@ class JobPaletteAdmin(admin.ModelAdmin):
     search_fields = ("job__sid", "job__name")
     readonly_fields = ("updated_at",)
     ordering = ("-updated_at",)
+
+
+@admin.register(PageAnalysisTask)
+class PageAnalysisTaskAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "job",
+        "page",
+        "status",
+        "progress",
+        "attempts",
+        "worker",
+        "created_at",
+        "finished_at",
+    )
+    list_filter = ("status", "created_at")
+    search_fields = ("job__sid", "job__name", "message", "error")
+    readonly_fields = ("created_at", "started_at", "finished_at")
+    ordering = ("-created_at",)
@@ -7,4 +7,7 @@ class BeeFontCoreConfig(AppConfig):
     label = "beefontcore"
     verbose_name = "Bee Font Core"
 
+    def ready(self):
+        from . import signals  # noqa: F401  (FontBuild → font_delivery-Cache)
+
  
@@ -0,0 +1,36 @@
+# django/BeeFontCore/management/commands/beefont_worker.py
+
+from django.core.management.base import BaseCommand
+
+from BeeFontCore.services.analysis_queue import run_worker
+
+
+class Command(BaseCommand):
+    help = "Run the BeeFont page-analysis worker (DB-backed queue)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=None,
+            help="Number of parallel analysis processes (default: BEEFONT_ANALYSIS_WORKERS or CPU count)",
+        )
+        parser.add_argument(
+            "--poll",
+            type=float,
+            default=None,
+            help="Seconds between queue polls when idle (default: BEEFONT_ANALYSIS_POLL_SECONDS)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process all currently queued tasks, then exit",
+        )
+
+    def handle(self, *args, **options):
+        run_worker(
+            concurrency=options["concurrency"],
+            poll_interval=options["poll"],
+            once=options["once"],
+            log=self.stdout.write,
+        )
@@ -0,0 +1,188 @@
+# django/BeeFontCore/management/commands/benchmark_beefont.py
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+from PIL import Image, ImageDraw, ImageFont
+
+from BeeFontCore.services import segment, trace
+from BeeFontCore.services.build_font import _png_to_svg
+from BeeFontCore.services.fonttools_builder import FontAssembler
+
+
+DEFAULT_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+
+
+def _render_letter_png(letter: str, path: Path, size: int = 1024) -> None:
+    """
+    Synthetische Glyphe im Format der Segmentierung:
+    weißer 1024er Canvas, schwarze Tinte.
+    """
+    im = Image.new("L", (size, size), 255)
+    draw = ImageDraw.Draw(im)
+    font = ImageFont.load_default(size=int(size * 0.7))
+    draw.text((size // 2, size // 2), letter, fill=0, font=font, anchor="mm")
+    im.save(path)
+
+
+def _noisy_page(seed: int, size: tuple[int, int] = (3508, 2480), speckles: int = 5000) -> np.ndarray:
+    """
+    Synthetische 0/1-Maske einer A4-Seite bei 300 dpi: ein paar Striche
+    plus viele 1–3 px große Speckles (Scanner-Rauschen).
+    """
+    rng = np.random.default_rng(seed)
+    H, W = size
+    mask = np.zeros((H, W), dtype=np.uint8)
+    for _ in range(60):
+        x0, y0 = int(rng.integers(0, W)), int(rng.integers(0, H))
+        x1, y1 = int(rng.integers(0, W)), int(rng.integers(0, H))
+        cv2.line(mask, (x0, y0), (x1, y1), 1, thickness=int(rng.integers(3, 12)))
+    ys = rng.integers(0, H - 3, speckles)
+    xs = rng.integers(0, W - 3, speckles)
+    sizes = rng.integers(1, 4, speckles)
+    for y, x, s in zip(ys, xs, sizes):
+        mask[y:y + s, x:x + s] = 1
+    return mask
+
+
+def _remove_small_components_loop(mask01: np.ndarray, min_area: int) -> np.ndarray:
+    """Alte Variante (ein Bilddurchlauf pro Komponente) als Referenz."""
+    mask_u8 = (mask01 > 0).astype(np.uint8)
+    num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(mask_u8, connectivity=8)
+    cleaned = np.zeros_like(mask_u8, dtype=np.uint8)
+    for label in range(1, num_labels):
+        if stats[label, cv2.CC_STAT_AREA] >= min_area:
+            cleaned[labels == label] = 1
+    return cleaned
+
+
+class Command(BaseCommand):
+    help = "Micro-benchmarks for BeeFont pipeline stages."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stage",
+            choices=["trace", "build", "components"],
+            default="trace",
+            help="Pipeline stage to benchmark",
+        )
+        parser.add_argument(
+            "--letters",
+            default=DEFAULT_LETTERS,
+            help="Letters to render as synthetic glyphs",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per backend (best run is reported)",
+        )
+
+    def handle(self, *args, **options):
+        letters = options["letters"]
+        repeat = max(1, options["repeat"])
+        if not letters:
+            raise CommandError("--letters must not be empty")
+
+        if options["stage"] == "trace":
+            self._bench_trace(letters, repeat)
+        elif options["stage"] == "build":
+            self._bench_build(letters, repeat)
+        elif options["stage"] == "components":
+            self._bench_components(repeat)
+
+    def _bench_trace(self, letters: str, repeat: int) -> None:
+        backends = {
+            trace.TRACE_BACKEND_OPENCV: trace.png_to_svg_inprocess,
+        }
+        if shutil.which("convert") and shutil.which("potrace"):
+            backends[trace.TRACE_BACKEND_POTRACE] = _png_to_svg
+        else:
+            self.stdout.write("potrace/convert not installed → skipping potrace backend")
+
+        with tempfile.TemporaryDirectory() as td:
+            td = Path(td)
+            pngs = []
+            for i, letter in enumerate(letters):
+                png = td / f"g{i}.png"
+                _render_letter_png(letter, png)
+                pngs.append(png)
+
+            for name, fn in backends.items():
+                out_dir = td / name
+                out_dir.mkdir()
+                best = None
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    for png in pngs:
+                        fn(png, out_dir / f"{png.stem}.svg")
+                    elapsed = time.perf_counter() - t0
+                    best = elapsed if best is None else min(best, elapsed)
+
+                per_glyph_ms = best * 1000.0 / len(pngs)
+                self.stdout.write(
+                    f"trace[{name}]: {len(pngs)} glyphs in {best:.3f}s "
+                    f"({per_glyph_ms:.2f} ms/glyph, best of {repeat})"
+                )
+
+    def _bench_build(self, letters: str, repeat: int) -> None:
+        """fontTools-Assemblierung (ohne Tracing), eine TTF pro Lauf."""
+        with tempfile.TemporaryDirectory() as td:
+            td = Path(td)
+            outlines = {}
+            for i, letter in enumerate(letters):
+                png = td / f"g{i}.png"
+                _render_letter_png(letter, png)
+                outlines[letter] = trace.trace_png(png)
+
+            best = None
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                asm = FontAssembler("BeeBench")
+                for letter, outline in outlines.items():
+                    asm.add_glyph(ord(letter), outline)
+                asm.save(td / "bench.ttf")
+                elapsed = time.perf_counter() - t0
+                best = elapsed if best is None else min(best, elapsed)
+
+            self.stdout.write(
+                f"build[fonttools]: {len(outlines)} glyphs in {best * 1000:.1f} ms (best of {repeat})"
+            )
+
+    def _bench_components(self, repeat: int) -> None:
+        """
+        segment._remove_small_components (Lookup-Tabelle) gegen die alte
+        Schleife über alle Labels, auf verrauschten synthetischen Seiten.
+        Bricht ab, wenn die Ergebnisse nicht bitgleich sind.
+        """
+        min_area = 8
+        for seed, speckles in enumerate((500, 2000, 8000)):
+            mask = _noisy_page(seed, speckles=speckles)
+
+            timings = {}
+            results = {}
+            for name, fn in (
+                ("loop", _remove_small_components_loop),
+                ("lut", segment._remove_small_components),
+            ):
+                best = None
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    results[name] = fn(mask, min_area)
+                    elapsed = time.perf_counter() - t0
+                    best = elapsed if best is None else min(best, elapsed)
+                timings[name] = best
+
+            if not np.array_equal(results["loop"], results["lut"]):
+                raise CommandError(f"components: output differs for seed={seed}")
+
+            self.stdout.write(
+                f"components[{speckles} speckles]: loop {timings['loop'] * 1000:.1f} ms, "
+                f"lut {timings['lut'] * 1000:.1f} ms "
+                f"(x{timings['loop'] / max(timings['lut'], 1e-9):.1f}, identical, best of {repeat})"
+            )
@@ -0,0 +1,45 @@
+# django/BeeFontCore/management/commands/gc_beefont.py
+
+from django.core.management.base import BaseCommand
+
+from BeeFontCore.services.media_gc import collect_garbage
+
+
+class Command(BaseCommand):
+    help = "Delete unreferenced BeeFont builds, orphaned glyph files and stale debug output."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only list what would be deleted",
+        )
+        parser.add_argument(
+            "--debug-days",
+            type=float,
+            default=None,
+            help="Keep debug output for this many days (default: BEEFONT_DEBUG_RETENTION_DAYS)",
+        )
+        parser.add_argument(
+            "--grace-hours",
+            type=float,
+            default=1.0,
+            help="Never touch unreferenced files younger than this (running builds/imports)",
+        )
+
+    def handle(self, *args, **options):
+        stats = collect_garbage(
+            debug_days=options["debug_days"],
+            grace_hours=options["grace_hours"],
+            dry_run=options["dry_run"],
+            log=self.stdout.write if options["verbosity"] >= 2 else None,
+        )
+        prefix = "[dry-run] would delete" if stats.dry_run else "deleted"
+        for category in sorted(stats.files):
+            self.stdout.write(
+                f"{prefix} {stats.files[category]} {category} file(s), "
+                f"{stats.bytes[category] / 1024:.1f} KiB"
+            )
+        self.stdout.write(
+            f"{prefix} {stats.total_files} file(s) total, {stats.total_bytes / 1024 / 1024:.2f} MiB"
+        )
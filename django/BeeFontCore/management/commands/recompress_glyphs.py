@@ -0,0 +1,48 @@
+# django/BeeFontCore/management/commands/recompress_glyphs.py
+
+from django.core.management.base import BaseCommand
+
+from BeeFontCore.models import Glyph, GlyphFormatType
+from BeeFontCore.services.glyph_png import recompress_glyph_files
+
+
+class Command(BaseCommand):
+    help = (
+        "Losslessly recompress stored PNG glyphs in place (1-bit where the image is pure "
+        "black/white) and report bytes saved. Rewritten glyphs are re-traced on the next build."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--job",
+            dest="sid",
+            default=None,
+            help="Only glyphs of this job (sid)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what would be saved",
+        )
+
+    def handle(self, *args, **options):
+        qs = Glyph.objects.filter(formattype=GlyphFormatType.PNG)
+        if options["sid"]:
+            qs = qs.filter(job__sid=options["sid"])
+        paths = qs.order_by("id").values_list("image_path", flat=True).iterator()
+
+        stats = recompress_glyph_files(
+            paths,
+            dry_run=options["dry_run"],
+            log=self.stdout.write if options["verbosity"] >= 2 else None,
+        )
+
+        prefix = "[dry-run] " if options["dry_run"] else ""
+        self.stdout.write(
+            f"{prefix}{stats.checked} glyph file(s) checked, {stats.rewritten} recompressed, "
+            f"{stats.missing} missing"
+        )
+        self.stdout.write(
+            f"{prefix}{stats.bytes_before / 1024:.1f} KiB → {stats.bytes_after / 1024:.1f} KiB "
+            f"({stats.bytes_saved / 1024:.1f} KiB saved)"
+        )
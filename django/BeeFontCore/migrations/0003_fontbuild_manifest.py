@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('beefontcore', '0002_page_analysis_task'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fontbuild',
+            name='manifest',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('beefontcore', '0004_templatedefinition_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fontjob',
+            name='glyphs_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
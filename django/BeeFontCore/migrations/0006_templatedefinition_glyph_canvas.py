@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:26
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('beefontcore', '0005_fontjob_glyphs_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='templatedefinition',
+            name='glyph_canvas_px',
+            field=models.PositiveIntegerField(default=1024, validators=[django.core.validators.MinValueValidator(64)]),
+        ),
+        migrations.AddField(
+            model_name='templatedefinition',
+            name='glyph_margin_px',
+            field=models.PositiveIntegerField(default=96),
+        ),
+    ]
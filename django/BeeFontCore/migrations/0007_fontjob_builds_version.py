@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('beefontcore', '0006_templatedefinition_glyph_canvas'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fontjob',
+            name='builds_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
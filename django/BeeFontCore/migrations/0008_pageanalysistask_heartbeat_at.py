@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('beefontcore', '0007_fontjob_builds_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pageanalysistask',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
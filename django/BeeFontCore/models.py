@@ -1,6 +1,7 @@
 from uuid import uuid4
 
 from django.conf import settings
+from django.core.validators import MinValueValidator
 from django.db import models
 from django.db.models import Q
 
@@ -55,6 +56,13 @@ class TemplateDefinition(models.Model):
     gap_x_mm = models.FloatField(default=0.0)
     gap_y_mm = models.FloatField(default=0.0)
 
+    # Normalisierte Glyph-PNGs aus der Seitenanalyse (quadratischer Canvas, in px)
+    glyph_canvas_px = models.PositiveIntegerField(default=1024, validators=[MinValueValidator(64)])
+    glyph_margin_px = models.PositiveIntegerField(default=96)
+
+    # Version für den Render-Cache von template_image
+    updated_at = models.DateTimeField(auto_now=True)
+
     class Meta:
         verbose_name = "Template definition"
         verbose_name_plural = "Template definitions"
@@ -85,6 +93,11 @@ class FontJob(models.Model):
     base_family = models.CharField(max_length=200, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # wird bei jedem Glyph-Schreibzugriff hochgezählt (Coverage-Cache-Key)
+    glyphs_version = models.PositiveIntegerField(default=0, editable=False)
+    # wird bei jedem FontBuild-Schreibzugriff hochgezählt (download_ttf-Cache-Key)
+    builds_version = models.PositiveIntegerField(default=0, editable=False)
+
     class Meta:
         verbose_name = "Font job"
         verbose_name_plural = "Font jobs"
@@ -126,6 +139,10 @@ class FontBuild(models.Model):
         default=FontBuildStyle.MONO,
     )
 
+    # Pro Glyphe: Hash der Quelldatei → Glyphname in der TTF,
+    # Grundlage für inkrementelle Rebuilds (build_font.build_font_incremental)
+    manifest = models.JSONField(default=dict, blank=True)
+
     class Meta:
         verbose_name = "Font build"
         verbose_name_plural = "Font builds"
@@ -174,6 +191,61 @@ class JobPage(models.Model):
         return f"Job {self.job.sid} – Page {self.page_index} ({self.template.code})"
 
 
+class PageAnalysisTask(models.Model):
+    """
+    Ein Eintrag in der DB-basierten Analyse-Queue.
+
+    Die Views legen nur noch einen Task an (HTTP 202), die eigentliche
+    Segmentierung läuft im Worker (manage.py beefont_worker).
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    id = models.AutoField(primary_key=True)
+    job = models.ForeignKey(FontJob, on_delete=models.CASCADE, related_name="analysis_tasks")
+    page = models.ForeignKey(JobPage, on_delete=models.CASCADE, related_name="analysis_tasks")
+
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.QUEUED,
+        db_index=True,
+    )
+    progress = models.IntegerField(default=0)  # 0..100
+    message = models.CharField(max_length=200, blank=True)
+
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    attempts = models.IntegerField(default=0)
+    worker = models.CharField(max_length=64, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # vom besitzenden Worker regelmäßig gesetzt, solange der Task läuft
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Page analysis task"
+        verbose_name_plural = "Page analysis tasks"
+        ordering = ["created_at"]
+        indexes = [
+            models.Index(fields=["status", "created_at"], name="beefont_task_queue_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Analysis {self.id} – Job {self.job.sid} Page {self.page.page_index} [{self.status}]"
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.Status.DONE, self.Status.FAILED)
+
+
 class GlyphFormatType(models.TextChoices):
     PNG = "png", "PNG bitmap"
     SVG = "svg", "SVG vector"
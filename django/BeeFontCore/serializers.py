@@ -9,7 +9,8 @@ from .models import (
     JobPage,
     Glyph,
     FontBuild, 
-    JobPalette
+    JobPalette,
+    PageAnalysisTask,
 )
 
 
@@ -40,6 +41,8 @@ class TemplateDefinitionSerializer(serializers.ModelSerializer):
             "rows",
             "cols",
             "capacity",
+            "glyph_canvas_px",
+            "glyph_margin_px",
         ]
 
 
@@ -99,6 +102,29 @@ class JobPageSerializer(serializers.ModelSerializer):
 
 
 
+class PageAnalysisTaskSerializer(serializers.ModelSerializer):
+    page_id = serializers.IntegerField(read_only=True)
+    page_index = serializers.IntegerField(source="page.page_index", read_only=True)
+
+    class Meta:
+        model = PageAnalysisTask
+        fields = [
+            "id",
+            "page_id",
+            "page_index",
+            "status",
+            "progress",
+            "message",
+            "result",
+            "error",
+            "attempts",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+
 class GlyphSerializer(serializers.ModelSerializer):
     page_index = serializers.SerializerMethodField()
 
@@ -142,17 +168,42 @@ class FontBuildSerializer(serializers.ModelSerializer):
         source="language",
         read_only=True,
     )
+    # aus dem Manifest des letzten Builds (inkrementelle Rebuilds)
+    reused_glyphs = serializers.SerializerMethodField()
+    rebuilt_glyphs = serializers.SerializerMethodField()
 
     class Meta:
         model = FontBuild
         fields = [
             "id",
             "language_code",
+            "glyph_formattype",
+            "style",
+            "created_at",
+            "ttf_path",
+            "success",
+            "log",
+            "reused_glyphs",
+            "rebuilt_glyphs",
+        ]
+        read_only_fields = [
+            "id",
+            "glyph_formattype",
+            "style",
             "created_at",
             "ttf_path",
             "success",
+            "log",
         ]
-        read_only_fields = ["id", "created_at", "ttf_path", "success"]
+
+    def _last_build(self, obj) -> dict:
+        return (obj.manifest or {}).get("last_build") or {}
+
+    def get_reused_glyphs(self, obj) -> int:
+        return int(self._last_build(obj).get("reused", 0))
+
+    def get_rebuilt_glyphs(self, obj) -> int:
+        return int(self._last_build(obj).get("rebuilt", 0))
 
 
 class BuildRequestSerializer(serializers.Serializer):
@@ -162,6 +213,25 @@ class BuildRequestSerializer(serializers.Serializer):
     )
 
 
+class BatchBuildRequestSerializer(serializers.Serializer):
+    """
+    Body für build-batch: mehrere Sprachen × Formattypes in einem Aufruf.
+    "color" = COLR/CPAL-Build aus den SVG-Glyphen.
+    """
+    languages = serializers.ListField(
+        child=serializers.SlugRelatedField(
+            slug_field="code",
+            queryset=SupportedLanguage.objects.all(),
+        ),
+        allow_empty=False,
+    )
+    formattypes = serializers.ListField(
+        child=serializers.ChoiceField(choices=["png", "svg", "color"]),
+        allow_empty=False,
+        default=["png"],
+    )
+
+
 class LanguageStatusSerializer(serializers.Serializer):
     language = serializers.CharField()
     ready = serializers.BooleanField()
@@ -0,0 +1,147 @@
+# BeeFontCore/services/alphabet.py
+#
+# SupportedLanguage.alphabet (TextField) einmal normalisieren statt in jedem
+# Status-/Build-Pfad neu mit list()/set() zu zerlegen.
+#
+# Normalisierung:
+#   - Unicode NFC ("A" + U+030A → "Å")
+#   - Zerlegung in Grapheme (Basiszeichen + Kombinationszeichen, ZWJ-Folgen,
+#     Variation Selectors, Emoji-Modifier, Regional-Indicator-Paare) –
+#     vereinfachte Form von UAX #29, ohne zusätzliche Abhängigkeit
+#   - Leerraum/Steuerzeichen fallen weg, Duplikate auch (Reihenfolge bleibt)
+#
+# Grapheme aus mehreren Codepoints ("ŋ̈", Emoji-ZWJ-Folgen) kann der Build
+# nicht über die cmap abbilden (bräuchte GSUB-Ligaturen). Sie stehen in
+# Alphabet.unmapped, zählen nicht zur Abdeckung (missing()) und werden im
+# Build-Log vermerkt.
+#
+# Ergebnis ist ein unveränderliches Alphabet-Objekt, gecacht über den Text
+# selbst: ändert sich die Zeile, ändert sich der Key → kein Invalidieren nötig.
+#
+# Glyph.letter wird für Vergleiche ebenfalls per NFC normalisiert (ZIP-Namen
+# von macOS kommen z.B. als NFD).
+
+import unicodedata
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable
+
+from ..models import SupportedLanguage
+
+
+ZWJ = 0x200D
+
+
+def normalize_letter(letter: str) -> str:
+    return unicodedata.normalize("NFC", letter or "")
+
+
+def _extends(cp: int, ch: str) -> bool:
+    """Gehört ch noch zum vorherigen Graphem?"""
+    if unicodedata.category(ch) in ("Mn", "Mc", "Me"):
+        return True
+    return (
+        cp == ZWJ
+        or 0xFE00 <= cp <= 0xFE0F          # Variation Selectors
+        or 0x1F3FB <= cp <= 0x1F3FF        # Emoji-Hautton-Modifier
+        or 0xE0020 <= cp <= 0xE007F        # Tag-Zeichen (Flaggen-Sequenzen)
+    )
+
+
+def _is_regional_indicator(cp: int) -> bool:
+    return 0x1F1E6 <= cp <= 0x1F1FF
+
+
+def graphemes(text: str) -> list[str]:
+    """Zerlegt (bereits normalisierten) Text in Grapheme."""
+    out: list[str] = []
+    cur = ""
+    after_zwj = False
+    ri_run = 0
+    for ch in text:
+        cp = ord(ch)
+        joins = bool(cur) and (
+            after_zwj
+            or _extends(cp, ch)
+            or (_is_regional_indicator(cp) and ri_run % 2 == 1)
+        )
+        if joins:
+            cur += ch
+        else:
+            if cur:
+                out.append(cur)
+            cur = ch
+        ri_run = ri_run + 1 if _is_regional_indicator(cp) else 0
+        after_zwj = cp == ZWJ
+    if cur:
+        out.append(cur)
+    return out
+
+
+@dataclass(frozen=True)
+class Alphabet:
+    text: str                                   # Rohtext aus der DB
+    tokens: tuple[str, ...]                     # Grapheme (NFC), eindeutig, in Reihenfolge
+    token_set: frozenset[str] = field(repr=False)
+    # Tokens aus genau einem Codepoint → cmap-fähig
+    codepoints: dict[str, int] = field(repr=False, hash=False, compare=False)
+    codepoint_set: frozenset[int] = field(repr=False)
+    # Schreibweisen für Glyph.objects.filter(letter__in=...) (NFC + Rohform)
+    lookup_letters: tuple[str, ...] = field(repr=False)
+
+    def __contains__(self, letter: str) -> bool:
+        return normalize_letter(letter) in self.token_set
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    @property
+    def unmapped(self) -> tuple[str, ...]:
+        """Tokens aus mehreren Codepoints (nicht in der cmap abbildbar)."""
+        return tuple(t for t in self.tokens if t not in self.codepoints)
+
+    def missing(self, covered: Iterable[str]) -> list[str]:
+        """
+        Abbildbare Tokens ohne Abdeckung, in Alphabet-Reihenfolge
+        (covered: NFC). unmapped zählt nicht mit.
+        """
+        covered = covered if isinstance(covered, (set, frozenset)) else set(covered)
+        return [t for t in self.tokens if t in self.codepoints and t not in covered]
+
+
+def _build(text: str, tokens: Iterable[str]) -> Alphabet:
+    ordered = tuple(dict.fromkeys(tokens))
+    codepoints = {t: ord(t) for t in ordered if len(t) == 1}
+    raw = [g for g in graphemes(text) if g.strip()] if text else []
+    lookup = tuple(dict.fromkeys([*ordered, *raw, *(unicodedata.normalize("NFD", t) for t in ordered)]))
+    return Alphabet(
+        text=text,
+        tokens=ordered,
+        token_set=frozenset(ordered),
+        codepoints=codepoints,
+        codepoint_set=frozenset(codepoints.values()),
+        lookup_letters=lookup,
+    )
+
+
+@lru_cache(maxsize=256)
+def parse_alphabet(text: str) -> Alphabet:
+    normalized = normalize_letter(text)
+    tokens = [
+        g for g in graphemes(normalized)
+        if not g.isspace() and unicodedata.category(g[0]) not in ("Cc", "Cf", "Zs", "Zl", "Zp")
+    ]
+    return _build(text or "", tokens)
+
+
+def alphabet_for(language: SupportedLanguage) -> Alphabet:
+    return parse_alphabet(language.alphabet or "")
+
+
+def merge_alphabets(alphabets: Iterable[Alphabet]) -> Alphabet:
+    """Vereinigung mehrerer Alphabete (z.B. Batch-Build), Reihenfolge des ersten Auftretens."""
+    alphabets = list(alphabets)
+    return _build(
+        "".join(a.text for a in alphabets),
+        (t for a in alphabets for t in a.tokens),
+    )
@@ -0,0 +1,378 @@
+# BeeFontCore/services/analysis_queue.py
+#
+# DB-basierte Queue für die Seitenanalyse.
+#
+# - Views rufen nur enqueue_page_analysis() auf und antworten mit 202.
+# - Der Worker (manage.py beefont_worker) holt Tasks per
+#   SELECT ... FOR UPDATE SKIP LOCKED und verteilt sie auf einen
+#   Prozess-Pool mit begrenzter Parallelität.
+# - Kein externer Broker nötig, Postgres reicht.
+# - Der Worker setzt für seine laufenden Tasks alle HEARTBEAT_SECONDS
+#   heartbeat_at; requeue_stale_tasks() plant nur Tasks ohne frischen
+#   Heartbeat neu ein (Worker tot), nie einen langsamen, lebenden Task.
+# - Der Heartbeat sagt nur, dass der Worker lebt, nicht der Pool-Prozess:
+#   ein hängendes Kind (cv2, potrace …) begrenzt die Wall-Clock-Deadline
+#   BEEFONT_ANALYSIS_TASK_TIMEOUT. Der Worker markiert den Task dann als
+#   failed, beendet den Pool und plant die übrigen laufenden Tasks neu ein.
+# - enqueue_pending_pages(): alle offenen Seiten eines Jobs einplanen
+#   (unter einer Sperre auf die Job-Zeile, keine Doppel-Tasks); den
+#   Fortschritt fragt der Client über analysis-tasks/ ab.
+
+import os
+import socket
+import time
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils.timezone import now
+
+from ..models import FontJob, JobPage, PageAnalysisTask
+from .page_analysis import run_page_analysis
+from .pool_init import init_django
+
+
+HEARTBEAT_SECONDS = 15
+
+
+def analysis_worker_count() -> int:
+    configured = int(getattr(settings, "BEEFONT_ANALYSIS_WORKERS", 0) or 0)
+    if configured > 0:
+        return configured
+    return os.cpu_count() or 1
+
+
+def enqueue_page_analysis(job: FontJob, page: JobPage) -> PageAnalysisTask:
+    """
+    Legt einen Analyse-Task für die Seite an.
+
+    Ist für diese Seite bereits ein Task offen (queued/running),
+    wird dieser zurückgegeben statt einen zweiten anzulegen.
+    """
+    if not page.scan_image_path:
+        raise ValueError("Für diese Seite ist noch kein Scan hochgeladen.")
+
+    with transaction.atomic():
+        _lock_job(job)
+        open_task = (
+            PageAnalysisTask.objects
+            .filter(
+                page=page,
+                status__in=[PageAnalysisTask.Status.QUEUED, PageAnalysisTask.Status.RUNNING],
+            )
+            .order_by("-created_at")
+            .first()
+        )
+        if open_task is not None:
+            return open_task
+
+        return PageAnalysisTask.objects.create(job=job, page=page)
+
+
+def _lock_job(job: FontJob) -> None:
+    # parallele Enqueues desselben Jobs (analyse/, analyse-pending/) würden
+    # sonst beide "kein offener Task" sehen und eine Seite doppelt einplanen
+    FontJob.objects.select_for_update().filter(pk=job.pk).first()
+
+
+def claim_next_task(worker_name: str) -> PageAnalysisTask | None:
+    """
+    Nimmt den ältesten wartenden Task und markiert ihn als running.
+    SKIP LOCKED sorgt dafür, dass parallele Worker sich nicht blockieren.
+    """
+    with transaction.atomic():
+        task = (
+            PageAnalysisTask.objects
+            .select_for_update(skip_locked=True)
+            .filter(status=PageAnalysisTask.Status.QUEUED)
+            .order_by("created_at")
+            .first()
+        )
+        if task is None:
+            return None
+
+        task.status = PageAnalysisTask.Status.RUNNING
+        task.started_at = now()
+        task.heartbeat_at = task.started_at
+        task.finished_at = None
+        task.attempts += 1
+        task.worker = worker_name[:64]
+        task.progress = 0
+        task.message = "Analyse gestartet"
+        task.error = ""
+        task.save(
+            update_fields=[
+                "status",
+                "started_at",
+                "heartbeat_at",
+                "finished_at",
+                "attempts",
+                "worker",
+                "progress",
+                "message",
+                "error",
+            ]
+        )
+        return task
+
+
+def process_task(task_id: int) -> bool:
+    """
+    Führt einen (bereits geclaimten) Task aus und schreibt Ergebnis/Fehler zurück.
+    Läuft im Pool-Prozess.
+    """
+    task = (
+        PageAnalysisTask.objects
+        .select_related("job", "page", "page__template")
+        .get(pk=task_id)
+    )
+    tasks = PageAnalysisTask.objects.filter(pk=task_id)
+
+    def report(percent: int, message: str) -> None:
+        tasks.update(
+            progress=max(0, min(100, int(percent))),
+            message=message[:200],
+            heartbeat_at=now(),
+        )
+
+    try:
+        result = run_page_analysis(task.job, task.page, progress=report)
+    except Exception as e:
+        tasks.update(
+            status=PageAnalysisTask.Status.FAILED,
+            error=str(e),
+            message="Analyse fehlgeschlagen",
+            finished_at=now(),
+        )
+        return False
+
+    tasks.update(
+        status=PageAnalysisTask.Status.DONE,
+        result=result,
+        progress=100,
+        message=result.get("detail", "")[:200],
+        finished_at=now(),
+    )
+    return True
+
+
+def send_heartbeat(worker_name: str, task_ids) -> int:
+    """Lebenszeichen für die laufenden Tasks dieses Workers."""
+    return PageAnalysisTask.objects.filter(
+        pk__in=list(task_ids),
+        worker=worker_name[:64],
+        status=PageAnalysisTask.Status.RUNNING,
+    ).update(heartbeat_at=now())
+
+
+def requeue_stale_tasks() -> int:
+    """
+    Laufende Tasks ohne Heartbeat seit BEEFONT_ANALYSIS_HEARTBEAT_TIMEOUT
+    (Worker abgestürzt / gekillt) werden erneut eingeplant – oder nach zu
+    vielen Versuchen als failed markiert.
+    """
+    timeout_s = int(getattr(settings, "BEEFONT_ANALYSIS_HEARTBEAT_TIMEOUT", 120))
+    max_attempts = int(getattr(settings, "BEEFONT_ANALYSIS_MAX_ATTEMPTS", 3))
+    cutoff = now() - timedelta(seconds=max(timeout_s, 2 * HEARTBEAT_SECONDS))
+
+    stale = PageAnalysisTask.objects.filter(
+        Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at__isnull=True, started_at__lt=cutoff),
+        status=PageAnalysisTask.Status.RUNNING,
+    )
+    failed = stale.filter(attempts__gte=max_attempts).update(
+        status=PageAnalysisTask.Status.FAILED,
+        error="Analyse-Timeout (Worker nicht mehr erreichbar).",
+        finished_at=now(),
+    )
+    requeued = stale.filter(attempts__lt=max_attempts).update(
+        status=PageAnalysisTask.Status.QUEUED,
+        message="Erneut eingeplant",
+    )
+    return failed + requeued
+
+
+def fail_timed_out_task(task_id: int, timeout_s: float) -> int:
+    return PageAnalysisTask.objects.filter(
+        pk=task_id,
+        status=PageAnalysisTask.Status.RUNNING,
+    ).update(
+        status=PageAnalysisTask.Status.FAILED,
+        error=f"Analyse-Timeout ({timeout_s:g} s).",
+        message="Analyse fehlgeschlagen",
+        finished_at=now(),
+    )
+
+
+def requeue_tasks(task_ids) -> int:
+    """Laufende Tasks zurück in die Queue (Pool wurde beendet, Task unschuldig)."""
+    return PageAnalysisTask.objects.filter(
+        pk__in=list(task_ids),
+        status=PageAnalysisTask.Status.RUNNING,
+    ).update(
+        status=PageAnalysisTask.Status.QUEUED,
+        message="Erneut eingeplant",
+    )
+
+
+def _terminate_pool(pool: ProcessPoolExecutor) -> None:
+    # ProcessPoolExecutor kann einen laufenden Aufruf nicht abbrechen →
+    # Prozesse beenden; der Pool ist danach kaputt und wird neu aufgesetzt
+    for proc in list((pool._processes or {}).values()):
+        proc.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run_worker(
+    concurrency: int | None = None,
+    poll_interval: float | None = None,
+    once: bool = False,
+    log=print,
+    task_timeout: float | None = None,
+    execute=process_task,
+) -> None:
+    """
+    Worker-Schleife: claimt Tasks, solange Slots frei sind, und führt sie
+    in einem Prozess-Pool aus (ein Prozess pro Kern als Default).
+
+    once=True: alle aktuell wartenden Tasks abarbeiten, dann beenden.
+    task_timeout: Wall-Clock-Deadline pro Task (BEEFONT_ANALYSIS_TASK_TIMEOUT).
+    execute: im Pool-Prozess ausgeführte Funktion (task_id → bool).
+    """
+    concurrency = concurrency or analysis_worker_count()
+    if poll_interval is None:
+        poll_interval = float(getattr(settings, "BEEFONT_ANALYSIS_POLL_SECONDS", 1.0))
+    if task_timeout is None:
+        task_timeout = float(getattr(settings, "BEEFONT_ANALYSIS_TASK_TIMEOUT", 600))
+
+    worker_name = f"{socket.gethostname()}:{os.getpid()}"
+    log(f"[BeeFont][worker] {worker_name} started, concurrency={concurrency}")
+
+    requeue_stale_tasks()
+    last_stale_check = time.monotonic()
+    last_heartbeat = time.monotonic()
+
+    ctx = multiprocessing.get_context("spawn")
+    stop = False
+
+    while not stop:
+        # Ein abgestürzter Pool-Prozess macht den ganzen Pool unbrauchbar
+        # (BrokenProcessPool) → neuen Pool aufsetzen und weitermachen.
+        with ProcessPoolExecutor(
+            max_workers=concurrency,
+            mp_context=ctx,
+            initializer=init_django,
+        ) as pool:
+            inflight = {}
+            deadlines = {}
+            broken = False
+
+            while True:
+                for fut in [f for f in inflight if f.done()]:
+                    task_id = inflight.pop(fut)
+                    deadlines.pop(fut, None)
+                    exc = fut.exception()
+                    if exc is not None:
+                        broken = broken or isinstance(exc, BrokenProcessPool)
+                        # Task nicht hängen lassen
+                        PageAnalysisTask.objects.filter(pk=task_id).update(
+                            status=PageAnalysisTask.Status.FAILED,
+                            error=f"Worker-Fehler: {exc}",
+                            message="Analyse fehlgeschlagen",
+                            finished_at=now(),
+                        )
+                        log(f"[BeeFont][worker] task {task_id} crashed: {exc}")
+                    else:
+                        log(f"[BeeFont][worker] task {task_id} {'done' if fut.result() else 'failed'}")
+
+                overdue = [f for f in inflight if time.monotonic() >= deadlines[f]]
+                if overdue:
+                    for fut in overdue:
+                        task_id = inflight.pop(fut)
+                        fail_timed_out_task(task_id, task_timeout)
+                        log(f"[BeeFont][worker] task {task_id} timed out after {task_timeout:g}s")
+                    requeue_tasks(inflight.values())
+                    _terminate_pool(pool)
+                    log("[BeeFont][worker] process pool terminated, restarting")
+                    break
+
+                if broken:
+                    if not inflight:
+                        log("[BeeFont][worker] process pool broken, restarting")
+                        break
+                else:
+                    while len(inflight) < concurrency:
+                        task = claim_next_task(worker_name)
+                        if task is None:
+                            break
+                        fut = pool.submit(execute, task.id)
+                        inflight[fut] = task.id
+                        deadlines[fut] = time.monotonic() + task_timeout
+
+                if once and not inflight and not broken:
+                    stop = True
+                    break
+
+                if inflight and time.monotonic() - last_heartbeat >= HEARTBEAT_SECONDS:
+                    send_heartbeat(worker_name, inflight.values())
+                    last_heartbeat = time.monotonic()
+
+                if time.monotonic() - last_stale_check > 60:
+                    requeue_stale_tasks()
+                    last_stale_check = time.monotonic()
+
+                if inflight:
+                    wait(list(inflight), timeout=poll_interval, return_when=FIRST_COMPLETED)
+                else:
+                    time.sleep(poll_interval)
+
+    log(f"[BeeFont][worker] {worker_name} stopped")
+
+
+# -------------------------------------------------------------------
+# Job-Ebene: alle offenen Seiten auf einmal (über die Queue)
+# -------------------------------------------------------------------
+
+def pending_pages(job: FontJob) -> list[JobPage]:
+    """
+    Seiten mit Scan, die noch nicht analysiert sind und für die kein
+    Queue-Task offen ist (sonst würde der Worker sie doppelt analysieren).
+    """
+    open_task_pages = PageAnalysisTask.objects.filter(
+        job=job,
+        status__in=[PageAnalysisTask.Status.QUEUED, PageAnalysisTask.Status.RUNNING],
+    ).values("page_id")
+    return list(
+        JobPage.objects
+        .filter(job=job, analysed_at__isnull=True)
+        .exclude(scan_image_path="")
+        .exclude(pk__in=open_task_pages)
+        .select_related("template")
+        .order_by("page_index")
+    )
+
+
+def enqueue_pending_pages(job: FontJob) -> tuple[int, list[PageAnalysisTask]]:
+    """
+    Legt für alle offenen Seiten einen Task an.
+
+    Rückgabe: (Anzahl neu eingeplanter Seiten, alle offenen Tasks des Jobs –
+    neue und bereits wartende/laufende)
+    """
+    with transaction.atomic():
+        _lock_job(job)
+        created = PageAnalysisTask.objects.bulk_create(
+            [PageAnalysisTask(job=job, page=page) for page in pending_pages(job)]
+        )
+        return len(created), list(
+            PageAnalysisTask.objects
+            .filter(
+                job=job,
+                status__in=[PageAnalysisTask.Status.QUEUED, PageAnalysisTask.Status.RUNNING],
+            )
+            .select_related("page")
+            .order_by("page__page_index")
+        )
@@ -0,0 +1,185 @@
+# BeeFontCore/services/batch_build.py
+#
+# Mehrere Fonts eines Jobs in einem Rutsch bauen (Sprachen × Formattypes).
+#
+# - Default-Glyphen pro Formattype nur einmal laden
+# - Vereinigung der Alphabete einmal vektorisieren (gemeinsamer OutlineCache)
+# - TTFs parallel erzeugen (inkrementell, wie build_ttf), Ablage im
+#   inhaltsadressierten Build-Store (build_store)
+# - FontBuild-Zeilen am Ende in einer Transaktion schreiben; ein
+#   fehlgeschlagenes Ziel behält den letzten erfolgreichen Build
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.db import connection, transaction
+
+from ..models import FontBuild, FontJob, Glyph, SupportedLanguage
+from . import build_font, build_store, glyph_coverage
+from .alphabet import alphabet_for, merge_alphabets
+from .job_paths import font_build_rel_path
+from .outline_cache import OutlineCache
+
+
+BATCH_KINDS = (
+    build_font.BUILD_KIND_PNG,
+    build_font.BUILD_KIND_SVG,
+    build_font.BUILD_KIND_COLOR,
+)
+
+
+def _formattype_for(kind: str) -> str:
+    return "png" if kind == build_font.BUILD_KIND_PNG else "svg"
+
+
+def _style_for(kind: str) -> str:
+    if kind == build_font.BUILD_KIND_COLOR:
+        return FontBuild.FontBuildStyle.COLOR
+    return FontBuild.FontBuildStyle.MONO
+
+
+@dataclass
+class BatchTarget:
+    language: SupportedLanguage
+    kind: str
+    rel_path: str                 # sprechender Name (Arbeitsdatei)
+    ttf_path: str = ""            # Store-Pfad nach erfolgreichem Build
+    success: bool = False
+    log: str = ""
+    manifest: dict = field(default_factory=dict)
+
+
+@dataclass
+class BatchResult:
+    builds: list[FontBuild]
+    skipped: list[dict]
+    log: str
+
+
+def run_batch_build(
+    job: FontJob,
+    languages: list[SupportedLanguage],
+    kinds: list[str],
+) -> BatchResult:
+    # 1) Default-Buchstaben pro Formattype (gecacht, glyph_coverage)
+    covered_by_fmt = {
+        fmt: glyph_coverage.default_letters(job, fmt)
+        for fmt in {_formattype_for(k) for k in kinds}
+    }
+
+    # 2) Coverage prüfen → Ziele / übersprungene Kombinationen
+    targets: list[BatchTarget] = []
+    skipped: list[dict] = []
+    for lang in languages:
+        for kind in kinds:
+            fmt = _formattype_for(kind)
+            coverage = glyph_coverage.language_status(lang, covered_by_fmt[fmt])
+            if not coverage["ready"]:
+                skipped.append({
+                    "language": lang.code,
+                    "formattype": kind,
+                    "missing_chars": coverage["missing_chars"],
+                    "missing_count": coverage["missing_count"],
+                })
+                continue
+            targets.append(
+                BatchTarget(
+                    language=lang,
+                    kind=kind,
+                    rel_path=font_build_rel_path(
+                        job, lang.code, fmt, color=kind == build_font.BUILD_KIND_COLOR
+                    ),
+                )
+            )
+
+    if not targets:
+        return BatchResult(builds=[], skipped=skipped, log="")
+
+    # Default-Glyphen pro Formattype einmal laden (nur was gebaut wird)
+    glyphs_by_fmt = {
+        fmt: list(Glyph.objects.filter(job=job, is_default=True, formattype=fmt))
+        for fmt in {_formattype_for(t.kind) for t in targets}
+    }
+
+    previous = {
+        (b.language_id, b.glyph_formattype, b.style): (b.manifest, b.ttf_path)
+        for b in FontBuild.objects.filter(job=job).exclude(ttf_path="")
+    }
+
+    with ExitStack() as stack:
+        cache = OutlineCache.for_job(job)
+        if not cache.enabled:
+            # Job-Cache abgeschaltet → für diesen Batch ein temporärer Cache
+            td = stack.enter_context(tempfile.TemporaryDirectory())
+            cache = OutlineCache(Path(td), 1 << 62)
+
+        # 3) Vereinigung der Alphabete einmal vektorisieren
+        shared_logs = []
+        for kind in dict.fromkeys(t.kind for t in targets):
+            union = merge_alphabets(
+                alphabet_for(t.language) for t in targets if t.kind == kind
+            )
+            shared_logs.append(
+                build_font.trace_shared_sources(
+                    kind, glyphs_by_fmt[_formattype_for(kind)], union, cache
+                ).text()
+            )
+
+        # 4) TTFs parallel bauen
+        def run(target: BatchTarget) -> None:
+            fmt = _formattype_for(target.kind)
+            alphabet = alphabet_for(target.language)
+            glyphs = [g for g in glyphs_by_fmt[fmt] if g.letter in alphabet]
+            prev_manifest, prev_ttf = previous.get(
+                (target.language.code, fmt, _style_for(target.kind)), (None, None)
+            )
+            try:
+                with build_store.workspace(
+                    job, os.path.basename(target.rel_path), prev_ttf
+                ) as work_ttf:
+                    build_log, target.manifest = build_font.build_font_incremental(
+                        target.kind,
+                        job,
+                        target.language,
+                        glyphs,
+                        work_ttf,
+                        previous_manifest=prev_manifest,
+                        cache=cache,
+                    )
+                    target.ttf_path = build_store.commit(job, work_ttf)
+                target.success = True
+                target.log = build_log.text()
+            except Exception as e:
+                target.success = False
+                target.log = str(e)
+                target.manifest = {}
+            finally:
+                # Thread-eigene DB-Verbindung (Palette) nicht offen lassen
+                connection.close()
+
+        workers = min(len(targets), build_font._build_worker_count())
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(run, targets))
+
+    # 5) FontBuild-Zeilen gemeinsam schreiben
+    builds: list[FontBuild] = []
+    with transaction.atomic():
+        for t in targets:
+            builds.append(
+                build_store.save_build_result(
+                    job,
+                    t.language,
+                    _formattype_for(t.kind),
+                    _style_for(t.kind),
+                    success=t.success,
+                    log=t.log,
+                    ttf_path=t.ttf_path,
+                    manifest=t.manifest,
+                )
+            )
+
+    return BatchResult(builds=builds, skipped=skipped, log="\n".join(shared_logs))
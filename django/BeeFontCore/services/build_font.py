@@ -1,9 +1,13 @@
 # BeeFontCore/services/build_font.py
 
 import json
+import os
 import shutil
 import subprocess
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
  
 from django.conf import settings
@@ -11,18 +15,288 @@ import xml.etree.ElementTree as ET
 from fontTools.ttLib import TTFont
 from fontTools.colorLib.builder import buildCOLR, buildCPAL
 
+from ..models import Glyph
+from .alphabet import Alphabet, alphabet_for, normalize_letter, parse_alphabet
 from .palette import get_palette_for_job
+from .fontforge_worker import FontForgeError, run_fontforge_script
+from .fonttools_builder import FontAssembler, UNITS_PER_EM
+from .outline_cache import OutlineCache, file_sha256
+from .svg_raster import rasterize_svg
+from . import trace
 
 
+FONT_BUILDER_FONTFORGE = "fontforge"
+FONT_BUILDER_FONTTOOLS = "fonttools"
+FONT_BUILDERS = (FONT_BUILDER_FONTFORGE, FONT_BUILDER_FONTTOOLS)
 
+# bei Änderungen an _split_svg_into_palette_slots erhöhen (Cache-Key)
+SLOT_SPLIT_VERSION = 1
 
 
-def _find_fontforge() -> str:
-    for name in ("fontforge", "fontforge-nox"):
-        path = shutil.which(name)
-        if path:
-            return path
-    raise RuntimeError("fontforge binary not found (install 'fontforge' in the django image)")
+
+
+
+class BuildLog:
+    """
+    Sammelt Wall-Time pro Build-Stage und nicht-fatale Fehler
+    (z.B. einzelne Glyphen, die nicht vektorisiert werden konnten).
+    text() landet in FontBuild.log.
+    """
+
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+        self.warnings: list[str] = []
+        self.notes: list[str] = []
+
+    @contextmanager
+    def stage(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + (time.perf_counter() - t0)
+
+    def warn(self, message: str) -> None:
+        self.warnings.append(message)
+
+    def note(self, message: str) -> None:
+        self.notes.append(message)
+
+    def text(self) -> str:
+        lines = ["[timings]"]
+        for name, secs in self.timings.items():
+            lines.append(f"{name}: {secs * 1000:.0f} ms")
+        lines.append(f"total: {sum(self.timings.values()) * 1000:.0f} ms")
+        if self.notes:
+            lines.append("[notes]")
+            lines.extend(self.notes)
+        if self.warnings:
+            lines.append("[warnings]")
+            lines.extend(self.warnings)
+        return "\n".join(lines)
+
+
+def _build_worker_count() -> int:
+    configured = int(getattr(settings, "BEEFONT_BUILD_WORKERS", 0) or 0)
+    if configured > 0:
+        return configured
+    return os.cpu_count() or 1
+
+
+def _font_builder() -> str:
+    builder = str(getattr(settings, "BEEFONT_FONT_BUILDER", FONT_BUILDER_FONTFORGE)).lower()
+    if builder not in FONT_BUILDERS:
+        raise RuntimeError(
+            f"Unknown BEEFONT_FONT_BUILDER {builder!r}, expected one of {FONT_BUILDERS}"
+        )
+    return builder
+
+
+def _family_for(job) -> str:
+    return getattr(job, "base_family", None) or job.name or "BeeHand"
+
+
+def _parallel_map(fn, items: dict) -> tuple[dict, dict[str, str]]:
+    """
+    fn(value) für alle Einträge parallel (Thread-Pool, BEEFONT_BUILD_WORKERS).
+
+    Rückgabe: ({key: Ergebnis} in Eingabereihenfolge, {key: Fehlermeldung})
+    """
+    results: dict = {}
+    failures: dict[str, str] = {}
+    if not items:
+        return results, failures
+
+    workers = min(_build_worker_count(), len(items))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {key: pool.submit(fn, value) for key, value in items.items()}
+        for key, fut in futures.items():
+            try:
+                results[key] = fut.result()
+            except Exception as e:
+                failures[key] = str(e)
+
+    return results, failures
+
+
+def _finish_cache(cache: OutlineCache, build_log: BuildLog) -> None:
+    if not cache.enabled:
+        return
+    removed = cache.evict()
+    build_log.note(cache.summary() + (f", {removed} evicted" if removed else ""))
+
+
+def collect_glyph_sources(
+    default_glyphs, alphabet: Alphabet | str, suffix: str | None = None
+) -> dict[str, tuple[Glyph, Path]]:
+    """
+    Default-Glyphen → {token: (Glyph, absoluter Quellpfad)}.
+
+    - nur Buchstaben, die im Alphabet der Sprache vorkommen (NFC-Vergleich)
+    - nur Tokens aus einem Codepoint (Alphabet.codepoints → cmap);
+      Grapheme aus mehreren Codepoints bräuchten GSUB-Ligaturen
+    - nur existierende Dateien (optional mit passender Endung)
+    - erster Treffer pro Token gewinnt
+    """
+    media_root = Path(settings.MEDIA_ROOT)
+    if not isinstance(alphabet, Alphabet):
+        alphabet = parse_alphabet(alphabet or "")
+    codepoints = alphabet.codepoints
+
+    sources: dict[str, tuple[Glyph, Path]] = {}
+    for g in default_glyphs:
+        token = normalize_letter(g.letter)
+
+        if token not in codepoints:
+            continue
+
+        src = media_root / g.image_path
+        if not src.is_file():
+            continue
+
+        if suffix and src.suffix.lower() != suffix:
+            continue
+
+        if token not in sources:
+            sources[token] = (g, src)
+    return sources
+
+
+def collect_sources(default_glyphs, alphabet: Alphabet | str, suffix: str | None = None) -> dict[str, Path]:
+    """Default-Glyphen → {token: absoluter Quellpfad} (siehe collect_glyph_sources)."""
+    return {
+        token: src
+        for token, (_glyph, src) in collect_glyph_sources(default_glyphs, alphabet, suffix).items()
+    }
+
+
+def _vectorize_pngs(
+    png_sources: dict[str, Path],
+    svg_dir: Path,
+    tmp_png_dir: Path,
+    cache: OutlineCache | None = None,
+) -> tuple[list[str], dict[str, str]]:
+    """
+    PNG → SVG für alle Tokens parallel.
+
+    Backend über BEEFONT_TRACE_BACKEND:
+      - "potrace": convert + potrace (Subprozesse, wartet fast nur auf Kindprozesse)
+      - "opencv" : In-Process-Tracing (trace.py), keine Subprozesse/Temp-Dateien
+    In beiden Fällen reicht ein Thread-Pool (OpenCV gibt den GIL frei,
+    kein zusätzlicher Fork des Django-Prozesses).
+
+    Ergebnisse liegen im OutlineCache (Key = PNG-Inhalt + Backend/Parameter),
+    unveränderte Glyphen werden nicht erneut vektorisiert.
+
+    Rückgabe: (erfolgreiche Tokens, {token: Fehlermeldung})
+    """
+    backend = trace.trace_backend()
+    cache = cache or OutlineCache(None, 0)
+    params = {"backend": backend}
+    if backend == trace.TRACE_BACKEND_OPENCV:
+        params.update(trace.trace_params())
+
+    def vectorize(item: tuple[str, Path]) -> str:
+        token, src = item
+        svg_path = svg_dir / f"{token}.svg"
+
+        def render() -> bytes:
+            if backend == trace.TRACE_BACKEND_OPENCV:
+                trace.png_to_svg_inprocess(src, svg_path)
+            else:
+                tmp_png = tmp_png_dir / f"{token}.png"
+                shutil.copy2(src, tmp_png)
+                _png_to_svg(tmp_png, svg_path)
+            return svg_path.read_bytes()
+
+        data = cache.cached("png-svg", src, params, "svg", render)
+        if not svg_path.is_file():
+            svg_path.write_bytes(data)
+        return token
+
+    done, failures = _parallel_map(vectorize, {t: (t, src) for t, src in png_sources.items()})
+    return list(done), failures
+
+
+def _cached_outline(cache: OutlineCache | None, kind: str, src: Path, params: dict, compute):
+    if cache is None or not cache.enabled:
+        return compute()
+    data = cache.cached(kind, src, params, "json", lambda: compute().to_json())
+    return trace.GlyphOutline.from_json(data)
+
+
+def _svg_outline(svg: Path, cache: OutlineCache | None = None) -> trace.GlyphOutline:
+    """
+    SVG-Glyphe → GlyphOutline für den fontTools-Builder.
+
+    Editor-SVGs bestehen nur aus Strichen (fill="none"); FontForge expandiert
+    die beim Import. Hier wird die SVG auf em-Höhe gerastert und wie eine
+    PNG-Glyphe getract – gleiche Outline-Qualität für beide Quellen.
+    """
+
+    def compute() -> trace.GlyphOutline:
+        outline = trace.trace_mask(rasterize_svg(svg, UNITS_PER_EM))
+        if not outline.contours:
+            raise RuntimeError(f"no ink found in {svg}")
+        return outline
+
+    params = {**trace.trace_params(), "raster_px": UNITS_PER_EM}
+    return _cached_outline(cache, "svg-outline", svg, params, compute)
+
+
+def _png_outline(png: Path, cache: OutlineCache | None = None) -> trace.GlyphOutline:
+    def compute() -> trace.GlyphOutline:
+        outline = trace.trace_png(png)
+        if not outline.contours:
+            raise RuntimeError(f"no ink found in {png}")
+        return outline
+
+    return _cached_outline(cache, "png-outline", png, trace.trace_params(), compute)
+
+
+def _build_mono_fonttools(
+    sources: dict[str, Path],
+    load_outline,
+    family: str,
+    out_ttf: Path,
+    build_log: BuildLog,
+) -> None:
+    """
+    fontTools-Pfad für build_ttf_png / build_ttf_svg:
+    Outlines parallel erzeugen, TTF im Speicher bauen, einmal schreiben.
+    """
+    with build_log.stage("trace"):
+        outlines, failures = _parallel_map(load_outline, sources)
+
+    for token, err in sorted(failures.items()):
+        build_log.warn(f"trace {token!r} failed: {err}")
+
+    if not outlines:
+        raise RuntimeError(
+            "build_ttf: keine Glyphe konnte vektorisiert werden.\n"
+            + "\n".join(build_log.warnings)
+        )
+
+    with build_log.stage("assemble"):
+        asm = FontAssembler(family)
+        for token, outline in outlines.items():
+            asm.add_glyph(ord(token), outline)
+        asm.save(out_ttf)
+
+
+def _run_fontforge(script_path: Path, label: str = "") -> None:
+    """
+    Generiertes FontForge-Script ausführen – über den langlebigen
+    FontForge-Worker (fontforge_worker.py), inkl. Timeout.
+    """
+    try:
+        run_fontforge_script(script_path)
+    except FontForgeError as e:
+        raise RuntimeError(
+            f"fontforge failed{f' ({label})' if label else ''}: {e}\n"
+            f"stdout:\n{e.stdout}\n"
+            f"stderr:\n{e.stderr}"
+        )
 
 
 def _png_to_svg(png: Path, svg: Path, timeout: float = 5.0) -> None:
@@ -309,7 +583,7 @@ print("OK glyphs (color):", count)
     script_path.write_text(script, encoding="utf-8")
 
 
-def build_ttf_png (job, language, default_glyphs, out_ttf) -> None:
+def build_ttf_png (job, language, default_glyphs, out_ttf, cache: OutlineCache | None = None) -> BuildLog:
     """
     V3-Build:
 
@@ -325,35 +599,19 @@ def build_ttf_png (job, language, default_glyphs, out_ttf) -> None:
 
     Wir ignorieren:
     - V2-Slots, segments/, mapping.json usw.
+
+    Vektorisierung läuft parallel (BEEFONT_BUILD_WORKERS, Default = CPU-Kerne).
+    Einzelne fehlgeschlagene Glyphen brechen den Build nicht ab, sondern
+    landen im zurückgegebenen BuildLog.
     """
-    media_root = Path(settings.MEDIA_ROOT)
+    build_log = BuildLog()
     out_ttf = Path(out_ttf)
     out_ttf.parent.mkdir(parents=True, exist_ok=True)
 
-    alphabet = language.alphabet or ""
-    alphabet_chars = set(alphabet)
-
-    mapping: dict[str, int] = {}
-    png_sources: dict[str, Path] = {}
-
-    for g in default_glyphs:
-        token = g.letter
-
-        # nur Buchstaben, die im Alphabet der Sprache vorkommen
-        if token not in alphabet_chars:
-            continue
-
-        # wir erwarten 1-Zeichen-Token; Multi-Token könntest du später mappen
-        if len(token) != 1:
-            continue
-
-        src = media_root / g.image_path
-        if not src.is_file():
-            continue
-
-        if token not in png_sources:
-            png_sources[token] = src
-            mapping[token] = ord(token)
+    with build_log.stage("collect"):
+        alphabet = alphabet_for(language)
+        png_sources = collect_sources(default_glyphs, alphabet)
+    mapping: dict[str, int] = {token: alphabet.codepoints[token] for token in png_sources}
 
     if not mapping:
         raise RuntimeError(
@@ -361,6 +619,22 @@ def build_ttf_png (job, language, default_glyphs, out_ttf) -> None:
             f"und Job {job.sid} gefunden."
         )
 
+    family = _family_for(job)
+
+    cache = cache or OutlineCache.for_job(job)
+
+    if _font_builder() == FONT_BUILDER_FONTTOOLS:
+        # Outlines direkt aus der Maske (trace.py), unabhängig von BEEFONT_TRACE_BACKEND
+        _build_mono_fonttools(
+            png_sources,
+            lambda src: _png_outline(src, cache),
+            family,
+            out_ttf,
+            build_log,
+        )
+        _finish_cache(cache, build_log)
+        return build_log
+
     with tempfile.TemporaryDirectory() as td:
         td = Path(td)
         svg_dir = td / "svg"
@@ -368,40 +642,37 @@ def build_ttf_png (job, language, default_glyphs, out_ttf) -> None:
         svg_dir.mkdir(parents=True, exist_ok=True)
         tmp_png_dir.mkdir(parents=True, exist_ok=True)
 
-        # PNG → SVG
-        for token, src in png_sources.items():
-            tmp_png = tmp_png_dir / f"{token}.png"
-            shutil.copy2(src, tmp_png)
-            svg_path = svg_dir / f"{token}.svg"
-            _png_to_svg(tmp_png, svg_path)
+        # PNG → SVG (parallel)
+        with build_log.stage("vectorize"):
+            _ok, failures = _vectorize_pngs(png_sources, svg_dir, tmp_png_dir, cache)
+
+        for token, err in sorted(failures.items()):
+            build_log.warn(f"vectorize {token!r} failed: {err}")
+            mapping.pop(token, None)
+
+        if not mapping:
+            raise RuntimeError(
+                "build_ttf: keine Glyphe konnte vektorisiert werden.\n"
+                + "\n".join(build_log.warnings)
+            )
 
         # FontForge-Script schreiben
         script_path = td / "build_font.py"
-        family = getattr(job, "base_family", None) or job.name or "BeeHand"
         _write_fontforge_script(script_path, svg_dir, out_ttf, family, mapping)
 
         # FontForge aufrufen
-        ff = _find_fontforge()
-        cmd = [ff, "-lang=py", "-script", str(script_path)]
-        proc = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        if proc.returncode != 0:
-            raise RuntimeError(
-                f"fontforge failed ({ff})\n"
-                f"stdout:\n{proc.stdout}\n"
-                f"stderr:\n{proc.stderr}"
-            )
+        with build_log.stage("fontforge"):
+            _run_fontforge(script_path)
 
     if not out_ttf.is_file() or out_ttf.stat().st_size == 0:
         raise RuntimeError(f"build_ttf: FontForge hat keine gültige TTF erzeugt: {out_ttf}")
 
+    _finish_cache(cache, build_log)
+    return build_log
+
 
 
-def build_ttf_svg(job, language, default_glyphs, out_ttf) -> None:
+def build_ttf_svg(job, language, default_glyphs, out_ttf, cache: OutlineCache | None = None) -> BuildLog:
     """
     V3-Build (SVG):
 
@@ -420,38 +691,14 @@ def build_ttf_svg(job, language, default_glyphs, out_ttf) -> None:
     - Keine Konvertierung über ImageMagick/potrace; wir kopieren nur in ein
       temporäres Verzeichnis mit standardisiertem Namen "<LETTER>.svg".
     """
-    media_root = Path(settings.MEDIA_ROOT)
+    build_log = BuildLog()
     out_ttf = Path(out_ttf)
     out_ttf.parent.mkdir(parents=True, exist_ok=True)
 
-    alphabet = language.alphabet or ""
-    alphabet_chars = set(alphabet)
-
-    mapping: dict[str, int] = {}
-    svg_sources: dict[str, Path] = {}
-
-    for g in default_glyphs:
-        token = g.letter
-
-        # nur Buchstaben, die im Alphabet der Sprache vorkommen
-        if token not in alphabet_chars:
-            continue
-
-        # wir erwarten 1-Zeichen-Token; Multi-Token könntest du später mappen
-        if len(token) != 1:
-            continue
-
-        src = media_root / g.image_path
-        if not src.is_file():
-            continue
-
-        # Optional: nur .svg mitnehmen
-        if src.suffix.lower() != ".svg":
-            continue
-
-        if token not in svg_sources:
-            svg_sources[token] = src
-            mapping[token] = ord(token)
+    with build_log.stage("collect"):
+        alphabet = alphabet_for(language)
+        svg_sources = collect_sources(default_glyphs, alphabet, suffix=".svg")
+    mapping: dict[str, int] = {token: alphabet.codepoints[token] for token in svg_sources}
 
     if not mapping:
         raise RuntimeError(
@@ -459,6 +706,20 @@ def build_ttf_svg(job, language, default_glyphs, out_ttf) -> None:
             f"und Job {job.sid} gefunden."
         )
 
+    family = _family_for(job)
+
+    if _font_builder() == FONT_BUILDER_FONTTOOLS:
+        cache = cache or OutlineCache.for_job(job)
+        _build_mono_fonttools(
+            svg_sources,
+            lambda src: _svg_outline(src, cache),
+            family,
+            out_ttf,
+            build_log,
+        )
+        _finish_cache(cache, build_log)
+        return build_log
+
     with tempfile.TemporaryDirectory() as td:
         td = Path(td)
         svg_dir = td / "svg"
@@ -471,28 +732,17 @@ def build_ttf_svg(job, language, default_glyphs, out_ttf) -> None:
 
         # FontForge-Script schreiben
         script_path = td / "build_font_svg.py"
-        family = getattr(job, "base_family", None) or job.name or "BeeHand"
         _write_fontforge_script(script_path, svg_dir, out_ttf, family, mapping)
 
         # FontForge aufrufen
-        ff = _find_fontforge()
-        cmd = [ff, "-lang=py", "-script", str(script_path)]
-        proc = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        if proc.returncode != 0:
-            raise RuntimeError(
-                f"fontforge failed ({ff})\n"
-                f"stdout:\n{proc.stdout}\n"
-                f"stderr:\n{proc.stderr}"
-            )
+        with build_log.stage("fontforge"):
+            _run_fontforge(script_path)
 
     if not out_ttf.is_file() or out_ttf.stat().st_size == 0:
         raise RuntimeError(f"build_ttf_svg: FontForge hat keine gültige TTF erzeugt: {out_ttf}")
 
+    return build_log
+
 
 #############################################
 # COLOR FONT
@@ -647,6 +897,38 @@ def _split_svg_into_palette_slots(
     return result
 
 
+def _split_svg_cached(
+    cache: OutlineCache,
+    src_svg: Path,
+    dest_dir: Path,
+    token: str,
+) -> dict[str, Path]:
+    """
+    Wie _split_svg_into_palette_slots, aber die Slot-SVGs einer Quell-SVG
+    kommen aus dem OutlineCache, solange sich die Quelle nicht ändert.
+    """
+    if not cache.enabled:
+        return _split_svg_into_palette_slots(src_svg, dest_dir, token)
+
+    def split() -> bytes:
+        with tempfile.TemporaryDirectory() as split_td:
+            files = _split_svg_into_palette_slots(src_svg, Path(split_td), token)
+            return json.dumps(
+                {slot: path.read_text(encoding="utf-8") for slot, path in files.items()}
+            ).encode("utf-8")
+
+    data = cache.cached("svg-slots", src_svg, {"version": SLOT_SPLIT_VERSION}, "json", split)
+
+    result: dict[str, Path] = {}
+    dest_dir = Path(dest_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    for slot, text in json.loads(data).items():
+        out_path = dest_dir / f"{token}__{slot}.svg"
+        out_path.write_text(text, encoding="utf-8")
+        result[slot] = out_path
+    return result
+
+
 ######
 
 def _safe_hex_to_rgba_float(hex_color: str, fallback: str) -> tuple[float, float, float, float]:
@@ -681,6 +963,14 @@ def _hex_to_rgba_float(hex_color: str) -> tuple[float, float, float, float]:
     return (r / 255.0, g / 255.0, b / 255.0, a / 255.0)
 
 
+def _cpal_palettes(palette_dict: dict[str, str]) -> list[list[tuple[float, float, float, float]]]:
+    """Job-Palette → CPAL-Paletten, Reihenfolge wie PALETTE_SLOTS."""
+    primary = _safe_hex_to_rgba_float(palette_dict.get("primary", "#000000"), "#000000")
+    accent = _safe_hex_to_rgba_float(palette_dict.get("accent", "#ff9900"), "#ff9900")
+    secondary = _safe_hex_to_rgba_float(palette_dict.get("secondary", "#ffffff"), "#ffffff")
+    return [[primary, accent, secondary]]
+
+
 def _apply_colr_cpal(ttf_path: Path, palette_dict: dict[str, str]) -> None:
     """
     Fügt dem bestehenden TTF eine COLR/CPAL-Struktur hinzu:
@@ -701,14 +991,14 @@ def _apply_colr_cpal(ttf_path: Path, palette_dict: dict[str, str]) -> None:
         raise RuntimeError(f"_apply_colr_cpal: TTF not found: {ttf_path}")
 
     font = TTFont(str(ttf_path))
+    _set_colr_cpal(font, palette_dict)
+    font.save(str(ttf_path))
 
-    # 1) CPAL aufbauen
-    primary = _safe_hex_to_rgba_float(palette_dict.get("primary", "#000000"), "#000000")
-    accent = _safe_hex_to_rgba_float(palette_dict.get("accent", "#ff9900"), "#ff9900")
-    secondary = _safe_hex_to_rgba_float(palette_dict.get("secondary", "#ffffff"), "#ffffff")
 
-    palettes = [[primary, accent, secondary]]
-    font["CPAL"] = buildCPAL(palettes)
+def _set_colr_cpal(font: TTFont, palette_dict: dict[str, str]) -> None:
+    """COLR/CPAL wie _apply_colr_cpal, aber auf einem bereits geöffneten TTFont."""
+    # 1) CPAL aufbauen
+    font["CPAL"] = buildCPAL(_cpal_palettes(palette_dict))
 
     # 2) COLR v0
     glyph_order = font.getGlyphOrder()
@@ -736,10 +1026,8 @@ def _apply_colr_cpal(ttf_path: Path, palette_dict: dict[str, str]) -> None:
 
     font["COLR"] = buildCOLR(color_glyphs)
 
-    font.save(str(ttf_path))
-
 
-def build_ttf_svg_color(job, language, default_glyphs, out_ttf) -> None:
+def build_ttf_svg_color(job, language, default_glyphs, out_ttf, cache: OutlineCache | None = None) -> BuildLog:
     """
     COLOR-SVG-Build:
 
@@ -755,34 +1043,15 @@ def build_ttf_svg_color(job, language, default_glyphs, out_ttf) -> None:
     - Alte SVGs ohne data-beefont-color → komplette Glyph als primary.
     - Partielle Slots: fehlende Slots werden einfach nicht gezeichnet.
     """
-    media_root = Path(settings.MEDIA_ROOT)
+    build_log = BuildLog()
     out_ttf = Path(out_ttf)
     out_ttf.parent.mkdir(parents=True, exist_ok=True)
 
-    alphabet = language.alphabet or ""
-    alphabet_chars = set(alphabet)
-
-    mapping: dict[str, int] = {}
-    svg_sources: dict[str, Path] = {}
-
     # 1) SVG-Quellen sammeln (wie bei build_ttf_svg)
-    for g in default_glyphs:
-        token = g.letter
-
-        if token not in alphabet_chars:
-            continue
-        if len(token) != 1:
-            continue
-
-        src = media_root / g.image_path
-        if not src.is_file():
-            continue
-        if src.suffix.lower() != ".svg":
-            continue
-
-        if token not in svg_sources:
-            svg_sources[token] = src
-            mapping[token] = ord(token)
+    with build_log.stage("collect"):
+        alphabet = alphabet_for(language)
+        svg_sources = collect_sources(default_glyphs, alphabet, suffix=".svg")
+    mapping: dict[str, int] = {token: alphabet.codepoints[token] for token in svg_sources}
 
     if not mapping:
         raise RuntimeError(
@@ -790,18 +1059,28 @@ def build_ttf_svg_color(job, language, default_glyphs, out_ttf) -> None:
             f"und Job {job.sid} gefunden."
         )
 
+    family = _family_for(job)
+    cache = cache or OutlineCache.for_job(job)
+
     with tempfile.TemporaryDirectory() as td:
         td = Path(td)
         svg_layer_dir = td / "svg_layers"
         svg_layer_dir.mkdir(parents=True, exist_ok=True)
 
-        # 2) Jede SVG in Slot-SVGs aufteilen
-        for token, src in svg_sources.items():
-            _split_svg_into_palette_slots(src, svg_layer_dir, token)
+        # 2) Jede SVG in Slot-SVGs aufteilen (gecacht pro Quell-SVG)
+        with build_log.stage("split_slots"):
+            slot_files = {
+                token: _split_svg_cached(cache, src, svg_layer_dir, token)
+                for token, src in svg_sources.items()
+            }
+
+        if _font_builder() == FONT_BUILDER_FONTTOOLS:
+            _build_color_fonttools(job, slot_files, family, out_ttf, build_log, cache)
+            _finish_cache(cache, build_log)
+            return build_log
 
         # 3) FontForge-Script für COLOR bauen
         script_path = td / "build_font_svg_color.py"
-        family = getattr(job, "base_family", None) or job.name or "BeeHand"
         _write_fontforge_script_svg_color(
             script_path,
             svg_layer_dir,
@@ -811,20 +1090,8 @@ def build_ttf_svg_color(job, language, default_glyphs, out_ttf) -> None:
         )
 
         # 4) FontForge ausführen
-        ff = _find_fontforge()
-        cmd = [ff, "-lang=py", "-script", str(script_path)]
-        proc = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        if proc.returncode != 0:
-            raise RuntimeError(
-                f"fontforge failed (COLOR, {ff})\n"
-                f"stdout:\n{proc.stdout}\n"
-                f"stderr:\n{proc.stderr}"
-            )
+        with build_log.stage("fontforge"):
+            _run_fontforge(script_path, "COLOR")
 
     if not out_ttf.is_file() or out_ttf.stat().st_size == 0:
         raise RuntimeError(
@@ -832,5 +1099,305 @@ def build_ttf_svg_color(job, language, default_glyphs, out_ttf) -> None:
         )
 
     # 5) Palette holen und COLR/CPAL injizieren
-    palette = get_palette_for_job(job)
-    _apply_colr_cpal(out_ttf, palette)
+    with build_log.stage("colr_cpal"):
+        palette = get_palette_for_job(job)
+        _apply_colr_cpal(out_ttf, palette)
+
+    _finish_cache(cache, build_log)
+    return build_log
+
+
+def _build_color_fonttools(
+    job,
+    slot_files: dict[str, dict[str, Path]],
+    family: str,
+    out_ttf: Path,
+    build_log: BuildLog,
+    cache: OutlineCache | None = None,
+) -> None:
+    """
+    fontTools-Pfad für build_ttf_svg_color: Basis- und Layerglyphen,
+    COLR v0 und CPAL in einem Durchlauf, ein einziges save().
+    """
+
+    def trace_slots(slots: dict[str, Path]) -> list[tuple[str, int, trace.GlyphOutline]]:
+        layers = []
+        for idx, slot in enumerate(PALETTE_SLOTS):
+            if slot in slots:
+                layers.append((slot, idx, _svg_outline(slots[slot], cache)))
+        return layers
+
+    with build_log.stage("trace"):
+        layers_by_token, failures = _parallel_map(trace_slots, slot_files)
+
+    for token, err in sorted(failures.items()):
+        build_log.warn(f"trace {token!r} failed: {err}")
+
+    if not layers_by_token:
+        raise RuntimeError(
+            "build_ttf_svg_color: keine Glyphe konnte vektorisiert werden.\n"
+            + "\n".join(build_log.warnings)
+        )
+
+    with build_log.stage("assemble"):
+        asm = FontAssembler(family)
+        for token, layers in layers_by_token.items():
+            asm.add_color_glyph(ord(token), layers)
+        asm.save(out_ttf, palettes=_cpal_palettes(get_palette_for_job(job)))
+
+
+#############################################
+# INCREMENTAL BUILDS
+#############################################
+
+MANIFEST_VERSION = 1
+
+BUILD_KIND_PNG = "png"
+BUILD_KIND_SVG = "svg"
+BUILD_KIND_COLOR = "color"
+
+
+def _source_suffix(kind: str) -> str | None:
+    return None if kind == BUILD_KIND_PNG else ".svg"
+
+
+def _build_function(kind: str):
+    return {
+        BUILD_KIND_PNG: build_ttf_png,
+        BUILD_KIND_SVG: build_ttf_svg,
+        BUILD_KIND_COLOR: build_ttf_svg_color,
+    }[kind]
+
+
+def _manifest_header(kind: str, job) -> dict:
+    """Alles, was außer den Glyph-Quellen in die TTF eingeht."""
+    return {
+        "version": MANIFEST_VERSION,
+        "kind": kind,
+        "builder": _font_builder(),
+        "family": _family_for(job),
+        "trace": {"backend": trace.trace_backend(), **trace.trace_params()},
+    }
+
+
+def _changed_tokens(
+    previous: dict | None,
+    header: dict,
+    hashes: dict[str, str],
+    out_ttf: Path,
+) -> set[str] | None:
+    """
+    Tokens, deren Quelle sich seit dem letzten Build geändert hat.
+    None → inkrementeller Build nicht möglich (erster Build, anderer Builder,
+    andere Glyphenmenge, TTF fehlt ...).
+    """
+    if not previous or not out_ttf.is_file():
+        return None
+    if any(previous.get(k) != v for k, v in header.items()):
+        return None
+
+    prev_glyphs = previous.get("glyphs") or {}
+    if set(prev_glyphs) != set(hashes):
+        return None
+
+    return {
+        token
+        for token, sha in hashes.items()
+        if prev_glyphs[token].get("sha256") != sha or not prev_glyphs[token].get("name")
+    }
+
+
+def _splice_glyphs(
+    target_ttf: Path,
+    partial_ttf: Path,
+    tokens: list[str],
+    palette: dict[str, str] | None = None,
+) -> int:
+    """
+    Ersetzt in target_ttf die glyf/hmtx-Einträge der Tokens durch die aus
+    partial_ttf (gleicher Builder, nur geänderte Glyphen). Bei Color-Builds
+    werden die Layerglyphen <name>.<slot> mitgenommen und COLR/CPAL neu gesetzt.
+
+    Ändert sich die Glyphenstruktur (neue Namen, Slots, Composites), wird
+    ValueError geworfen → Aufrufer baut komplett neu.
+    Rückgabe: Anzahl ersetzter Basisglyphen.
+    """
+    font = TTFont(str(target_ttf))
+    part = TTFont(str(partial_ttf))
+
+    target_cmap = font.getBestCmap() or {}
+    partial_cmap = part.getBestCmap() or {}
+    target_glyf, partial_glyf = font["glyf"], part["glyf"]
+    target_hmtx, partial_hmtx = font["hmtx"], part["hmtx"]
+
+    pairs: list[tuple[str, str]] = []
+    replaced = 0
+    for token in tokens:
+        cp = ord(token)
+        p_name = partial_cmap.get(cp)
+        t_name = target_cmap.get(cp)
+        if p_name is None and t_name is None:
+            continue  # schlägt weiterhin fehl, nichts zu ersetzen
+        if p_name is None or t_name is None:
+            raise ValueError(f"glyph set changed for {token!r}")
+
+        pairs.append((p_name, t_name))
+        replaced += 1
+
+        if palette is not None:
+            for slot in PALETTE_SLOTS:
+                p_layer, t_layer = f"{p_name}.{slot}", f"{t_name}.{slot}"
+                if (p_layer in partial_glyf) != (t_layer in target_glyf):
+                    raise ValueError(f"color slots changed for {token!r}")
+                if p_layer in partial_glyf:
+                    pairs.append((p_layer, t_layer))
+
+    for p_name, t_name in pairs:
+        glyph = partial_glyf[p_name]
+        if glyph.isComposite():
+            raise ValueError(f"composite glyph {p_name!r} cannot be patched")
+        target_glyf[t_name] = glyph
+        target_hmtx[t_name] = partial_hmtx[p_name]
+
+    if palette is not None:
+        _set_colr_cpal(font, palette)
+
+    # erst komplett schreiben, dann ersetzen → Download sieht nie eine halbe Datei
+    tmp = target_ttf.with_name(target_ttf.name + ".tmp")
+    font.save(str(tmp))
+    os.replace(tmp, target_ttf)
+    return replaced
+
+
+def _glyph_manifest(out_ttf: Path, hashes: dict[str, str]) -> dict[str, dict]:
+    cmap = TTFont(str(out_ttf), lazy=True).getBestCmap() or {}
+    glyphs = {}
+    for token, sha in hashes.items():
+        name = cmap.get(ord(token))
+        # fehlgeschlagene Glyphen ohne Hash merken → beim nächsten Build erneut versuchen
+        glyphs[token] = {"sha256": sha if name else None, "name": name}
+    return glyphs
+
+
+def trace_shared_sources(kind: str, default_glyphs, alphabet: Alphabet | str, cache: OutlineCache) -> BuildLog:
+    """
+    Batch-Builds: Vektorisierung/Slot-Split für die Vereinigung mehrerer
+    Alphabete einmal vorab erledigen und im OutlineCache ablegen. Die
+    anschließenden Builds pro Sprache finden dann nur noch Cache-Treffer.
+    Fehler einzelner Glyphen landen später im Log des jeweiligen Builds.
+    """
+    build_log = BuildLog()
+    if not cache.enabled:
+        return build_log
+
+    sources = collect_sources(default_glyphs, alphabet, suffix=_source_suffix(kind))
+    fonttools = _font_builder() == FONT_BUILDER_FONTTOOLS
+
+    with build_log.stage(f"shared_trace_{kind}"), tempfile.TemporaryDirectory() as td:
+        td = Path(td)
+        if kind == BUILD_KIND_PNG:
+            if fonttools:
+                _parallel_map(lambda src: _png_outline(src, cache), sources)
+            else:
+                (td / "svg").mkdir()
+                (td / "png").mkdir()
+                _vectorize_pngs(sources, td / "svg", td / "png", cache)
+
+        elif kind == BUILD_KIND_SVG:
+            # FontForge importiert SVGs direkt, nur der fontTools-Pfad tract
+            if fonttools:
+                _parallel_map(lambda src: _svg_outline(src, cache), sources)
+
+        elif kind == BUILD_KIND_COLOR:
+            slot_files, _failures = _parallel_map(
+                lambda item: _split_svg_cached(cache, item[1], td / "slots", item[0]),
+                {token: (token, src) for token, src in sources.items()},
+            )
+            if fonttools:
+                slot_paths = {
+                    f"{token}__{slot}": path
+                    for token, slots in slot_files.items()
+                    for slot, path in slots.items()
+                }
+                _parallel_map(lambda src: _svg_outline(src, cache), slot_paths)
+
+    build_log.note(f"shared {kind}: {len(sources)} glyphs, {cache.summary()}")
+    return build_log
+
+
+def build_font_incremental(
+    kind: str,
+    job,
+    language,
+    default_glyphs,
+    out_ttf,
+    previous_manifest: dict | None = None,
+    cache: OutlineCache | None = None,
+) -> tuple[BuildLog, dict]:
+    """
+    Baut out_ttf für kind ("png" | "svg" | "color") inkrementell.
+
+    Das Manifest (FontBuild.manifest) hält pro Token den Hash der Quelldatei
+    und den Glyphnamen in der TTF. Beim nächsten Build:
+      - nichts geändert         → TTF bleibt (Color: nur CPAL/COLR neu)
+      - einzelne Glyphen anders → nur diese bauen und in die TTF einsetzen
+      - Builder/Parameter/Glyphenmenge anders → kompletter Build
+
+    cache: gemeinsamer OutlineCache (Batch-Builds), sonst der des Jobs.
+
+    Rückgabe: (BuildLog, neues Manifest)
+    """
+    out_ttf = Path(out_ttf)
+    glyphs = list(default_glyphs)
+    picked = collect_glyph_sources(glyphs, alphabet_for(language), suffix=_source_suffix(kind))
+    hashes = {token: file_sha256(src) for token, (_glyph, src) in picked.items()}
+    header = _manifest_header(kind, job)
+    build = _build_function(kind)
+    palette = get_palette_for_job(job) if kind == BUILD_KIND_COLOR else None
+
+    changed = _changed_tokens(previous_manifest, header, hashes, out_ttf)
+    mode = "full"
+
+    if changed is None:
+        build_log = build(job, language, glyphs, out_ttf, cache)
+
+    elif not changed:
+        build_log = BuildLog()
+        mode = "reuse"
+        if palette is not None:
+            with build_log.stage("colr_cpal"):
+                _apply_colr_cpal(out_ttf, palette)
+
+    else:
+        # über den NFC-Token auswählen (Glyph.letter kann z.B. NFD sein)
+        changed_glyphs = [picked[token][0] for token in sorted(changed)]
+        with tempfile.TemporaryDirectory() as td:
+            partial_ttf = Path(td) / "partial.ttf"
+            try:
+                build_log = build(job, language, changed_glyphs, partial_ttf, cache)
+                with build_log.stage("patch"):
+                    _splice_glyphs(out_ttf, partial_ttf, sorted(changed), palette)
+                mode = "patch"
+            except (ValueError, RuntimeError) as e:
+                full_log = build(job, language, glyphs, out_ttf, cache)
+                full_log.note(f"patch not possible ({e}), full rebuild")
+                build_log = full_log
+
+    rebuilt = len(hashes) if mode == "full" else len(changed or ())
+    build_log.note(f"glyphs: {len(hashes) - rebuilt} reused, {rebuilt} rebuilt ({mode})")
+    unmapped = alphabet_for(language).unmapped
+    if unmapped:
+        build_log.note(
+            f"not in font (multi-codepoint, no ligatures): {' '.join(unmapped)}"
+        )
+
+    manifest = {
+        **header,
+        "glyphs": _glyph_manifest(out_ttf, hashes),
+        "last_build": {
+            "mode": mode,
+            "reused": len(hashes) - rebuilt,
+            "rebuilt": rebuilt,
+        },
+    }
+    return build_log, manifest
@@ -0,0 +1,158 @@
+# BeeFontCore/services/build_store.py
+#
+# Inhaltsadressierte Ablage der gebauten TTFs pro Job:
+#
+#   beefont/jobs/<sid>/build/<sha256[:32]>.ttf
+#
+# - gebaut wird in einem privaten Arbeitsverzeichnis unter build/ (gleiches
+#   Dateisystem, parallele Builds derselben Sprache kommen sich nicht in
+#   die Quere); für inkrementelle Builds wird die vorherige TTF dort
+#   hineinkopiert
+# - vor dem Hashen werden die Build-Zeitstempel (head.created/modified,
+#   FontForge-FFTM) neutralisiert → gleiche Glyphenmenge = gleiche Bytes,
+#   Sprachen mit identischem Glyphensatz teilen sich eine Datei
+# - FontBuild.ttf_path zeigt auf die Hash-Datei; der sprechende Name
+#   (<job>_<lang>_<fmt>.ttf) wird nur noch für Downloads verwendet
+# - daneben die Web-Fonts <hash>.woff2 / <hash>.woff (webfont.emit_web_fonts)
+# - nicht mehr referenzierte Dateien räumt "manage.py gc_beefont" ab
+# - save_build_result(): ein fehlgeschlagener Build überschreibt nur
+#   success/log, ttf_path und manifest des letzten erfolgreichen Builds
+#   bleiben (Datei referenziert, nächster Build wieder inkrementell)
+
+import hashlib
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from django.conf import settings
+from fontTools.misc.timeTools import timestampFromString
+from fontTools.ttLib import TTFont
+
+from ..models import FontBuild, FontJob
+from .job_paths import font_build_rel_path, job_sid_media
+from .webfont import emit_web_fonts
+
+
+BUILD_DIRNAME = "build"
+WORK_PREFIX = ".work-"
+HASH_LENGTH = 32
+
+# fester Zeitstempel statt "jetzt" (reproduzierbare Bytes)
+CANONICAL_TIMESTAMP = timestampFromString("Mon Jan  1 00:00:00 2024")
+
+
+def build_dir(job: FontJob) -> Path:
+    return Path(settings.MEDIA_ROOT) / job_sid_media(job) / BUILD_DIRNAME
+
+
+def is_store_name(filename: str) -> bool:
+    """<32 Hex-Zeichen>.ttf?"""
+    stem, ext = os.path.splitext(filename)
+    return (
+        ext == ".ttf"
+        and len(stem) == HASH_LENGTH
+        and all(c in "0123456789abcdef" for c in stem)
+    )
+
+
+def download_name(build: FontBuild) -> str:
+    """Sprechender Dateiname eines Builds, z.B. "MyFont_de_svg_color.ttf"."""
+    rel = font_build_rel_path(
+        build.job,
+        build.language_id,
+        build.glyph_formattype,
+        color=build.style == FontBuild.FontBuildStyle.COLOR,
+    )
+    return os.path.basename(rel)
+
+
+def _canonicalize(ttf: Path) -> None:
+    font = TTFont(str(ttf), recalcTimestamp=False)
+    head = font["head"]
+    head.created = CANONICAL_TIMESTAMP
+    head.modified = CANONICAL_TIMESTAMP
+    if "FFTM" in font:
+        del font["FFTM"]
+    font.save(str(ttf), reorderTables=True)
+    font.close()
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@contextmanager
+def workspace(job: FontJob, filename: str, previous_rel_path: str | None = None) -> Iterator[Path]:
+    """
+    Liefert den Pfad, in den der Build schreibt. previous_rel_path (die
+    TTF des letzten erfolgreichen Builds) wird vorher dorthin kopiert,
+    damit build_font_incremental patchen kann. Das Verzeichnis wird
+    danach immer gelöscht – vorher commit() aufrufen.
+    """
+    root = build_dir(job)
+    root.mkdir(parents=True, exist_ok=True)
+    work_dir = Path(tempfile.mkdtemp(prefix=WORK_PREFIX, dir=root))
+    try:
+        work_ttf = work_dir / filename
+        if previous_rel_path:
+            previous = Path(settings.MEDIA_ROOT) / previous_rel_path
+            if previous.is_file():
+                shutil.copyfile(previous, work_ttf)
+        yield work_ttf
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def commit(job: FontJob, work_ttf: Path) -> str:
+    """
+    Neutralisiert Zeitstempel, hasht und verschiebt work_ttf in den Store.
+    Rückgabe: relativer Pfad (für FontBuild.ttf_path).
+    """
+    _canonicalize(work_ttf)
+    name = f"{_sha256(work_ttf)[:HASH_LENGTH]}.ttf"
+    target = build_dir(job) / name
+    if target.exists():
+        # gleicher Inhalt schon vorhanden (andere Sprache / unveränderter Build).
+        # mtime auffrischen: die Datei kann gerade unreferenziert sein (z.B.
+        # Glyphen auf einen älteren Stand zurückgesetzt), gc_beefont schont
+        # sie dann über die Schonfrist, bis die FontBuild-Zeile geschrieben ist
+        work_ttf.unlink()
+        os.utime(target)
+    else:
+        os.replace(work_ttf, target)
+    emit_web_fonts(target)  # no-op, wenn schon vorhanden
+    return os.path.join(job_sid_media(job), BUILD_DIRNAME, name)
+
+
+def save_build_result(
+    job: FontJob,
+    language,
+    formattype: str,
+    style: str,
+    *,
+    success: bool,
+    log: str,
+    ttf_path: str = "",
+    manifest: dict | None = None,
+) -> FontBuild:
+    """FontBuild-Zeile für (job, language, formattype, style) schreiben."""
+    if success:
+        defaults = {"ttf_path": ttf_path, "success": True, "log": log, "manifest": manifest or {}}
+    else:
+        # ohne vorherigen Build: leerer Pfad (keine Datei unter dem Download-Namen)
+        defaults = {"success": False, "log": log}
+    font_build, _created = FontBuild.objects.update_or_create(
+        job=job,
+        language=language,
+        glyph_formattype=formattype,
+        style=style,
+        defaults=defaults,
+    )
+    return font_build
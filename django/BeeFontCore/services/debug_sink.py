@@ -0,0 +1,108 @@
+# BeeFontCore/services/debug_sink.py
+#
+# Debug-Artefakte der Seitenanalyse (segment.py): Masken, Warp, Fiducials,
+# Schwellwerte. Was davon tatsächlich auf die Platte geht, steuert
+# BEEFONT_DEBUG_ARTIFACTS:
+#
+#   off      – nichts schreiben
+#   failure  – im Speicher puffern, erst kodieren/schreiben, wenn die
+#              Fiducial-Erkennung oder der Quad-Check fehlschlägt
+#              (oder die Analyse mit einer Exception abbricht)
+#   sampled  – pro Seite mit BEEFONT_DEBUG_SAMPLE_PERCENT % alles schreiben,
+#              sonst wie "failure"
+#   full     – alles sofort schreiben (altes Verhalten)
+#
+# Gepufferte Bilder werden nur referenziert, nicht kopiert: Aufrufer dürfen
+# ein übergebenes Array danach nicht mehr in-place verändern.
+
+import random
+from pathlib import Path
+
+import cv2
+import numpy as np
+from django.conf import settings
+
+
+DEBUG_OFF = "off"
+DEBUG_FAILURE = "failure"
+DEBUG_SAMPLED = "sampled"
+DEBUG_FULL = "full"
+
+DEBUG_MODES = (DEBUG_OFF, DEBUG_FAILURE, DEBUG_SAMPLED, DEBUG_FULL)
+
+
+def debug_mode() -> str:
+    mode = str(getattr(settings, "BEEFONT_DEBUG_ARTIFACTS", DEBUG_FAILURE)).lower()
+    if mode not in DEBUG_MODES:
+        raise RuntimeError(
+            f"unknown BEEFONT_DEBUG_ARTIFACTS={mode!r}, expected one of {', '.join(DEBUG_MODES)}"
+        )
+    return mode
+
+
+class DebugSink:
+    def __init__(self, dbg_dir: Path, mode: str):
+        self.dbg_dir = Path(dbg_dir)
+        self.mode = mode
+        self.failures: list[str] = []
+        self._pending: list[tuple[str, object]] = []
+        self._immediate = mode == DEBUG_FULL
+        self._dir_ready = False
+
+    @classmethod
+    def from_settings(cls, dbg_dir: Path | None) -> "DebugSink | None":
+        """None, wenn kein Verzeichnis angegeben ist oder der Modus "off" ist."""
+        if dbg_dir is None:
+            return None
+        mode = debug_mode()
+        if mode == DEBUG_OFF:
+            return None
+        if mode == DEBUG_SAMPLED:
+            percent = float(getattr(settings, "BEEFONT_DEBUG_SAMPLE_PERCENT", 10))
+            if random.random() * 100.0 < percent:
+                return cls(dbg_dir, DEBUG_FULL)
+            return cls(dbg_dir, DEBUG_FAILURE)
+        return cls(dbg_dir, mode)
+
+    # ----------------------------------------------------------------
+
+    def image(self, name: str, img: np.ndarray) -> None:
+        self._emit(name, img)
+
+    def text(self, name: str, content: str) -> None:
+        self._emit(name, content)
+
+    def fail(self, reason: str) -> None:
+        """
+        Markiert die Seite als fehlgeschlagen: gepufferte Artefakte werden
+        geschrieben, alles Weitere geht sofort auf die Platte.
+        """
+        self.failures.append(reason)
+        if not self._immediate:
+            self._immediate = True
+            pending, self._pending = self._pending, []
+            for name, payload in pending:
+                self._write(name, payload)
+        self._write("_debug_failure.txt", "\n".join(self.failures) + "\n")
+
+    def close(self) -> None:
+        """Ende der Analyse ohne Fehler: Puffer verwerfen."""
+        self._pending = []
+
+    # ----------------------------------------------------------------
+
+    def _emit(self, name: str, payload) -> None:
+        if self._immediate:
+            self._write(name, payload)
+        else:
+            self._pending.append((name, payload))
+
+    def _write(self, name: str, payload) -> None:
+        if not self._dir_ready:
+            self.dbg_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+        path = self.dbg_dir / name
+        if isinstance(payload, str):
+            path.write_text(payload, encoding="utf-8")
+        else:
+            cv2.imwrite(str(path), payload)
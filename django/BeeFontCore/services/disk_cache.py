@@ -0,0 +1,103 @@
+# BeeFontCore/services/disk_cache.py
+#
+# Kleiner Plattencache mit LRU-Eviction für abgeleitete Bilder
+# (Template-Bögen, Glyph-Thumbnails, Sprite-Sheets).
+#
+# Ablage: <root>/<kk>/<key>.<ext>, Schreiben atomar (tmp + os.replace),
+# Eviction über mtime (Treffer werden "angefasst"), Obergrenze max_bytes.
+# root=None schaltet den Cache ab (get → None, put → no-op).
+#
+# Keys müssen den Inhalt vollständig beschreiben (Hash über alle Eingaben),
+# invalidiert wird nie – alte Einträge fallen über die LRU heraus.
+
+import os
+import tempfile
+from pathlib import Path
+
+
+class DiskCache:
+    def __init__(self, root: Path | None, max_bytes: int):
+        self.root = Path(root) if root else None
+        self.max_bytes = max_bytes
+
+    @property
+    def enabled(self) -> bool:
+        return self.root is not None
+
+    def _path(self, key: str, ext: str) -> Path:
+        return self.root / key[:2] / f"{key}.{ext}"
+
+    def get_path(self, key: str, ext: str = "png") -> Path | None:
+        """Pfad des Eintrags oder None (und LRU-Zeitstempel setzen)."""
+        if not self.enabled:
+            return None
+        path = self._path(key, ext)
+        try:
+            os.utime(path)  # LRU: zuletzt benutzt
+        except FileNotFoundError:
+            return None
+        except OSError:
+            pass
+        return path
+
+    def get_bytes(self, key: str, ext: str = "png") -> bytes | None:
+        path = self.get_path(key, ext)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None  # zwischendurch evicted
+
+    def put(self, key: str, data: bytes, ext: str = "png", evict: bool = True) -> None:
+        """evict=False: mehrere Einträge am Stück schreiben, danach evict() aufrufen."""
+        if not self.enabled:
+            return
+        path = self._path(key, ext)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # atomar schreiben, parallele Requests sehen nie halbe Dateien
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        if evict:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Löscht die am längsten nicht benutzten Einträge, bis der Cache unter
+        max_bytes liegt. Rückgabe: Anzahl gelöschter Dateien.
+        """
+        if not self.enabled or not self.root.is_dir():
+            return 0
+
+        entries = []
+        total = 0
+        for path in self.root.glob("*/*"):
+            if path.suffix == ".tmp":
+                continue
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        removed = 0
+        for _mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
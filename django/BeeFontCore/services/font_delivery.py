@@ -0,0 +1,205 @@
+# BeeFontCore/services/font_delivery.py
+#
+# Auslieferung der TTF über download_ttf (öffentlich, @font-face / WP-Plugin).
+#
+# - "bester Build pro (Job, Sprache)" (Color vor Mono, dann neuester) wird
+#   im Django-Cache gehalten, Key enthält FontJob.builds_version → ein
+#   Treffer kostet nur die Versions-Abfrage und öffnet die Datei nicht
+#   (304 direkt aus ETag/Last-Modified)
+# - ETag: bei Store-Dateien (build_store) ist der Dateiname schon der
+#   Inhalts-Hash; ältere, sprechend benannte Builds bekommen einen Hash
+#   über Pfad + mtime + Größe
+# - Invalidierung über post_save/post_delete auf FontBuild (signals.py
+#   zählt builds_version in der DB hoch → gilt für alle Worker-Prozesse,
+#   auch mit prozesslokalem LocMemCache)
+# - WOFF2/WOFF (webfont): gleiche Auflösung, ETag = TTF-Hash + Format;
+#   negotiate_flavor() wählt das Format aus ?flavor= bzw. Accept
+# - parse_range(): einfache Byte-Ranges (ein Bereich) für 206-Antworten
+
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, IntegerField, When
+
+from ..models import FontBuild, FontJob
+from . import webfont
+from .build_store import download_name, is_store_name
+
+
+CACHE_TIMEOUT = 60 * 60
+
+# Rückgabe von parse_range, wenn der Bereich außerhalb der Datei liegt (→ 416)
+UNSATISFIABLE = "unsatisfiable"
+
+
+@dataclass(frozen=True)
+class ServedFont:
+    rel_path: str           # relativ zu MEDIA_ROOT
+    filename: str           # Download-Name
+    etag: str               # inkl. Anführungszeichen
+    last_modified: int      # epoch seconds
+    size: int
+    flavor: str = "ttf"     # "ttf" / "woff" / "woff2"
+
+    @property
+    def abs_path(self) -> Path:
+        return Path(settings.MEDIA_ROOT) / self.rel_path
+
+    @property
+    def content_type(self) -> str:
+        return webfont.CONTENT_TYPES[self.flavor]
+
+    @property
+    def content_hash(self) -> str:
+        return self.etag.strip('"')
+
+
+def _cache_key(sid: str, version: int, language_code: str, flavor: str) -> str:
+    return f"beefont:{flavor}:{sid}:{version}:{language_code}"
+
+
+def _builds_version(sid: str) -> int | None:
+    return FontJob.objects.filter(sid=sid).values_list("builds_version", flat=True).first()
+
+
+def invalidate(sid: str, language_code: str) -> None:
+    """Lokalen Cache-Eintrag verwerfen (z.B. Datei zwischen Auflösen und Öffnen weg)."""
+    version = _builds_version(sid)
+    if version is None:
+        return
+    cache.delete_many(
+        [_cache_key(sid, version, language_code, f) for f in ("ttf",) + webfont.FLAVORS]
+    )
+
+
+def negotiate_flavor(requested: str | None, accept: str, default: str = "ttf") -> str | None:
+    """
+    Ausgabeformat: explizit (?flavor=) oder aus dem Accept-Header
+    (font/woff2 vor font/woff), sonst default. None = angefordertes
+    Format nicht verfügbar.
+    """
+    available = ("ttf",) + webfont.available_flavors()
+    if requested:
+        return requested if requested in available else None
+    accepted = {part.split(";")[0].strip().lower() for part in accept.split(",")}
+    for flavor in webfont.available_flavors():
+        if webfont.CONTENT_TYPES[flavor] in accepted:
+            return flavor
+    return default if default in available else "ttf"
+
+
+def _etag_for(build: FontBuild, st: os.stat_result) -> str:
+    name = os.path.basename(build.ttf_path)
+    if is_store_name(name):
+        return f'"{os.path.splitext(name)[0]}"'
+    raw = f"{build.ttf_path}:{st.st_mtime_ns}:{st.st_size}"
+    return f'"{hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def resolve_font(sid: str, language_code: str, flavor: str = "ttf") -> ServedFont | None:
+    """Bester erfolgreicher Build mit vorhandener Datei (im Format flavor), oder None."""
+    version = _builds_version(sid)
+    if version is None:
+        return None
+    return _resolve(sid, version, language_code, flavor)
+
+
+def _resolve(sid: str, version: int, language_code: str, flavor: str) -> ServedFont | None:
+    key = _cache_key(sid, version, language_code, flavor)
+    served = cache.get(key)
+    if served is not None:
+        return served
+    if flavor != "ttf":
+        return _resolve_web_font(sid, version, language_code, flavor, key)
+
+    build = (
+        FontBuild.objects
+        .filter(job__sid=sid, language_id=language_code, success=True)
+        .select_related("job")
+        .order_by(
+            Case(
+                When(style=FontBuild.FontBuildStyle.COLOR, then=0),
+                default=1,
+                output_field=IntegerField(),
+            ),
+            "-created_at",
+        )
+        .first()
+    )
+    if build is None:
+        return None
+
+    try:
+        st = (Path(settings.MEDIA_ROOT) / build.ttf_path).stat()
+    except FileNotFoundError:
+        return None
+
+    served = ServedFont(
+        rel_path=build.ttf_path,
+        filename=download_name(build),
+        etag=_etag_for(build, st),
+        last_modified=int(st.st_mtime),
+        size=st.st_size,
+    )
+    cache.set(key, served, CACHE_TIMEOUT)
+    return served
+
+
+def _resolve_web_font(
+    sid: str, version: int, language_code: str, flavor: str, key: str
+) -> ServedFont | None:
+    ttf = _resolve(sid, version, language_code, "ttf")
+    if ttf is None:
+        return None
+    try:
+        path = webfont.ensure_flavor(ttf.abs_path, flavor)
+        st = path.stat()
+    except FileNotFoundError:
+        cache.delete(_cache_key(sid, version, language_code, "ttf"))
+        return None
+
+    served = ServedFont(
+        rel_path=os.path.relpath(path, settings.MEDIA_ROOT),
+        filename=os.path.splitext(ttf.filename)[0] + f".{flavor}",
+        etag=f'"{ttf.content_hash}-{flavor}"',
+        last_modified=int(st.st_mtime),
+        size=st.st_size,
+        flavor=flavor,
+    )
+    cache.set(key, served, CACHE_TIMEOUT)
+    return served
+
+
+def parse_range(header: str | None, size: int):
+    """
+    "bytes=a-b" / "bytes=a-" / "bytes=-n" → (start, end) inklusive,
+    UNSATISFIABLE oder None (kein/ungültiger/mehrteiliger Range → ganze Datei).
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, sep, last = header[len("bytes="):].strip().partition("-")
+    if not sep:
+        return None
+    if size <= 0:
+        return UNSATISFIABLE
+    try:
+        if first == "":
+            length = int(last)
+            if length <= 0:
+                return UNSATISFIABLE
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start < 0:
+        return None
+    if start >= size:
+        return UNSATISFIABLE
+    if end < start:
+        return None  # syntaktisch ungültig → ignorieren
+    return start, min(end, size - 1)
@@ -0,0 +1,85 @@
+# BeeFontCore/services/fontforge_server.py
+#
+# Läuft INNERHALB von FontForge (fontforge -lang=py -script fontforge_server.py),
+# wird also nie von Django importiert.
+#
+# Protokoll (eine JSON-Zeile pro Nachricht):
+#   stdin  ← {"id": 1, "script": "/tmp/.../build_font.py"}
+#   stdout → {"id": 1, "ok": true,  "stdout": "...", "stderr": "..."}
+#            {"id": 1, "ok": false, "stdout": "...", "stderr": "...", "error": "<traceback>"}
+# Beim Start wird einmal {"ready": true, "pid": ...} gesendet.
+# EOF auf stdin beendet den Server.
+
+import io
+import json
+import os
+import sys
+import traceback
+
+import fontforge
+
+# Protokoll-Kanal auf eigenen fd legen; alles, was FontForge (C-Code) oder
+# die Build-Scripts sonst nach fd 1 schreiben, landet auf stderr.
+_proto = os.fdopen(os.dup(1), "w", buffering=1, encoding="utf-8")
+os.dup2(2, 1)
+
+
+def _send(msg):
+    _proto.write(json.dumps(msg, ensure_ascii=False) + "\n")
+    _proto.flush()
+
+
+def _close_open_fonts():
+    # Build-Scripts rufen font.close() nicht auf → sonst wächst der Prozess
+    for f in list(fontforge.fonts()):
+        try:
+            f.close()
+        except Exception:
+            pass
+
+
+def _run_script(path):
+    out = io.StringIO()
+    err = io.StringIO()
+    old_out, old_err = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = out, err
+    ok = True
+    error = ""
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            code = compile(fh.read(), path, "exec")
+        exec(code, {"__name__": "__main__", "__file__": path})
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            ok = False
+            error = f"SystemExit({e.code!r})"
+    except BaseException:
+        ok = False
+        error = traceback.format_exc()
+    finally:
+        sys.stdout, sys.stderr = old_out, old_err
+        _close_open_fonts()
+    return ok, out.getvalue(), err.getvalue(), error
+
+
+def main():
+    _send({"ready": True, "pid": os.getpid()})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            req = json.loads(line)
+        except ValueError:
+            _send({"id": None, "ok": False, "error": f"invalid request: {line[:200]}"})
+            continue
+
+        ok, out, err, error = _run_script(req.get("script", ""))
+        msg = {"id": req.get("id"), "ok": ok, "stdout": out, "stderr": err}
+        if not ok:
+            msg["error"] = error
+        _send(msg)
+
+
+main()
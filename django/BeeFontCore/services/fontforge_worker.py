@@ -0,0 +1,277 @@
+# BeeFontCore/services/fontforge_worker.py
+#
+# Langlebige FontForge-Prozesse für die TTF-Builds.
+#
+# Statt pro Build `fontforge -lang=py -script <script>` neu zu starten
+# (Interpreter + Bibliotheken jedes Mal neu laden), hält jeder Django-Prozess
+# einen kleinen Pool von FontForge-Servern (fontforge_server.py) am Leben.
+# Die generierten Build-Scripts werden per JSON-Zeile über stdin übergeben.
+#
+# - Absturz eines Servers → wird beim nächsten Build neu gestartet
+# - Timeout pro Build → Prozess wird gekillt, Build schlägt fehl
+# - BEEFONT_FONTFORGE_PERSISTENT=0 → alter Weg (ein Prozess pro Build)
+
+import atexit
+import collections
+import json
+import os
+import queue
+import select
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+
+SERVER_SCRIPT = Path(__file__).with_name("fontforge_server.py")
+
+
+class FontForgeError(RuntimeError):
+    """Build-Script in FontForge fehlgeschlagen (Exception, Absturz oder Timeout)."""
+
+    def __init__(self, message: str, stdout: str = "", stderr: str = ""):
+        super().__init__(message)
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+def find_fontforge() -> str:
+    for name in ("fontforge", "fontforge-nox"):
+        path = shutil.which(name)
+        if path:
+            return path
+    raise RuntimeError("fontforge binary not found (install 'fontforge' in the django image)")
+
+
+def _persistent_enabled() -> bool:
+    return bool(getattr(settings, "BEEFONT_FONTFORGE_PERSISTENT", True))
+
+
+def _build_timeout() -> float:
+    return float(getattr(settings, "BEEFONT_FONTFORGE_TIMEOUT", 120))
+
+
+def _pool_size() -> int:
+    return max(1, int(getattr(settings, "BEEFONT_FONTFORGE_WORKERS", 1) or 1))
+
+
+def _max_builds_per_worker() -> int:
+    # FontForge gibt nicht jeden Speicher zurück → Prozess ab und zu recyceln
+    return int(getattr(settings, "BEEFONT_FONTFORGE_MAX_BUILDS", 200) or 0)
+
+
+class FontForgeWorker:
+    """
+    Ein FontForge-Serverprozess. Nicht thread-safe – der Pool gibt jeden
+    Worker immer nur an einen Build gleichzeitig heraus.
+    """
+
+    STARTUP_TIMEOUT = 30.0
+
+    def __init__(self, command: list[str] | None = None):
+        self._command = command
+        self._proc: subprocess.Popen | None = None
+        self._buf = b""
+        self._stderr_tail: collections.deque[str] = collections.deque(maxlen=200)
+        self._next_id = 0
+        self.builds = 0
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _start(self) -> None:
+        cmd = self._command or [find_fontforge(), "-lang=py", "-script", str(SERVER_SCRIPT)]
+        self._buf = b""
+        self._stderr_tail.clear()
+        self.builds = 0
+        self._proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+        )
+        # stderr laufend leeren, sonst blockiert FontForge bei vollem Pipe-Puffer
+        threading.Thread(
+            target=self._drain_stderr,
+            args=(self._proc.stderr, self._stderr_tail),
+            daemon=True,
+        ).start()
+
+        try:
+            hello = self._read_message(time.monotonic() + self.STARTUP_TIMEOUT)
+        except Exception as e:
+            self.stop()
+            raise FontForgeError(
+                f"fontforge worker did not start: {e}",
+                stderr="\n".join(self._stderr_tail),
+            )
+        if not hello.get("ready"):
+            self.stop()
+            raise FontForgeError(f"fontforge worker sent unexpected greeting: {hello!r}")
+
+    @staticmethod
+    def _drain_stderr(stream, tail) -> None:
+        for raw in iter(stream.readline, b""):
+            tail.append(raw.decode("utf-8", "replace").rstrip("\n"))
+
+    def _read_message(self, deadline: float) -> dict:
+        fd = self._proc.stdout.fileno()
+        while b"\n" not in self._buf:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("timed out waiting for fontforge")
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise EOFError("fontforge worker exited unexpectedly")
+            self._buf += chunk
+        line, _, self._buf = self._buf.partition(b"\n")
+        return json.loads(line.decode("utf-8"))
+
+    def run_script(self, script_path: Path, timeout: float) -> tuple[str, str]:
+        """
+        Führt ein Build-Script im Serverprozess aus.
+        Rückgabe: (stdout, stderr) des Scripts.
+        """
+        if not self.alive:
+            self._start()
+
+        self._next_id += 1
+        req_id = self._next_id
+        request = json.dumps({"id": req_id, "script": str(script_path)}) + "\n"
+
+        try:
+            self._proc.stdin.write(request.encode("utf-8"))
+            self._proc.stdin.flush()
+            reply = self._read_message(time.monotonic() + timeout)
+        except TimeoutError:
+            # hängendes Script → nicht auf sauberes Ende warten
+            self.stop(force=True)
+            raise FontForgeError(
+                f"fontforge build timed out after {timeout:.0f}s",
+                stderr="\n".join(self._stderr_tail),
+            )
+        except (EOFError, BrokenPipeError, ValueError) as e:
+            self.stop()
+            raise FontForgeError(
+                f"fontforge worker crashed: {e}",
+                stderr="\n".join(self._stderr_tail),
+            )
+
+        self.builds += 1
+        if reply.get("id") != req_id:
+            # Protokoll aus dem Tritt → lieber frisch starten
+            self.stop()
+            raise FontForgeError(f"fontforge worker answered out of order: {reply.get('id')!r}")
+
+        stdout = reply.get("stdout", "")
+        stderr = reply.get("stderr", "")
+        if not reply.get("ok"):
+            raise FontForgeError(reply.get("error", "fontforge build failed"), stdout, stderr)
+        return stdout, stderr
+
+    def stop(self, force: bool = False) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if force:
+                proc.kill()
+                proc.wait()
+            elif proc.poll() is None:
+                proc.stdin.close()
+                try:
+                    proc.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+        except Exception:
+            proc.kill()
+
+
+class FontForgePool:
+    """
+    Feste Anzahl Worker pro Django-Prozess. Ein Build blockiert, bis ein
+    Worker frei ist; Worker werden lazy gestartet.
+    """
+
+    def __init__(self, size: int, command: list[str] | None = None):
+        self.size = size
+        self._idle: queue.Queue[FontForgeWorker] = queue.Queue()
+        self._workers = [FontForgeWorker(command) for _ in range(size)]
+        for w in self._workers:
+            self._idle.put(w)
+
+    def run_script(self, script_path: Path, timeout: float) -> tuple[str, str]:
+        worker = self._idle.get()
+        try:
+            return worker.run_script(script_path, timeout)
+        finally:
+            max_builds = _max_builds_per_worker()
+            if max_builds and worker.builds >= max_builds:
+                worker.stop()
+            self._idle.put(worker)
+
+    def shutdown(self) -> None:
+        for w in self._workers:
+            w.stop()
+
+
+_pool: FontForgePool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> FontForgePool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = FontForgePool(_pool_size())
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def _as_text(data) -> str:
+    # TimeoutExpired liefert auch bei text=True Bytes
+    if isinstance(data, bytes):
+        return data.decode("utf-8", "ignore")
+    return data or ""
+
+
+def _run_oneshot(script_path: Path, timeout: float) -> tuple[str, str]:
+    ff = find_fontforge()
+    try:
+        proc = subprocess.run(
+            [ff, "-lang=py", "-script", str(script_path)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as e:
+        raise FontForgeError(
+            f"fontforge build timed out after {timeout:.0f}s",
+            stdout=_as_text(e.stdout),
+            stderr=_as_text(e.stderr),
+        )
+    if proc.returncode != 0:
+        raise FontForgeError(f"fontforge exited with {proc.returncode}", proc.stdout, proc.stderr)
+    return proc.stdout, proc.stderr
+
+
+def run_fontforge_script(script_path: Path, timeout: float | None = None) -> tuple[str, str]:
+    """
+    Einstiegspunkt für build_font: führt ein generiertes FontForge-Script aus.
+    Rückgabe: (stdout, stderr). Fehler → FontForgeError.
+    """
+    if timeout is None:
+        timeout = _build_timeout()
+    if _persistent_enabled():
+        return get_pool().run_script(Path(script_path), timeout)
+    return _run_oneshot(Path(script_path), timeout)
@@ -0,0 +1,200 @@
+# BeeFontCore/services/fonttools_builder.py
+#
+# TTF-Assemblierung direkt mit fontTools.fontBuilder (ohne FontForge).
+#
+# Eingabe sind GlyphOutlines aus trace.py (PNG-Glyphen direkt aus der Maske,
+# SVG-Glyphen über svg_raster → trace). Mono- und COLR/CPAL-Fonts entstehen
+# in einem Durchlauf im Speicher und werden einmal geschrieben.
+#
+# Metriken wie im FontForge-Script:
+#   - em = ascent 900 + descent 200, Quellraster-Höhe → em
+#   - Outline wird so verschoben, dass sie bei x = pad (50) beginnt
+#   - advance width = xMax + pad
+#   - Leerzeichen mit Breite 500
+
+from pathlib import Path
+
+from fontTools.agl import UV2AGL
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+from .trace import GlyphOutline
+
+
+ASCENT = 900
+DESCENT = 200
+UNITS_PER_EM = ASCENT + DESCENT
+SIDE_BEARING = 50
+SPACE_WIDTH = 500
+NOTDEF_WIDTH = 500
+
+
+def glyph_name_for(cp: int) -> str:
+    """AGL-Namen wie FontForge ('A', 'adieresis', 'germandbls'), sonst uniXXXX."""
+    name = UV2AGL.get(cp)
+    if name:
+        return name
+    return f"uni{cp:04X}" if cp <= 0xFFFF else f"u{cp:05X}"
+
+
+def _to_font_units(outline: GlyphOutline) -> list[list[tuple[int, int, bool]]]:
+    """Bildkoordinaten (y nach unten) → Font-Einheiten (y nach oben, Baseline 0)."""
+    scale = UNITS_PER_EM / float(outline.height)
+    return [
+        [(round(x * scale), round(ASCENT - y * scale), on) for x, y, on in contour]
+        for contour in outline.contours
+    ]
+
+
+def _x_bounds(contours) -> tuple[int, int] | None:
+    xs = [x for c in contours for x, _y, _on in c]
+    if not xs:
+        return None
+    return min(xs), max(xs)
+
+
+def _draw_contours(contours, dx: int):
+    pen = TTGlyphPen(None)
+    for contour in contours:
+        pts = [(x + dx, y, on) for x, y, on in contour]
+        start = next((i for i, p in enumerate(pts) if p[2]), None)
+
+        if start is None:
+            # reine Off-Curve-Kontur (TrueType erlaubt das)
+            pen.qCurveTo(*[(x, y) for x, y, _ in pts], None)
+            pen.closePath()
+            continue
+
+        pts = pts[start:] + pts[:start]
+        pen.moveTo(pts[0][:2])
+        offs: list[tuple[int, int]] = []
+        for x, y, on in pts[1:]:
+            if on:
+                if offs:
+                    pen.qCurveTo(*offs, (x, y))
+                    offs = []
+                else:
+                    pen.lineTo((x, y))
+            else:
+                offs.append((x, y))
+        if offs:
+            pen.qCurveTo(*offs, pts[0][:2])
+        pen.closePath()
+    return pen.glyph()
+
+
+class FontAssembler:
+    """
+    Sammelt Glyphen und schreibt die TTF mit einem einzigen save().
+
+    Basisglyphen bekommen AGL-Namen aus dem Codepoint; Layerglyphen für
+    COLR heißen "<basis>.<slot>" (wie im FontForge-COLOR-Build, damit
+    _apply_colr_cpal / inspect_font dieselben Namen sehen).
+    """
+
+    def __init__(self, family: str):
+        self.family = family
+        self._glyphs: dict[str, object] = {}
+        self._advances: dict[str, int] = {}
+        self._cmap: dict[int, str] = {}
+        self._color_layers: dict[str, list[tuple[str, int]]] = {}
+
+        empty = TTGlyphPen(None).glyph()
+        self._add(".notdef", empty, NOTDEF_WIDTH)
+
+    def _add(self, name: str, glyph, advance: int) -> None:
+        self._glyphs[name] = glyph
+        self._advances[name] = advance
+
+    def add_glyph(self, cp: int, outline: GlyphOutline) -> str:
+        name = glyph_name_for(cp)
+        contours = _to_font_units(outline)
+        bounds = _x_bounds(contours)
+        if bounds is None:
+            raise RuntimeError(f"glyph {name!r} has no outline")
+        dx = SIDE_BEARING - bounds[0]
+        self._add(name, _draw_contours(contours, dx), bounds[1] + dx + SIDE_BEARING)
+        self._cmap[cp] = name
+        return name
+
+    def add_color_glyph(self, cp: int, layers: list[tuple[str, int, GlyphOutline]]) -> str:
+        """
+        layers: [(slot, palette_index, outline), ...] in Zeichenreihenfolge.
+        Basisglyphe (Mono-Fallback) = erster Layer.
+
+        Alle Layer werden mit derselben Verschiebung platziert (gemeinsame
+        Bounding Box), damit primary/accent/secondary deckungsgleich bleiben.
+        """
+        if not layers:
+            raise RuntimeError(f"color glyph U+{cp:04X} has no layers")
+
+        name = glyph_name_for(cp)
+        converted = [(slot, idx, _to_font_units(outline)) for slot, idx, outline in layers]
+        bounds = _x_bounds([c for _slot, _idx, contours in converted for c in contours])
+        if bounds is None:
+            raise RuntimeError(f"glyph {name!r} has no outline")
+        dx = SIDE_BEARING - bounds[0]
+        advance = bounds[1] + dx + SIDE_BEARING
+
+        color_layers: list[tuple[str, int]] = []
+        for slot, idx, contours in converted:
+            layer_name = f"{name}.{slot}"
+            self._add(layer_name, _draw_contours(contours, dx), advance)
+            color_layers.append((layer_name, idx))
+
+        self._add(name, _draw_contours(converted[0][2], dx), advance)
+        self._cmap[cp] = name
+        self._color_layers[name] = color_layers
+        return name
+
+    def save(self, out_ttf: Path, palettes: list[list[tuple[float, float, float, float]]] | None = None) -> None:
+        if 32 not in self._cmap:
+            self._add("space", TTGlyphPen(None).glyph(), SPACE_WIDTH)
+            self._cmap[32] = "space"
+
+        # .notdef muss Glyphe 0 sein
+        order = [".notdef"] + [n for n in self._glyphs if n != ".notdef"]
+        ps_name = self.family.replace(" ", "")
+
+        fb = FontBuilder(UNITS_PER_EM, isTTF=True)
+        fb.setupGlyphOrder(order)
+        fb.setupCharacterMap(self._cmap)
+        fb.setupGlyf(self._glyphs)
+
+        # lsb = xMin der fertigen Glyphe (leere Glyphen: 0)
+        glyf = fb.font["glyf"]
+        metrics = {}
+        for name in order:
+            g = glyf[name]
+            metrics[name] = (self._advances[name], getattr(g, "xMin", 0) if g.numberOfContours else 0)
+        fb.setupHorizontalMetrics(metrics)
+
+        fb.setupHorizontalHeader(ascent=ASCENT, descent=-DESCENT)
+        fb.setupNameTable({
+            "familyName": self.family,
+            "styleName": "Regular",
+            "fullName": self.family,
+            "psName": ps_name,
+            "uniqueFontIdentifier": f"BeeFont: {ps_name}",
+        })
+        fb.setupOS2(
+            sTypoAscender=ASCENT,
+            sTypoDescender=-DESCENT,
+            sTypoLineGap=0,
+            usWinAscent=ASCENT,
+            usWinDescent=DESCENT,
+            usWeightClass=400,
+            usWidthClass=5,
+            fsType=0,
+            sFamilyClass=2057,
+            achVendID="BEE ",
+        )
+        fb.setupPost()
+
+        if self._color_layers:
+            fb.setupCOLR(self._color_layers, version=0)
+            fb.setupCPAL(palettes or [[(0.0, 0.0, 0.0, 1.0)]])
+
+        out_ttf = Path(out_ttf)
+        out_ttf.parent.mkdir(parents=True, exist_ok=True)
+        fb.save(str(out_ttf))
@@ -0,0 +1,81 @@
+# BeeFontCore/services/glyph_coverage.py
+#
+# Sprach-Abdeckung eines Jobs (welche Zeichen eines Alphabets haben schon
+# einen Default-Glyph?) für die Status-Endpunkte, build_ttf, build_ttf_color
+# und den Batch-Build.
+#
+# - Default-Buchstaben pro (Job, formattype) mit EINER Abfrage laden
+#   (values_list, keine Glyph-Objekte)
+# - fehlende Zeichen aller Sprachen per Mengenoperation auf dem
+#   vorab normalisierten Alphabet (services/alphabet.py)
+# - Ergebnis im Django-Cache, Key enthält FontJob.glyphs_version; jeder
+#   Glyph-Schreibzugriff ruft invalidate(job) auf → neuer Key, alte
+#   Einträge laufen einfach aus. Da der Job pro Request ohnehin geladen
+#   wird, kostet ein Treffer keine Glyph-Abfrage.
+
+from typing import Iterable
+
+from django.core.cache import cache
+from django.db.models import F
+
+from ..models import FontJob, Glyph, SupportedLanguage
+from .alphabet import alphabet_for, normalize_letter
+
+
+CACHE_TIMEOUT = 60 * 60
+FORMATTYPES = ("png", "svg")
+
+
+def _cache_key(job: FontJob, fmt: str) -> str:
+    return f"beefont:coverage:{job.pk}:{job.glyphs_version}:{fmt}"
+
+
+def invalidate(job: FontJob) -> None:
+    """Nach jedem Anlegen/Löschen/Default-Wechsel von Glyphen aufrufen."""
+    FontJob.objects.filter(pk=job.pk).update(glyphs_version=F("glyphs_version") + 1)
+    job.refresh_from_db(fields=["glyphs_version"])
+
+
+def default_letters(job: FontJob, fmt: str) -> frozenset[str]:
+    """Buchstaben (NFC) mit Default-Glyph für (job, fmt), gecacht."""
+    key = _cache_key(job, fmt)
+    letters = cache.get(key)
+    if letters is None:
+        letters = frozenset(
+            normalize_letter(letter)
+            for letter in Glyph.objects
+            .filter(job=job, is_default=True, formattype=fmt)
+            .values_list("letter", flat=True)
+        )
+        cache.set(key, letters, CACHE_TIMEOUT)
+    return letters
+
+
+def language_status(lang: SupportedLanguage, covered: frozenset[str]) -> dict:
+    """LanguageStatus-Payload (Reihenfolge der fehlenden Zeichen wie im Alphabet)."""
+    missing = alphabet_for(lang).missing(covered)
+    return {
+        "language": lang.code,
+        "ready": len(missing) == 0,
+        "required_chars": lang.alphabet or "",
+        "missing_chars": "".join(missing),
+        "missing_count": len(missing),
+    }
+
+
+def languages_status(
+    job: FontJob,
+    fmt: str,
+    languages: Iterable[SupportedLanguage] | None = None,
+) -> list[dict]:
+    """LanguageStatus für alle (oder die übergebenen) Sprachen."""
+    if languages is None:
+        languages = SupportedLanguage.objects.only("code", "alphabet")
+    covered = default_letters(job, fmt)
+    return [language_status(lang, covered) for lang in languages]
+
+
+def coverage_matrix(job: FontJob) -> dict[str, list[dict]]:
+    """{"png": [...], "svg": [...]} – Sprachen werden nur einmal geladen."""
+    languages = list(SupportedLanguage.objects.only("code", "alphabet"))
+    return {fmt: languages_status(job, fmt, languages) for fmt in FORMATTYPES}
@@ -0,0 +1,143 @@
+# BeeFontCore/services/glyph_ingest.py
+#
+# Neue Glyph-Varianten gesammelt anlegen (Seitenanalyse, ZIP-Import,
+# Einzel-Upload):
+#
+# - max(variant_index) + vorhandene Defaults pro (letter, formattype)
+#   mit EINER Aggregat-Abfrage laden
+# - Indizes im Speicher vergeben
+# - Dateien schreiben und alle Zeilen per bulk_create anlegen, beides in
+#   einer Transaktion (bei Fehlern werden geschriebene Dateien entfernt)
+# - Zielpfade über default_storage (safe_join: letter aus dem Request darf
+#   nicht aus MEDIA_ROOT heraus → SuspiciousFileOperation), Dateien werden
+#   exklusiv angelegt (O_EXCL): eine liegengebliebene Datei gleichen Namens
+#   wird nie überschrieben, sondern wie bei default_storage.save() ein
+#   freier Name gewählt
+#
+# Default-Regel (Constraint unique_default_glyph_per_job_letter_formattype):
+# die erste neue Variante eines (letter, formattype) wird Default, wenn es
+# dafür noch keinen Default gibt – unabhängig davon, ob ihr Index 0 ist.
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Count, Max, Q
+
+from ..models import FontJob, Glyph, JobPage
+from . import glyph_coverage
+from .job_paths import job_sid_media
+
+
+@dataclass
+class GlyphUpload:
+    letter: str
+    formattype: str          # GlyphFormatType: "png" / "svg"
+    data: bytes = b""
+    page: JobPage | None = None
+    cell_index: int = -1     # -1 = nicht an eine Scan-Zelle gebunden
+    # alternativ zu data: bereits geschriebene Datei (gleiches Dateisystem
+    # wie MEDIA_ROOT), wird per os.replace an ihren Platz verschoben
+    src_path: Path | None = None
+
+
+def glyph_rel_path(job: FontJob, letter: str, variant_index: int, formattype: str) -> str:
+    """z.B. "beefont/jobs/<sid>/glyphs/A_v3.png" """
+    return os.path.join(job_sid_media(job), "glyphs", f"{letter}_v{variant_index}.{formattype}")
+
+
+def _create_exclusive(rel_path: str) -> tuple[str, Path, int]:
+    """
+    Legt die Datei unter MEDIA_ROOT exklusiv an → (rel_path, abs_path, fd).
+    Raises SuspiciousFileOperation für Pfade außerhalb von MEDIA_ROOT.
+    """
+    while True:
+        abs_path = Path(default_storage.path(rel_path))
+        abs_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(abs_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            rel_path = default_storage.get_available_name(rel_path)
+            continue
+        return rel_path, abs_path, fd
+
+
+def _variant_state(job: FontJob) -> dict[tuple[str, str], list]:
+    """{(letter, formattype): [next_variant_index, has_default]} in einer Abfrage."""
+    rows = (
+        Glyph.objects
+        .filter(job=job)
+        .values("letter", "formattype")
+        .annotate(
+            max_idx=Max("variant_index"),
+            defaults=Count("id", filter=Q(is_default=True)),
+        )
+    )
+    return {
+        (row["letter"], row["formattype"]): [row["max_idx"] + 1, row["defaults"] > 0]
+        for row in rows
+    }
+
+
+def ingest_glyphs(job: FontJob, uploads: Iterable[GlyphUpload]) -> list[Glyph]:
+    """
+    Legt für alle uploads neue Glyph-Varianten an und gibt sie (gespeichert)
+    in Eingabereihenfolge zurück.
+    """
+    uploads = list(uploads)
+    if not uploads:
+        return []
+
+    written: list[Path] = []
+
+    try:
+        with transaction.atomic():
+            # Job-Zeile sperren: parallele Ingests desselben Jobs würden
+            # sonst dieselben variant_index vergeben
+            FontJob.objects.select_for_update().filter(pk=job.pk).first()
+
+            state = _variant_state(job)
+            glyphs: list[Glyph] = []
+
+            for up in uploads:
+                key = (up.letter, up.formattype)
+                next_idx, has_default = state.get(key, [0, False])
+                state[key] = [next_idx + 1, True]
+
+                rel_path, abs_path, fd = _create_exclusive(
+                    glyph_rel_path(job, up.letter, next_idx, up.formattype)
+                )
+                written.append(abs_path)
+                with os.fdopen(fd, "wb") as fh:
+                    if up.src_path is None:
+                        fh.write(up.data)
+                if up.src_path is not None:
+                    # ersetzt nur den gerade reservierten (leeren) Platzhalter
+                    os.replace(up.src_path, abs_path)
+
+                glyphs.append(
+                    Glyph(
+                        job=job,
+                        page=up.page,
+                        cell_index=up.cell_index,
+                        letter=up.letter,
+                        variant_index=next_idx,
+                        image_path=str(rel_path).replace("\\", "/"),
+                        is_default=not has_default,
+                        formattype=up.formattype,
+                    )
+                )
+
+            created = Glyph.objects.bulk_create(glyphs)
+            glyph_coverage.invalidate(job)
+            return created
+    except Exception:
+        for path in written:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        raise
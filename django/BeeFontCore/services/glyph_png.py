@@ -0,0 +1,150 @@
+# BeeFontCore/services/glyph_png.py
+#
+# Speicherformat der PNG-Glyphen unter beefont/jobs/<sid>/glyphs/.
+#
+# Die Seitenanalyse liefert reine Schwarz/Weiß-Masken → Default ist ein
+# 1-bit PNG (PIL-Modus "1", ~1/8 der Rohdaten von Graustufen, encodiert
+# schneller). BEEFONT_GLYPH_PNG_BILEVEL=0 schreibt wieder 8-bit Graustufen.
+#
+# Leser (trace.load_glyph_mask, potrace/convert, Browser) kommen mit beiden
+# Varianten zurecht: Schwelle 50 % ergibt dieselbe Maske.
+#
+# compact_png() / recompress_glyph_files() werden von
+# "manage.py recompress_glyphs" für bestehende Dateien benutzt und sind
+# verlustfrei: 1-bit nur, wenn das Bild wirklich nur aus Schwarz/Weiß
+# besteht, sonst Graustufen/optimiertes PNG.
+
+import io
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable
+
+import cv2
+import numpy as np
+from django.conf import settings
+from PIL import Image
+
+
+# RLE: Graustufen-Canvas ist fast nur Weiß → schneller und kleiner als Default-Deflate
+GRAY_PARAMS = [
+    cv2.IMWRITE_PNG_COMPRESSION, 6,
+    cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_RLE,
+]
+BILEVEL_PARAMS = [
+    cv2.IMWRITE_PNG_BILEVEL, 1,
+    cv2.IMWRITE_PNG_COMPRESSION, 6,
+]
+
+# Modi, die sich ohne Informationsverlust nach RGBA (8 bit) umwandeln lassen
+LOSSLESS_MODES = ("1", "L", "LA", "P", "RGB", "RGBA")
+
+
+def bilevel_enabled() -> bool:
+    return bool(getattr(settings, "BEEFONT_GLYPH_PNG_BILEVEL", True))
+
+
+def _encode(gray: np.ndarray, bilevel: bool) -> bytes:
+    ok, buf = cv2.imencode(".png", gray, BILEVEL_PARAMS if bilevel else GRAY_PARAMS)
+    if not ok:
+        raise RuntimeError("PNG encoding of glyph failed")
+    return buf.tobytes()
+
+
+def encode_glyph_png(canvas: np.ndarray) -> bytes:
+    """Normalisierte Glyph-Canvas (uint8, nur 0/255) → PNG-Bytes."""
+    return _encode(canvas, bilevel_enabled())
+
+
+def compact_png(data: bytes) -> bytes | None:
+    """
+    Verlustfrei kleinere Kodierung eines vorhandenen Glyph-PNGs, oder None
+    (nicht lesbar / schon kompakt).
+    """
+    try:
+        im = Image.open(io.BytesIO(data))
+        im.load()
+    except Exception:
+        return None
+    if im.mode not in LOSSLESS_MODES:
+        return None  # z.B. 16-bit: Umwandlung wäre verlustbehaftet
+
+    rgba = np.asarray(im.convert("RGBA"))
+    rgb, alpha = rgba[..., :3], rgba[..., 3]
+    gray = rgb[..., 0]
+    is_gray = bool((alpha == 255).all()) and bool((rgb == gray[..., None]).all())
+
+    candidates = []
+    if is_gray:
+        if bool(np.isin(gray, (0, 255)).all()):
+            candidates.append(_encode(np.ascontiguousarray(gray), bilevel=True))
+        candidates.append(_encode(np.ascontiguousarray(gray), bilevel=False))
+    else:
+        buf = io.BytesIO()
+        im.save(buf, format="PNG", optimize=True)
+        candidates.append(buf.getvalue())
+
+    best = min(candidates, key=len)
+    return best if len(best) < len(data) else None
+
+
+@dataclass
+class RecompressStats:
+    checked: int = 0
+    rewritten: int = 0
+    missing: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+def recompress_glyph_files(
+    image_paths: Iterable[str],
+    *,
+    dry_run: bool = False,
+    log: Callable[[str], None] | None = None,
+) -> RecompressStats:
+    """
+    Kodiert die PNG-Glyphen (relative Pfade unter MEDIA_ROOT) mit
+    compact_png neu und ersetzt sie atomar an Ort und Stelle.
+    """
+    media_root = Path(settings.MEDIA_ROOT)
+    stats = RecompressStats()
+    for rel in image_paths:
+        path = media_root / rel
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            stats.missing += 1
+            continue
+        stats.checked += 1
+        stats.bytes_before += len(data)
+
+        compact = compact_png(data)
+        if compact is None:
+            stats.bytes_after += len(data)
+            continue
+
+        stats.rewritten += 1
+        stats.bytes_after += len(compact)
+        if log:
+            log(f"{rel}: {len(data)} → {len(compact)} bytes")
+        if dry_run:
+            continue
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(compact)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    return stats
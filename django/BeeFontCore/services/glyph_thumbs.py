@@ -0,0 +1,217 @@
+# BeeFontCore/services/glyph_thumbs.py
+#
+# Verkleinerte Vorschaubilder der Glyph-Varianten für Grid-Ansichten
+# (statt der vollen 1024-px-PNGs / Roh-SVGs):
+#
+# - Thumbnail: eine Variante als quadratisches Graustufen-PNG in
+#   THUMB_SIZES (64/128/256), zentriert auf Weiß
+#     PNG → Alpha auf Weiß, INTER_AREA-Verkleinerung
+#     SVG → svg_raster (4x überabgetastet), dann INTER_AREA
+# - Sprite-Sheet: alle Default-Glyphen eines Jobs/Formattypes in einem
+#   Raster-PNG, dazu ein JSON-Atlas (Position pro Glyph)
+#
+# Keys (= ETags) hängen nur am Inhalt: sha256 der Glyph-Datei + Größe
+# (Sprite: Hash über die Liste der Glyph-Keys). Ersetzte oder gelöschte
+# Varianten ergeben neue Keys, nichts muss invalidiert werden.
+#
+# Ablage: MEDIA_ROOT/beefont/thumb_cache (disk_cache.DiskCache, LRU),
+# Obergrenze BEEFONT_THUMBNAIL_CACHE_MB, 0 schaltet den Cache ab.
+#
+# THUMB_VERSION erhöhen, wenn sich das Rendering sichtbar ändert.
+
+import hashlib
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+import numpy as np
+from django.conf import settings
+from PIL import Image
+
+from ..models import FontJob, Glyph
+from .disk_cache import DiskCache
+from .outline_cache import file_sha256
+from .svg_raster import rasterize_svg
+
+
+THUMB_VERSION = 1
+THUMB_SIZES = (64, 128, 256)
+CACHE_DIRNAME = "thumb_cache"
+SVG_SUPERSAMPLE = 4
+
+
+class ThumbnailCache(DiskCache):
+    @classmethod
+    def from_settings(cls) -> "ThumbnailCache":
+        max_mb = int(getattr(settings, "BEEFONT_THUMBNAIL_CACHE_MB", 64) or 0)
+        if max_mb <= 0:
+            return cls(None, 0)
+        root = Path(settings.MEDIA_ROOT) / "beefont" / CACHE_DIRNAME
+        return cls(root, max_mb * 1024 * 1024)
+
+
+def glyph_abs_path(glyph: Glyph) -> Path:
+    return Path(settings.MEDIA_ROOT) / glyph.image_path
+
+
+def thumb_key(glyph: Glyph, size: int) -> str:
+    """Raises FileNotFoundError, wenn die Glyph-Datei fehlt."""
+    return f"{file_sha256(glyph_abs_path(glyph))}-{glyph.formattype}-{size}-v{THUMB_VERSION}"
+
+
+# ---------------------------
+# Rendering
+# ---------------------------
+
+def _load_gray(path: Path, formattype: str, size: int) -> np.ndarray:
+    if formattype == "svg":
+        mask = rasterize_svg(path, size * SVG_SUPERSAMPLE)
+        return (255 - mask * 255).astype(np.uint8)
+
+    im = Image.open(path)
+    im.load()
+    if im.mode != "L":
+        # Transparenz auf Weiß legen (sonst wird transparent zu Schwarz)
+        rgba = im.convert("RGBA")
+        white = Image.new("RGBA", rgba.size, (255, 255, 255, 255))
+        im = Image.alpha_composite(white, rgba).convert("L")
+    return np.asarray(im)
+
+
+def _fit_square(gray: np.ndarray, size: int) -> np.ndarray:
+    canvas = np.full((size, size), 255, np.uint8)
+    h, w = gray.shape[:2]
+    if h == 0 or w == 0:
+        return canvas
+    scale = size / max(h, w)
+    nw, nh = max(1, round(w * scale)), max(1, round(h * scale))
+    interp = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+    small = cv2.resize(gray, (nw, nh), interpolation=interp)
+    y0, x0 = (size - nh) // 2, (size - nw) // 2
+    canvas[y0:y0 + nh, x0:x0 + nw] = small
+    return canvas
+
+
+def _encode_png(gray: np.ndarray) -> bytes:
+    ok, buf = cv2.imencode(".png", gray)
+    if not ok:
+        raise RuntimeError("PNG encoding of thumbnail failed")
+    return buf.tobytes()
+
+
+def render_thumbnail(path: Path, formattype: str, size: int) -> np.ndarray:
+    """Glyph-Datei → size x size Graustufen (uint8, Weiß = Hintergrund)."""
+    return _fit_square(_load_gray(path, formattype, size), size)
+
+
+def thumbnail_png(glyph: Glyph, size: int, key: str, cache: ThumbnailCache) -> bytes:
+    """PNG-Bytes des Thumbnails (aus dem Cache oder frisch gerendert)."""
+    data = cache.get_bytes(key)
+    if data is None:
+        data = _encode_png(render_thumbnail(glyph_abs_path(glyph), glyph.formattype, size))
+        cache.put(key, data)
+    return data
+
+
+# ---------------------------
+# Sprite-Sheet
+# ---------------------------
+
+@dataclass
+class SpriteEntry:
+    glyph: Glyph
+    thumb_key: str
+    x: int
+    y: int
+
+
+@dataclass
+class Sprite:
+    key: str
+    size: int
+    columns: int
+    rows: int
+    entries: list[SpriteEntry]
+
+    @property
+    def width(self) -> int:
+        return self.columns * self.size
+
+    @property
+    def height(self) -> int:
+        return self.rows * self.size
+
+    def atlas(self) -> dict:
+        return {
+            "size": self.size,
+            "columns": self.columns,
+            "rows": self.rows,
+            "width": self.width,
+            "height": self.height,
+            "glyphs": [
+                {
+                    "id": e.glyph.id,
+                    "letter": e.glyph.letter,
+                    "variant_index": e.glyph.variant_index,
+                    "x": e.x,
+                    "y": e.y,
+                    "w": self.size,
+                    "h": self.size,
+                }
+                for e in self.entries
+            ],
+        }
+
+
+def sprite_layout(job: FontJob, formattype: str, size: int) -> Sprite:
+    """
+    Default-Glyphen (nach Buchstabe sortiert) im Raster anordnen. Glyphen,
+    deren Datei fehlt, werden übersprungen.
+    """
+    glyphs = (
+        Glyph.objects
+        .filter(job=job, formattype=formattype, is_default=True)
+        .only("id", "letter", "variant_index", "image_path", "formattype")
+        .order_by("letter")
+    )
+    keyed = []
+    for g in glyphs:
+        try:
+            keyed.append((g, thumb_key(g, size)))
+        except FileNotFoundError:
+            continue
+
+    columns = math.ceil(math.sqrt(len(keyed)))
+    rows = math.ceil(len(keyed) / columns) if columns else 0
+    entries = [
+        SpriteEntry(glyph=g, thumb_key=k, x=(i % columns) * size, y=(i // columns) * size)
+        for i, (g, k) in enumerate(keyed)
+    ]
+
+    h = hashlib.sha256(f"sprite-v{THUMB_VERSION}-{size}-{columns}".encode())
+    for e in entries:
+        h.update(f"\n{e.glyph.id}:{e.glyph.letter}:{e.thumb_key}".encode("utf-8"))
+    return Sprite(key=h.hexdigest(), size=size, columns=columns, rows=rows, entries=entries)
+
+
+def sprite_png(sprite: Sprite, cache: ThumbnailCache) -> bytes:
+    """Sprite-Sheet als PNG (aus dem Cache oder aus den Thumbnails zusammengesetzt)."""
+    data = cache.get_bytes(sprite.key)
+    if data is not None:
+        return data
+
+    sheet = np.full((sprite.height, sprite.width), 255, np.uint8)
+    s = sprite.size
+    for e in sprite.entries:
+        cached = cache.get_bytes(e.thumb_key)
+        if cached is not None:
+            thumb = cv2.imdecode(np.frombuffer(cached, np.uint8), cv2.IMREAD_GRAYSCALE)
+        else:
+            thumb = render_thumbnail(glyph_abs_path(e.glyph), e.glyph.formattype, s)
+            cache.put(e.thumb_key, _encode_png(thumb), evict=False)
+        sheet[e.y:e.y + s, e.x:e.x + s] = thumb
+
+    data = _encode_png(sheet)
+    cache.put(sprite.key, data)
+    return data
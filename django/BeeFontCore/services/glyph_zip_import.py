@@ -0,0 +1,227 @@
+# BeeFontCore/services/glyph_zip_import.py
+#
+# ZIP-Import von Glyph-Dateien (upload_glyphs_zip) mit begrenztem Speicher:
+#
+# - das ZIP wird direkt aus der hochgeladenen (Temp-)Datei gelesen
+# - jedes Member wird blockweise in eine Staging-Datei entpackt, nie
+#   komplett in den Speicher; das Staging-Verzeichnis (.zipimport-*) liegt
+#   im Job-Verzeichnis neben glyphs/ (gc_beefont räumt Reste auf)
+# - Obergrenzen pro Member, gesamt und für die Anzahl (ZIP-Bomben):
+#   gezählt werden die tatsächlich entpackten Bytes, nicht die Angaben
+#   im ZIP-Header
+# - PNG/SVG werden anhand der ersten Bytes geprüft
+# - Anlage der Glyphen in Batches über glyph_ingest (eine Transaktion
+#   pro Batch); Fehler werden geloggt und im Ergebnis (errors) gemeldet
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from django.conf import settings
+
+from ..models import FontJob
+from .glyph_ingest import GlyphUpload, ingest_glyphs
+from .job_paths import job_sid_media
+
+
+logger = logging.getLogger(__name__)
+
+STAGING_PREFIX = ".zipimport-"
+CHUNK_SIZE = 64 * 1024
+INGEST_BATCH_SIZE = 200
+HEADER_PROBE_BYTES = 4096
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Obergrenze für ZipImportResult.errors (Antwortgröße)
+MAX_REPORTED_ERRORS = 20
+
+
+class ZipImportError(ValueError):
+    """ZIP nicht lesbar oder Grenzwert überschritten."""
+
+
+class _MemberTooLarge(Exception):
+    pass
+
+
+@dataclass
+class ZipImportResult:
+    imported: int = 0
+    skipped_non_matching_ext: int = 0
+    skipped_empty_letter: int = 0
+    skipped_invalid: int = 0
+    skipped_too_large: int = 0
+    skipped_errors: int = 0
+    truncated: bool = False
+    bytes_in: int = 0
+    bytes_extracted: int = 0
+    seconds: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    def error(self, message: str) -> None:
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        seconds = max(self.seconds, 1e-6)
+        data["seconds"] = round(self.seconds, 3)
+        data["files_per_second"] = round(self.imported / seconds, 1)
+        data["mb_per_second"] = round(self.bytes_extracted / seconds / (1024 * 1024), 2)
+        return data
+
+
+def _limits() -> tuple[int, int, int]:
+    mb = 1024 * 1024
+    max_member = int(float(getattr(settings, "BEEFONT_ZIP_IMPORT_MAX_MEMBER_MB", 5)) * mb)
+    max_total = int(float(getattr(settings, "BEEFONT_ZIP_IMPORT_MAX_TOTAL_MB", 500)) * mb)
+    max_members = int(getattr(settings, "BEEFONT_ZIP_IMPORT_MAX_MEMBERS", 5000))
+    return max_member, max_total, max_members
+
+
+def header_ok(fmt: str, head: bytes) -> bool:
+    """Billige Formatprüfung anhand der ersten Bytes."""
+    if fmt == "png":
+        return head.startswith(PNG_SIGNATURE)
+    if fmt == "svg":
+        return b"<svg" in head.lower()
+    return False
+
+
+def letter_from_name(base: str) -> str:
+    """"A.png" / "A_v3.png" / "A_foo.png" → "A" """
+    stem, _ext = os.path.splitext(base)
+    if "_" in stem:
+        stem = stem.split("_", 1)[0]
+    return stem.strip()
+
+
+def _extract_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo, dest: Path, limit: int) -> tuple[int, bytes]:
+    """
+    Entpackt ein Member blockweise nach dest, bricht ab, sobald mehr als
+    limit Bytes herauskommen. Rückgabe: (Größe, erste Bytes).
+    """
+    size = 0
+    head = b""
+    with zf.open(info) as src, open(dest, "wb") as out:
+        while True:
+            chunk = src.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > limit:
+                raise _MemberTooLarge()
+            if len(head) < HEADER_PROBE_BYTES:
+                head += chunk[: HEADER_PROBE_BYTES - len(head)]
+            out.write(chunk)
+    return size, head
+
+
+def import_glyph_zip(job: FontJob, fmt: str, upload) -> ZipImportResult:
+    """
+    upload: Django UploadedFile (oder beliebiges seekbares file-like).
+    Raises ZipImportError, wenn das Archiv nicht lesbar ist.
+    """
+    max_member, max_total, max_members = _limits()
+    result = ZipImportResult(bytes_in=int(getattr(upload, "size", 0) or 0))
+    t0 = time.perf_counter()
+
+    source = upload.temporary_file_path() if hasattr(upload, "temporary_file_path") else upload
+    try:
+        zf = zipfile.ZipFile(source)
+    except (zipfile.BadZipFile, OSError) as e:
+        raise ZipImportError("Invalid ZIP archive.") from e
+
+    job_abs_dir = Path(settings.MEDIA_ROOT) / job_sid_media(job)
+    (job_abs_dir / "glyphs").mkdir(parents=True, exist_ok=True)
+    # Staging im selben Dateisystem → os.replace beim Ingest ist atomar
+    staging = Path(tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=job_abs_dir))
+
+    expected_ext = f".{fmt}"
+    batch: list[GlyphUpload] = []
+    members = 0
+
+    def flush() -> None:
+        if not batch:
+            return
+        try:
+            result.imported += len(ingest_glyphs(job, batch))
+        except Exception as e:
+            logger.exception(
+                "import_glyph_zip: batch of %d glyphs failed (job %s)", len(batch), job.sid
+            )
+            result.skipped_errors += len(batch)
+            result.error(f"batch of {len(batch)} glyphs failed: {type(e).__name__}: {e}")
+        batch.clear()
+
+    try:
+        with zf:
+            for info in zf.infolist():
+                if info.is_dir():
+                    continue
+
+                base = os.path.basename(info.filename)
+                if not base:
+                    continue
+
+                if not base.lower().endswith(expected_ext):
+                    result.skipped_non_matching_ext += 1
+                    continue
+
+                letter = letter_from_name(base)
+                if not letter:
+                    result.skipped_empty_letter += 1
+                    continue
+
+                members += 1
+                if members > max_members:
+                    result.truncated = True
+                    break
+
+                # Header-Angabe vorab (billig), echte Größe beim Entpacken
+                if info.file_size > max_member:
+                    result.skipped_too_large += 1
+                    continue
+
+                remaining = max_total - result.bytes_extracted
+                dest = staging / f"{members}{expected_ext}"
+                try:
+                    size, head = _extract_member(zf, info, dest, min(max_member, remaining))
+                except _MemberTooLarge:
+                    dest.unlink(missing_ok=True)
+                    if remaining < max_member:
+                        result.truncated = True
+                        break
+                    result.skipped_too_large += 1
+                    continue
+                except (zipfile.BadZipFile, OSError, EOFError, RuntimeError, NotImplementedError) as e:
+                    # kaputtes Member, verschlüsselt, unbekannte Kompression …
+                    dest.unlink(missing_ok=True)
+                    result.skipped_errors += 1
+                    result.error(f"{info.filename}: {type(e).__name__}: {e}")
+                    continue
+
+                result.bytes_extracted += size
+
+                if not header_ok(fmt, head):
+                    dest.unlink(missing_ok=True)
+                    result.skipped_invalid += 1
+                    continue
+
+                # no JobPage, not bound to a scan cell
+                batch.append(GlyphUpload(letter=letter, formattype=fmt, src_path=dest))
+                if len(batch) >= INGEST_BATCH_SIZE:
+                    flush()
+
+        flush()
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    result.seconds = time.perf_counter() - t0
+    return result
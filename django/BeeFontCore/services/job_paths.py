@@ -0,0 +1,20 @@
+# BeeFontCore/services/job_paths.py
+
+import os
+
+from ..models import FontJob
+
+
+def job_sid_media(job: FontJob) -> str:
+    """Relative media root of a job: "beefont/jobs/<sid>"."""
+    return os.path.join("beefont", "jobs", job.sid)
+
+
+def font_build_rel_path(job: FontJob, language_code: str, formattype: str, color: bool = False) -> str:
+    """
+    Relative path of a built TTF, e.g.
+    "beefont/jobs/<sid>/build/MyFont_de_png.ttf" or "..._de_svg_color.ttf".
+    """
+    suffix = "_color" if color else ""
+    filename = f"{job.name}_{language_code}_{formattype}{suffix}.ttf".replace(" ", "_")
+    return os.path.join(job_sid_media(job), "build", filename)
@@ -0,0 +1,180 @@
+# BeeFontCore/services/media_gc.py
+#
+# Aufräumen unter MEDIA_ROOT/beefont/jobs (manage.py gc_beefont).
+#
+# EIN os.walk über alle Job-Verzeichnisse, Referenzen vorher mit je einer
+# values_list-Abfrage aus der DB:
+#
+#   <sid>/              Job existiert nicht mehr        → alles löschen
+#   <sid>/build/        Datei nicht in FontBuild.ttf_path (alte sprechende
+#                       Namen, ersetzte Hash-Dateien, liegengebliebene
+#                       .work-*-Verzeichnisse)     → löschen
+#                       (.woff/.woff2 zählen wie die TTF daneben)
+#   <sid>/glyphs/       Datei nicht in Glyph.image_path → löschen
+#   <sid>/.zipimport-*/ Staging eines abgebrochenen ZIP-Imports → löschen
+#   <sid>/debug/        älter als debug_days            → löschen
+#   <sid>/cache/, pages/  nicht angefasst (OutlineCache hat eigene LRU)
+#
+# Alles mit einer Schonfrist (grace_hours, mtime): Dateien eines gerade
+# laufenden Builds/Imports sind noch nicht in der DB eingetragen.
+
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from django.conf import settings
+
+from ..models import FontBuild, FontJob, Glyph
+from .build_store import BUILD_DIRNAME
+from .glyph_zip_import import STAGING_PREFIX
+from .webfont import FLAVORS
+
+
+JOBS_REL = os.path.join("beefont", "jobs")
+
+
+@dataclass
+class GcStats:
+    dry_run: bool = False
+    files: dict[str, int] = field(default_factory=dict)
+    bytes: dict[str, int] = field(default_factory=dict)
+
+    def add(self, category: str, size: int) -> None:
+        self.files[category] = self.files.get(category, 0) + 1
+        self.bytes[category] = self.bytes.get(category, 0) + size
+
+    @property
+    def total_files(self) -> int:
+        return sum(self.files.values())
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.bytes.values())
+
+
+def _norm(rel: str) -> str:
+    return os.path.normpath(rel.replace("\\", "/"))
+
+
+def _referenced_paths() -> tuple[set[str], set[str]]:
+    builds = set()
+    for p in FontBuild.objects.exclude(ttf_path="").values_list("ttf_path", flat=True):
+        ttf = _norm(p)
+        builds.add(ttf)
+        stem = os.path.splitext(ttf)[0]
+        builds.update(f"{stem}.{flavor}" for flavor in FLAVORS)
+    glyphs = {
+        _norm(p) for p in Glyph.objects.exclude(image_path="").values_list("image_path", flat=True)
+    }
+    return builds, glyphs
+
+
+def collect_garbage(
+    *,
+    debug_days: float | None = None,
+    grace_hours: float = 1.0,
+    dry_run: bool = False,
+    log: Callable[[str], None] | None = None,
+) -> GcStats:
+    """
+    Löscht nicht mehr referenzierte Build-TTFs, verwaiste Glyph-Dateien,
+    alte Debug-Ausgaben und Verzeichnisse gelöschter Jobs.
+    """
+    if debug_days is None:
+        debug_days = float(getattr(settings, "BEEFONT_DEBUG_RETENTION_DAYS", 7))
+
+    media_root = Path(settings.MEDIA_ROOT)
+    jobs_root = media_root / JOBS_REL
+    stats = GcStats(dry_run=dry_run)
+    if not jobs_root.is_dir():
+        return stats
+
+    now = time.time()
+    grace_cutoff = now - grace_hours * 3600
+    debug_cutoff = now - debug_days * 86400
+
+    sids = set(FontJob.objects.values_list("sid", flat=True))
+    build_refs, glyph_refs = _referenced_paths()
+
+    def remove(path: Path, category: str, size: int) -> None:
+        stats.add(category, size)
+        if log:
+            log(f"{'[dry-run] ' if dry_run else ''}{category}: {path.relative_to(media_root)}")
+        if not dry_run:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    # Verzeichnisse, die nach dem Walk leer sein können (bottom-up rmdir)
+    prune_dirs: list[Path] = []
+
+    for dirpath, dirnames, filenames in os.walk(jobs_root):
+        current = Path(dirpath)
+        parts = current.relative_to(jobs_root).parts
+
+        if not parts:
+            # Ebene der Job-Verzeichnisse: gelöschte Jobs komplett entfernen
+            for sid in list(dirnames):
+                if sid in sids:
+                    continue
+                job_dir = current / sid
+                if job_dir.stat().st_mtime >= grace_cutoff:
+                    continue
+                size = sum(
+                    f.stat().st_size for f in job_dir.rglob("*") if f.is_file()
+                )
+                stats.add("job", size)
+                if log:
+                    log(f"{'[dry-run] ' if dry_run else ''}job: {job_dir.relative_to(media_root)}")
+                if not dry_run:
+                    shutil.rmtree(job_dir, ignore_errors=True)
+                dirnames.remove(sid)
+            continue
+
+        area = parts[1] if len(parts) > 1 else None
+        if area is None:
+            # <sid>/: nur in die bekannten Bereiche absteigen
+            dirnames[:] = [
+                d for d in dirnames
+                if d in (BUILD_DIRNAME, "glyphs", "debug") or d.startswith(STAGING_PREFIX)
+            ]
+            continue
+
+        staging = area.startswith(STAGING_PREFIX)
+        if len(parts) > 2 or (staging and current.stat().st_mtime < grace_cutoff):
+            prune_dirs.append(current)
+
+        for name in filenames:
+            path = current / name
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            rel = os.path.normpath(os.path.relpath(path, media_root))
+
+            if area == "debug":
+                if st.st_mtime < debug_cutoff:
+                    remove(path, "debug", st.st_size)
+            elif st.st_mtime >= grace_cutoff:
+                continue
+            elif area == BUILD_DIRNAME:
+                if rel not in build_refs:
+                    remove(path, "build", st.st_size)
+            elif area == "glyphs":
+                if rel not in glyph_refs:
+                    remove(path, "glyphs", st.st_size)
+            elif staging:
+                remove(path, "staging", st.st_size)
+
+    if not dry_run:
+        for d in reversed(prune_dirs):
+            try:
+                d.rmdir()  # nur wenn leer
+            except OSError:
+                pass
+
+    return stats
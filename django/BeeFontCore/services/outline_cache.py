@@ -0,0 +1,158 @@
+# BeeFontCore/services/outline_cache.py
+#
+# Inhaltsadressierter Cache für Build-Zwischenergebnisse pro Job:
+#   - PNG → SVG (potrace / opencv)
+#   - PNG/SVG → GlyphOutline (fontTools-Builder)
+#   - SVG → Slot-SVGs (Color-Build)
+#
+# Key = sha256(Art + Parameter + Bytes der Quelldatei). Unveränderte Glyphen
+# kosten damit beim nächsten Build (andere Sprache, ein Buchstabe geändert)
+# nur noch einen Hash + Dateizugriff.
+#
+# Ablage: MEDIA_ROOT/beefont/jobs/<sid>/cache/<kk>/<key>.<ext>
+# Eviction: LRU über mtime (Treffer werden "angefasst"), Obergrenze
+# BEEFONT_OUTLINE_CACHE_MB pro Job. 0 schaltet den Cache ab.
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from django.conf import settings
+
+from .job_paths import job_sid_media
+
+
+CACHE_DIRNAME = "cache"
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class OutlineCache:
+    def __init__(self, root: Path | None, max_bytes: int):
+        self.root = Path(root) if root else None
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_job(cls, job) -> "OutlineCache":
+        max_mb = int(getattr(settings, "BEEFONT_OUTLINE_CACHE_MB", 64) or 0)
+        if max_mb <= 0:
+            return cls(None, 0)
+        root = Path(settings.MEDIA_ROOT) / job_sid_media(job) / CACHE_DIRNAME
+        return cls(root, max_mb * 1024 * 1024)
+
+    @property
+    def enabled(self) -> bool:
+        return self.root is not None
+
+    @staticmethod
+    def key(kind: str, src: Path, params: dict | None = None) -> str:
+        h = hashlib.sha256()
+        h.update(kind.encode("utf-8"))
+        h.update(b"\0")
+        h.update(json.dumps(params or {}, sort_keys=True).encode("utf-8"))
+        h.update(b"\0")
+        with open(src, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 16), b""):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def _path(self, key: str, ext: str) -> Path:
+        return self.root / key[:2] / f"{key}.{ext}"
+
+    def get(self, key: str, ext: str) -> bytes | None:
+        if not self.enabled:
+            return None
+        path = self._path(key, ext)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)  # LRU: zuletzt benutzt
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, ext: str, data: bytes) -> None:
+        if not self.enabled:
+            return
+        path = self._path(key, ext)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # atomar schreiben, parallele Builds sehen nie halbe Dateien
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def cached(self, kind: str, src: Path, params: dict | None, ext: str, compute) -> bytes:
+        """
+        Liefert das Artefakt für (kind, src, params) aus dem Cache oder
+        berechnet es mit compute() -> bytes und legt es ab.
+        """
+        if not self.enabled:
+            return compute()
+
+        key = self.key(kind, src, params)
+        data = self.get(key, ext)
+        if data is not None:
+            with self._lock:
+                self.hits += 1
+            return data
+
+        data = compute()
+        self.put(key, ext, data)
+        with self._lock:
+            self.misses += 1
+        return data
+
+    def evict(self) -> int:
+        """
+        Löscht die am längsten nicht benutzten Einträge, bis der Cache
+        unter max_bytes liegt. Rückgabe: Anzahl gelöschter Dateien.
+        """
+        if not self.enabled or not self.root.is_dir():
+            return 0
+
+        entries = []
+        total = 0
+        for path in self.root.glob("*/*"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        removed = 0
+        for _mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def summary(self) -> str:
+        return f"cache: {self.hits} hits, {self.misses} misses"
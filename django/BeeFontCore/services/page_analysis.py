@@ -0,0 +1,120 @@
+# BeeFontCore/services/page_analysis.py
+#
+# Kernlogik der Seitenanalyse (Scan → Glyph-Varianten).
+# Wird vom Analyse-Worker (analysis_queue) aufgerufen; die Views
+# legen nur noch Tasks an.
+
+from pathlib import Path
+from typing import Callable
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
+
+from ..models import FontJob, JobPage, GlyphFormatType
+from . import template_utils
+from .glyph_ingest import GlyphUpload, ingest_glyphs
+from .job_paths import job_sid_media
+from .segment import analyse_job_page_scan
+
+
+ProgressCallback = Callable[[int, str], None]
+
+
+def _noop_progress(percent: int, message: str) -> None:
+    pass
+
+
+def resolve_page_paths(job: FontJob, page: JobPage) -> tuple[Path, Path]:
+    """
+    Absoluter Scan-Pfad und Debug-Verzeichnis einer Seite.
+    Raises ValueError (kein Scan) / FileNotFoundError (Datei fehlt).
+    """
+    if not page.scan_image_path:
+        raise ValueError("Für diese Seite ist noch kein Scan hochgeladen.")
+
+    media_root = Path(settings.MEDIA_ROOT)
+
+    scan_path = Path(page.scan_image_path)
+    if not scan_path.is_absolute():
+        abs_scan_path = media_root / scan_path
+    else:
+        abs_scan_path = scan_path
+
+    if not abs_scan_path.exists():
+        raise FileNotFoundError(f"Scan-Datei nicht gefunden: {abs_scan_path}")
+
+    # Debug directory for this page: media/beefont/jobs/<sid>/debug/page_<n>
+    dbg_dir = media_root / job_sid_media(job) / "debug" / f"page_{page.page_index}"
+    return abs_scan_path, dbg_dir
+
+
+def segment_page_to_png(
+    abs_scan_path: str,
+    tpl: dict,
+    letters: str,
+    dbg_dir: str | None,
+) -> list[tuple[int, str, bytes]]:
+    """
+    Segmentierung ohne DB-Zugriff, für Pool-Prozesse: liefert die
+    normalisierten Glyphen als PNG-Bytes (klein und picklebar).
+    """
+    return analyse_job_page_scan(
+        abs_scan_path=Path(abs_scan_path),
+        tpl=tpl,
+        letters=letters or "",
+        dbg_dir=Path(dbg_dir) if dbg_dir else None,
+    )
+
+
+def page_glyph_uploads(page: JobPage, cells: list[tuple[int, str, bytes]]) -> list[GlyphUpload]:
+    """Ergebnis von segment_page_to_png → PNG-Glyph-Uploads dieser Seite."""
+    return [
+        GlyphUpload(
+            letter=letter,
+            formattype=GlyphFormatType.PNG,
+            data=png,
+            page=page,
+            cell_index=cell_index,
+        )
+        for cell_index, letter, png in cells
+    ]
+
+
+def run_page_analysis(
+    job: FontJob,
+    page: JobPage,
+    progress: ProgressCallback | None = None,
+) -> dict:
+    """
+    Core analysis logic for a JobPage.
+    Returns a plain dict payload, raises exceptions on fatal errors.
+
+    `progress(percent, message)` is called at the main milestones
+    (segmentation, glyph storage) so a worker can report status.
+    """
+    progress = progress or _noop_progress
+
+    abs_scan_path, dbg_dir = resolve_page_paths(job, page)
+
+    # Template config from DB
+    template = page.template
+    tpl = template_utils.template_to_config(template)
+
+    # Segmentation
+    progress(10, "Segmentierung läuft")
+    cells = segment_page_to_png(str(abs_scan_path), tpl, page.letters or "", str(dbg_dir))
+    progress(60, f"{len(cells)} Zellen erkannt")
+
+    # no canonical <LETTER>.png anymore
+    with transaction.atomic():
+        created = ingest_glyphs(job, page_glyph_uploads(page, cells))
+        page.analysed_at = now()
+        page.save(update_fields=["analysed_at"])
+    glyphs_created = len(created)
+    progress(99, f"{glyphs_created} Glyphen gespeichert")
+
+    return {
+        "detail": "Analyse abgeschlossen.",
+        "glyph_variants_created": glyphs_created,
+    }
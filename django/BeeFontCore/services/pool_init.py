@@ -0,0 +1,17 @@
+# BeeFontCore/services/pool_init.py
+#
+# Initializer für "spawn"-Prozess-Pools (beefont_worker).
+#
+# Bewusst ohne Django-/Model-Importe auf Modulebene: das Kind muss dieses
+# Modul entpicklen, BEVOR django.setup() gelaufen ist. Liegt der
+# Initializer in einem Modul, das Models importiert (analysis_queue),
+# scheitert schon der Import mit AppRegistryNotReady und der Pool ist
+# sofort kaputt.
+
+
+def init_django() -> None:
+    # "spawn"-Kinder starten mit leerem Interpreter → Django neu aufsetzen
+    # (DJANGO_SETTINGS_MODULE ist aus der Umgebung des Workers geerbt)
+    import django
+
+    django.setup()
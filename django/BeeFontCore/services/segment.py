@@ -7,18 +7,25 @@
 #     * abs_scan_path (Pfad zur PNG)
 #     * tpl (Template-Config aus TemplateDefinition -> template_to_config)
 #     * letters (String "ABC...")
-#     * dbg_dir (Debugverzeichnis)
-# - gibt pro nicht-leerer Zelle (cell_index, letter, Image) zurück
-
+#     * dbg_dir (Debugverzeichnis, Umfang siehe debug_sink.py)
+# - gibt pro nicht-leerer Zelle (cell_index, letter, PNG-Bytes) zurück
+# - leere Zellen werden über ein Integralbild in einem Schritt aussortiert,
+#   Zuschnitt/Normalisierung/PNG-Encode der übrigen Zellen laufen in einem
+#   Thread-Pool (OpenCV und der PNG-Encoder geben das GIL frei)
+# - Canvas-Größe/Rand kommen aus dem Template, Speicherformat (1-bit PNG)
+#   aus glyph_png.py
+
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Tuple
 
 import cv2
 import numpy as np
-from PIL import Image
-
 from django.conf import settings
 
+from .debug_sink import DebugSink
+from .glyph_png import encode_glyph_png
 from .template_utils import (
     template_raster_size,
     grid_cells_px,
@@ -30,7 +37,7 @@ from .template_utils import (
 # Low-level image helpers
 # ---------------------------
 
-def _remove_small_components(mask01: np.ndarray, min_area: int, dbg_dir: Path | None = None) -> np.ndarray:
+def _remove_small_components(mask01: np.ndarray, min_area: int, dbg: DebugSink | None = None) -> np.ndarray:
     """
     Remove tiny connected components (noise) from a 0/1 mask.
     min_area is in pixels (component area threshold).
@@ -43,37 +50,34 @@ def _remove_small_components(mask01: np.ndarray, min_area: int, dbg_dir: Path |
     H, W = mask_u8.shape[:2]
     num_labels, labels, stats, centroids = cv2.connectedComponentsWithStats(mask_u8, connectivity=8)
 
-    cleaned = np.zeros_like(mask_u8, dtype=np.uint8)
-    removed = 0
-    kept = 0
+    # Lookup-Tabelle pro Label statt einem Bilddurchlauf pro Komponente:
+    # keep[label] = 1, wenn die Fläche reicht; Label 0 (Hintergrund) bleibt 0.
+    keep = (stats[:, cv2.CC_STAT_AREA] >= min_area).astype(np.uint8)
+    keep[0] = 0
+    cleaned = keep[labels]
 
-    for label in range(1, num_labels):
-        area = stats[label, cv2.CC_STAT_AREA]
-        if area >= min_area:
-            cleaned[labels == label] = 1
-            kept += 1
-        else:
-            removed += 1
+    kept = int(keep.sum())
+    removed = (num_labels - 1) - kept
 
-    if dbg_dir is not None:
-        (dbg_dir / "_debug_cc_cleaning.txt").write_text(
+    if dbg is not None:
+        dbg.text(
+            "_debug_cc_cleaning.txt",
             f"H={H} W={W}\n"
             f"num_labels={num_labels}\n"
             f"min_area={min_area}\n"
             f"kept_components={kept}\n"
             f"removed_components={removed}\n",
-            encoding="utf-8"
         )
-        cv2.imwrite(str(dbg_dir / "_debug_binarize_mask01_before_cc.png"), mask01 * 255)
-        cv2.imwrite(str(dbg_dir / "_debug_binarize_mask01_after_cc.png"), cleaned * 255)
+        dbg.image("_debug_binarize_mask01_before_cc.png", mask01 * 255)
+        dbg.image("_debug_binarize_mask01_after_cc.png", cleaned * 255)
 
     return cleaned
 
 
-def _find_fiducials_from_mask(mask01: np.ndarray, dbg_dir: Path | None = None):
+def _find_fiducials_from_mask(mask01: np.ndarray, dbg: DebugSink | None = None):
     """
     Detect 4 square-like fiducials near the page corners, using a 0/1 mask.
-    Returns (points, dbg) with points in TL, TR, BR, BL order.
+    Returns (points, overlay) with points in TL, TR, BR, BL order.
     """
     if mask01.dtype != np.uint8:
         mask_u8 = (mask01 > 0).astype(np.uint8) * 255
@@ -82,8 +86,8 @@ def _find_fiducials_from_mask(mask01: np.ndarray, dbg_dir: Path | None = None):
 
     H, W = mask_u8.shape[:2]
 
-    if dbg_dir is not None:
-        cv2.imwrite(str(dbg_dir / "_fid_mask.png"), mask_u8)
+    if dbg is not None:
+        dbg.image("_fid_mask.png", mask_u8)
 
     cnts, _ = cv2.findContours(mask_u8, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     if not cnts:
@@ -111,10 +115,10 @@ def _find_fiducials_from_mask(mask01: np.ndarray, dbg_dir: Path | None = None):
         cand.append((cx, cy, w, h, idx))
 
     if len(cand) < 4:
-        if dbg_dir is not None:
-            (dbg_dir / "_fid_debug_counts.txt").write_text(
+        if dbg is not None:
+            dbg.text(
+                "_fid_debug_counts.txt",
                 f"[MASK FID] contours={len(cnts)}, candidates={len(cand)}",
-                encoding="utf-8"
             )
         return None
 
@@ -166,7 +170,7 @@ def _find_fiducials_from_mask(mask01: np.ndarray, dbg_dir: Path | None = None):
     ]
 
     # debug overlay on mask itself
-    dbg = np.dstack([mask_u8] * 3)
+    overlay = np.dstack([mask_u8] * 3)
     colors = {
         "TL": (0, 255, 0),
         "TR": (255, 0, 0),
@@ -175,82 +179,93 @@ def _find_fiducials_from_mask(mask01: np.ndarray, dbg_dir: Path | None = None):
     }
     for label, (cx, cy) in zip(("TL", "TR", "BR", "BL"), points):
         cx_i, cy_i = int(cx), int(cy)
-        cv2.circle(dbg, (cx_i, cy_i), 8, colors[label], -1)
+        cv2.circle(overlay, (cx_i, cy_i), 8, colors[label], -1)
         cv2.putText(
-            dbg, label, (cx_i + 10, cy_i - 10),
+            overlay, label, (cx_i + 10, cy_i - 10),
             cv2.FONT_HERSHEY_SIMPLEX, 0.7, colors[label], 2, cv2.LINE_AA
         )
 
-    if dbg_dir is not None:
-        cv2.imwrite(str(dbg_dir / "_debug_fiducials_on_mask.png"), dbg)
+    if dbg is not None:
+        dbg.image("_debug_fiducials_on_mask.png", overlay)
 
-    return points, dbg
+    return points, overlay
 
 
-def _binarize(img: np.ndarray, dbg_dir: Path | None = None) -> np.ndarray:
+def _hist_percentile(hist: np.ndarray, q: float) -> float:
     """
-    Returns mask01 with ink=1, bg=0.
-    Tuned for pencil/pen on paper with uneven illumination.
+    Perzentil (wie np.percentile, lineare Interpolation) aus einem
+    256-Bin-Histogramm eines uint8-Bildes – ohne float-Kopie aller Pixel.
     """
-    bgr = img
-    gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
-
-    if dbg_dir is not None:
-        cv2.imwrite(str(dbg_dir / "_debug_binarize_gray.png"), gray)
-
-    gray_blur = cv2.GaussianBlur(gray, (3, 3), 0)
-
-    if dbg_dir is not None:
-        cv2.imwrite(str(dbg_dir / "_debug_binarize_gray_blur.png"), gray_blur)
+    n = int(hist.sum())
+    if n == 0:
+        return 0.0
+    cdf = np.cumsum(hist)
+    rank = (q / 100.0) * (n - 1)
+    lo = int(np.floor(rank))
+    hi = int(np.ceil(rank))
+    # k-tes Element (0-basiert) = kleinster Wert v mit cdf[v] > k
+    v_lo = int(np.searchsorted(cdf, lo, side="right"))
+    v_hi = int(np.searchsorted(cdf, hi, side="right"))
+    return v_lo + (v_hi - v_lo) * (rank - lo)
+
+
+def _estimate_threshold(gray_blur: np.ndarray, dbg: DebugSink | None = None) -> float:
+    """
+    Global threshold for ink (pixel <= T) on a blurred uint8 gray image.
+    Histogram-based, with Otsu fallback if the ink ratio looks insane.
+    """
+    hist = np.bincount(gray_blur.ravel(), minlength=256)
+    cdf = np.cumsum(hist)
+    n = max(int(cdf[-1]), 1)
 
-    gb_flat = gray_blur.astype(np.float32).ravel()
+    def ink_ratio_for(t: float) -> float:
+        # THRESH_BINARY_INV: ink where pixel <= t
+        return float(cdf[int(np.clip(np.floor(t), 0, 255))]) / n
 
     # histogram-based threshold
     darkpercentile = 2
     bgpercentile = 50
-    dark = np.percentile(gb_flat, darkpercentile)
-    bg = np.percentile(gb_flat, bgpercentile)
+    dark = _hist_percentile(hist, darkpercentile)
+    bg = _hist_percentile(hist, bgpercentile)
 
     alpha = 0.4
     T = dark + alpha * (bg - dark)
     T = float(np.clip(T, 0, 255))
 
-    if dbg_dir is not None:
-        (dbg_dir / "_debug_binarize_thresholds_initial.txt").write_text(
+    if dbg is not None:
+        dbg.text(
+            "_debug_binarize_thresholds_initial.txt",
             f"dark={dark:.2f}\n"
             f"bg={bg:.2f}\n"
             f"darkpercentile={darkpercentile:.2f}\n"
             f"bgpercentile={bgpercentile:.2f}\n"
             f"alpha={alpha:.2f}\n"
             f"T_initial={T:.2f}\n",
-            encoding="utf-8"
         )
 
-    _, thr = cv2.threshold(gray_blur, T, 255, cv2.THRESH_BINARY_INV)
-    ink_ratio = float((thr > 0).mean())
+    ink_ratio = ink_ratio_for(T)
 
-    if dbg_dir is not None:
-        (dbg_dir / "_debug_binarize_thresholds_ratio.txt").write_text(
+    if dbg is not None:
+        dbg.text(
+            "_debug_binarize_thresholds_ratio.txt",
             f"T_used={T:.2f}\n"
             f"ink_ratio_candidate1={ink_ratio:.4f}\n",
-            encoding="utf-8"
         )
-        cv2.imwrite(str(dbg_dir / "_debug_binarize_thr_raw.png"), thr)
 
     # sanity check: fallback to Otsu if insane
     if ink_ratio < 0.005 or ink_ratio > 0.7:
-        _, thr_otsu = cv2.threshold(
+        T_otsu, _ = cv2.threshold(
             gray_blur, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU
         )
-        ink_ratio_otsu = float((thr_otsu > 0).mean())
+        ink_ratio_otsu = ink_ratio_for(T_otsu)
 
-        if dbg_dir is not None:
-            (dbg_dir / "_debug_binarize_thresholds_otsu.txt").write_text(
+        if dbg is not None:
+            dbg.text(
+                "_debug_binarize_thresholds_otsu.txt",
+                f"T_otsu={T_otsu:.2f}\n"
                 f"ink_ratio_candidate1={ink_ratio:.4f}\n"
                 f"ink_ratio_otsu={ink_ratio_otsu:.4f}\n",
-                encoding="utf-8"
             )
-            cv2.imwrite(str(dbg_dir / "_debug_binarize_thr_otsu.png"), thr_otsu)
 
         target_low, target_high = 0.01, 0.4
 
@@ -265,19 +280,44 @@ def _binarize(img: np.ndarray, dbg_dir: Path | None = None) -> np.ndarray:
         d2 = dist_to_range(ink_ratio_otsu, target_low, target_high)
 
         if d2 < d1:
-            thr = thr_otsu
-            ink_ratio = ink_ratio_otsu
+            T = float(T_otsu)
+
+    return T
+
+
+def _binarize(img: np.ndarray, dbg: DebugSink | None = None, T: float | None = None) -> np.ndarray:
+    """
+    Returns mask01 with ink=1, bg=0.
+    Tuned for pencil/pen on paper with uneven illumination.
 
-    if dbg_dir is not None:
-        cv2.imwrite(str(dbg_dir / "_debug_binarize_thr_chosen.png"), thr)
+    img may be BGR or gray. T is the global threshold; if None it is
+    estimated on this image (see _estimate_threshold).
+    """
+    gray = img if img.ndim == 2 else cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+
+    if dbg is not None:
+        dbg.image("_debug_binarize_gray.png", gray)
+
+    gray_blur = cv2.GaussianBlur(gray, (3, 3), 0)
+
+    if dbg is not None:
+        dbg.image("_debug_binarize_gray_blur.png", gray_blur)
+
+    if T is None:
+        T = _estimate_threshold(gray_blur, dbg=dbg)
+
+    _, thr = cv2.threshold(gray_blur, T, 255, cv2.THRESH_BINARY_INV)
+
+    if dbg is not None:
+        dbg.image("_debug_binarize_thr_chosen.png", thr)
 
     k = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
     thr_open = cv2.morphologyEx(thr, cv2.MORPH_OPEN, k, iterations=1)
     thr_close = cv2.morphologyEx(thr_open, cv2.MORPH_CLOSE, k, iterations=1)
 
-    if dbg_dir is not None:
-        cv2.imwrite(str(dbg_dir / "_debug_binarize_thr_open.png"), thr_open)
-        cv2.imwrite(str(dbg_dir / "_debug_binarize_thr_close.png"), thr_close)
+    if dbg is not None:
+        dbg.image("_debug_binarize_thr_open.png", thr_open)
+        dbg.image("_debug_binarize_thr_close.png", thr_close)
 
     mask01 = (thr_close > 0).astype(np.uint8)
 
@@ -285,38 +325,50 @@ def _binarize(img: np.ndarray, dbg_dir: Path | None = None) -> np.ndarray:
     min_area_cc = max(8, int(0.000001 * (H * W)))
     min_area_cc = min(min_area_cc, 200)
 
-    mask01_clean = _remove_small_components(mask01, min_area_cc, dbg_dir=dbg_dir)
+    mask01_clean = _remove_small_components(mask01, min_area_cc, dbg=dbg)
 
-    if dbg_dir is not None:
-        cv2.imwrite(str(dbg_dir / "_debug_binarize_mask01.png"), mask01 * 255)
-        cv2.imwrite(str(dbg_dir / "_debug_binarize_mask01_clean.png"), mask01_clean * 255)
-        (dbg_dir / "_debug_binarize_meta.txt").write_text(
+    if dbg is not None:
+        dbg.image("_debug_binarize_mask01.png", mask01 * 255)
+        dbg.image("_debug_binarize_mask01_clean.png", mask01_clean * 255)
+        dbg.text(
+            "_debug_binarize_meta.txt",
             f"H={H} W={W}\n"
+            f"T={T:.2f}\n"
             f"ink_ratio_final={(mask01_clean > 0).mean():.4f}\n"
             f"min_area_cc={min_area_cc}\n",
-            encoding="utf-8"
         )
 
     return mask01_clean
 
 
+def _pyramid_down(gray: np.ndarray, max_side: int) -> np.ndarray:
+    """Halbiert per cv2.pyrDown, bis die längere Seite <= max_side ist."""
+    small = gray
+    while max(small.shape[:2]) > max_side and min(small.shape[:2]) > 1:
+        small = cv2.pyrDown(small)
+    return small
+
+
 def _tight_crop(mask: np.ndarray, pad: int = 6) -> np.ndarray:
-    ys, xs = np.where(mask > 0)
-    if len(xs) == 0 or len(ys) == 0:
+    # Zeilen/Spalten-Projektion statt np.where über alle Pixel
+    ys = np.flatnonzero(mask.any(axis=1))
+    if len(ys) == 0:
         return mask  # empty
-    y0, y1 = max(0, ys.min() - pad), min(mask.shape[0] - 1, ys.max() + pad)
-    x0, x1 = max(0, xs.min() - pad), min(mask.shape[1] - 1, xs.max() + pad)
+    xs = np.flatnonzero(mask.any(axis=0))
+    y0, y1 = max(0, ys[0] - pad), min(mask.shape[0] - 1, ys[-1] + pad)
+    x0, x1 = max(0, xs[0] - pad), min(mask.shape[1] - 1, xs[-1] + pad)
     return mask[y0:y1+1, x0:x1+1]
 
 
-def _place_on_canvas(mask01: np.ndarray, size: int = 1024, margin: int = 96) -> Image.Image:
+def _place_on_canvas(mask01: np.ndarray, size: int = 1024, margin: int = 96) -> np.ndarray:
     """
-    mask01: 1=ink (black), 0=bg (white). Center into a square canvas.
+    mask01: 1=ink (black), 0=bg (white). Center into a square canvas
+    (uint8 Graustufen, 0=ink, 255=bg).
     """
     h, w = mask01.shape[:2]
     canvas = np.full((size, size), 255, np.uint8)  # white
-    if h == 0 or w == 0 or mask01.sum() == 0:
-        return Image.fromarray(canvas)
+    if h == 0 or w == 0 or not mask01.any():
+        return canvas
 
     scale = (size - 2 * margin) / max(h, w)
     nh, nw = max(1, int(h * scale)), max(1, int(w * scale))
@@ -325,7 +377,128 @@ def _place_on_canvas(mask01: np.ndarray, size: int = 1024, margin: int = 96) ->
     glyph = 255 - glyph  # 0=ink, 255=bg
     roi = canvas[y0:y0+nh, x0:x0+nw]
     canvas[y0:y0+nh, x0:x0+nw] = np.minimum(roi, glyph)
-    return Image.fromarray(canvas)
+    return canvas
+
+
+# ---------------------------
+# Zellen → Glyph-PNGs
+# ---------------------------
+
+MIN_CELL_INK = 50
+# Defaults, pro Template überschreibbar (TemplateDefinition.glyph_canvas_px/glyph_margin_px)
+GLYPH_CANVAS_SIZE = 1024
+GLYPH_CANVAS_MARGIN = 96
+
+
+def _cell_worker_count() -> int:
+    configured = int(getattr(settings, "BEEFONT_CELL_WORKERS", 0) or 0)
+    if configured > 0:
+        return configured
+    # Seiten laufen bereits parallel (ein Prozess pro Analyse-Worker) →
+    # die CPUs auf die Worker aufteilen statt cores² Threads zu starten.
+    # Mindestens 2: Zuschnitt/PNG-Encode geben den GIL frei, ein zweiter
+    # Thread überbrückt die Python-Anteile, auch wenn jeder Kern einen
+    # Worker hat (Default).
+    # Lazy-Import: analysis_queue importiert page_analysis → segment.
+    from .analysis_queue import analysis_worker_count
+
+    return max(2, (os.cpu_count() or 1) // analysis_worker_count())
+
+
+def _cell_inner_box(
+    box: tuple[int, int, int, int], H: int, W: int
+) -> tuple[int, int, int, int, int, int]:
+    """
+    Zelle (y0, y1, x0, x1) → absoluter Innenbereich ohne Gridlinien
+    (iy0, iy1, ix0, ix1) und Größe der Index-Ecke (idx_h, idx_w),
+    am Bildrand wie Numpy-Slicing geclippt.
+    """
+    y0, y1, x0, x1 = box
+    ch, cw = y1 - y0, x1 - x0
+    iy0, iy1 = min(y0, H), min(y1, H)
+    ix0, ix1 = min(x0, W), min(x1, W)
+
+    # Gridlinien trimmen
+    border = max(2, min(ch, cw) // 50)
+    if ch > 2 * border and cw > 2 * border:
+        ah, aw = iy1 - iy0, ix1 - ix0
+        iy0, iy1 = iy0 + min(border, ah), iy0 + max(min(ch - border, ah), min(border, ah))
+        ix0, ix1 = ix0 + min(border, aw), ix0 + max(min(cw - border, aw), min(border, aw))
+        ch, cw = iy1 - iy0, ix1 - ix0
+
+    # Index-Ecke (~20 %)
+    idx_h = max(8, ch // 5)
+    idx_w = max(8, cw // 5)
+    return iy0, iy1, ix0, ix1, idx_h, idx_w
+
+
+def _cells_with_ink(mask01: np.ndarray, inner: np.ndarray) -> np.ndarray:
+    """
+    Tinte pro Zelle (ohne Index-Ecke) für alle Zellen auf einmal über das
+    Integralbild. inner: (n, 6) aus _cell_inner_box.
+    """
+    ii = cv2.integral(mask01, sdepth=cv2.CV_32S)
+    iy0, iy1, ix0, ix1, idx_h, idx_w = inner.T
+    cy1 = np.minimum(iy0 + idx_h, iy1)
+    cx1 = np.minimum(ix0 + idx_w, ix1)
+
+    def rect(ya, yb, xa, xb):
+        return ii[yb, xb] - ii[ya, xb] - ii[yb, xa] + ii[ya, xa]
+
+    return rect(iy0, iy1, ix0, ix1) - rect(iy0, cy1, ix0, cx1)
+
+
+def _extract_cell_png(mask01: np.ndarray, inner: tuple, size: int, margin: int) -> bytes | None:
+    """Innenbereich ausschneiden, Index-Ecke löschen, normalisieren, PNG-kodieren."""
+    iy0, iy1, ix0, ix1, idx_h, idx_w = inner
+    cell = mask01[iy0:iy1, ix0:ix1].copy()
+    cell[:idx_h, :idx_w] = 0
+
+    cropped = _tight_crop(cell)
+    if not cropped.any():
+        return None
+
+    canvas = _place_on_canvas(cropped, size=size, margin=margin)
+    return encode_glyph_png(canvas)
+
+
+def extract_cells(
+    mask01: np.ndarray,
+    cells: list[tuple[int, int, int, int]],
+    letters: str,
+    canvas_size: int = GLYPH_CANVAS_SIZE,
+    canvas_margin: int = GLYPH_CANVAS_MARGIN,
+) -> list[tuple[int, str, bytes]]:
+    """
+    Alle Zellen einer (entzerrten) Maske → [(cell_index, letter, PNG-Bytes)]
+    für jede Zelle mit genug Tinte, in Zellreihenfolge. Format der PNGs:
+    glyph_png.encode_glyph_png.
+    """
+    n = min(len(cells), len(letters))
+    if n == 0:
+        return []
+
+    H, W = mask01.shape[:2]
+    inner = np.array([_cell_inner_box(cells[i], H, W) for i in range(n)], dtype=np.int64)
+    ink = _cells_with_ink(mask01, inner)
+    todo = [i for i in range(n) if letters[i] and ink[i] >= MIN_CELL_INK]
+    if not todo:
+        return []
+
+    # Rand darf die Glyphe nicht auf 0 px schrumpfen lassen
+    canvas_margin = max(0, min(canvas_margin, (canvas_size - 1) // 2))
+
+    def extract(i: int) -> bytes | None:
+        return _extract_cell_png(mask01, tuple(inner[i]), canvas_size, canvas_margin)
+
+    workers = min(len(todo), _cell_worker_count())
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pngs = list(pool.map(extract, todo))
+    else:
+        pngs = [extract(i) for i in todo]
+
+    return [(i, letters[i], png) for i, png in zip(todo, pngs) if png is not None]
 
 
 def _quad_ok_for_template(fid_pts, Wt, Ht) -> bool:
@@ -373,8 +546,8 @@ def analyse_job_page_scan(
     abs_scan_path: Path,
     tpl: dict,
     letters: str,
-    dbg_dir: Path,
-) -> list[tuple[int, str, Image.Image]]:
+    dbg_dir: Path | None,
+) -> list[tuple[int, str, bytes]]:
     """
     V3-Helfer: analysiert einen einzelnen Scan für eine JobPage.
 
@@ -382,40 +555,68 @@ def analyse_job_page_scan(
       abs_scan_path : absoluter Pfad zur Scan-Datei
       tpl           : Template-Config (aus TemplateDefinition → template_to_config)
       letters       : String mit Buchstaben für diese Seite (z.B. "ABC...")
-      dbg_dir       : Verzeichnis für Debug-Ausgaben
+      dbg_dir       : Verzeichnis für Debug-Ausgaben (None = keine);
+                      was geschrieben wird, regelt BEEFONT_DEBUG_ARTIFACTS
 
     Rückgabe:
-      Liste von (cell_index, letter, PIL.Image.Image),
-      wobei das Image bereits auf 1024x1024 Canvas normalisiert ist.
+      Liste von (cell_index, letter, PNG-Bytes), Glyph bereits auf
+      quadratischen Canvas normalisiert (Default 1024x1024, 1-bit).
     """
     if not abs_scan_path.exists():
         raise RuntimeError(f"scan file not found: {abs_scan_path}")
 
-    dbg_dir.mkdir(parents=True, exist_ok=True)
+    dbg = DebugSink.from_settings(dbg_dir)
+    try:
+        results = _analyse_scan(abs_scan_path, tpl, letters, dbg)
+    except Exception as e:
+        if dbg is not None:
+            dbg.fail(f"exception: {e}")
+        raise
+    if dbg is not None:
+        dbg.close()
+    return results
+
 
-    # Scan laden
+def _analyse_scan(
+    abs_scan_path: Path,
+    tpl: dict,
+    letters: str,
+    dbg: DebugSink | None,
+) -> list[tuple[int, str, bytes]]:
+    # Scan laden (nur Graustufen: halber/drittel Speicher gegenüber BGR)
     file_bytes = np.fromfile(str(abs_scan_path), dtype=np.uint8)
-    img = cv2.imdecode(file_bytes, cv2.IMREAD_COLOR)
-    if img is None:
+    gray = cv2.imdecode(file_bytes, cv2.IMREAD_GRAYSCALE)
+    if gray is None:
         raise RuntimeError(f"Could not read scan: {abs_scan_path}")
 
     # Rastergröße laut Template
     Wt, Ht = template_raster_size(tpl, dpi=DPI_DEFAULT)
 
-    # 1) global binarisieren
-    full_mask_raw = _binarize(img, dbg_dir=dbg_dir)
-    cv2.imwrite(str(dbg_dir / "_debug_mask_prewarp.png"), (full_mask_raw * 255).astype(np.uint8))
+    # 1) Erkennung auf verkleinerter Kopie (Bildpyramide):
+    #    Schwellwert + Maske + Fiducials. Größenkriterien der Fiducials
+    #    sind relativ zur Bildgröße, funktionieren also auf jeder Stufe.
+    max_side = int(getattr(settings, "BEEFONT_ANALYSIS_DETECT_MAX_PX", 1800))
+    small = _pyramid_down(gray, max_side)
+    sx = gray.shape[1] / float(small.shape[1])
+    sy = gray.shape[0] / float(small.shape[0])
 
-    # 2) Fiducials
+    T = _estimate_threshold(cv2.GaussianBlur(small, (3, 3), 0), dbg=dbg)
+    small_mask = _binarize(small, dbg=dbg, T=T)
+    if dbg is not None:
+        dbg.image("_debug_mask_prewarp.png", (small_mask * 255).astype(np.uint8))
+
+    # 2) Fiducials (auf small) → Koordinaten im Original
     fid, dbg_fid = None, None
-    res = _find_fiducials_from_mask(full_mask_raw, dbg_dir=dbg_dir)
+    res = _find_fiducials_from_mask(small_mask, dbg=dbg)
     if res is not None:
         if isinstance(res, tuple) and len(res) == 2:
             fid, dbg_fid = res
         else:
             fid = res
+    if fid is not None:
+        fid = [(x * sx, y * sy) for x, y in fid]
 
-    # 3) optional Warp
+    # 3) optional Warp: Original direkt ins Template-Raster, dann dort binarisieren
     if fid is not None and len(fid) == 4 and _quad_ok_for_template(fid, Wt, Ht):
         src = np.float32(fid)  # TL,TR,BR,BL
         dst = np.float32(
@@ -433,60 +634,42 @@ def analyse_job_page_scan(
             ok_det = False
 
         if ok_det:
-            img = cv2.warpPerspective(img, M, (Wt, Ht))
-
-            mask_u8 = (full_mask_raw > 0).astype(np.uint8) * 255
-            mask_warp = cv2.warpPerspective(mask_u8, M, (Wt, Ht))
-            full_mask = (mask_warp > 0).astype(np.uint8)
+            warped = cv2.warpPerspective(
+                gray, M, (Wt, Ht),
+                flags=cv2.INTER_LINEAR,
+                borderMode=cv2.BORDER_CONSTANT,
+                borderValue=255,
+            )
+            full_mask = _binarize(warped, T=T)
 
-            cv2.imwrite(str(dbg_dir / "_debug_warp.png"), img)
-            cv2.imwrite(str(dbg_dir / "_debug_mask.png"), (full_mask * 255).astype(np.uint8))
+            if dbg is not None:
+                dbg.image("_debug_warp.png", warped)
+                dbg.image("_debug_mask.png", (full_mask * 255).astype(np.uint8))
         else:
-            full_mask = full_mask_raw
-            cv2.imwrite(str(dbg_dir / "_debug_warp_skipped_det.png"), img)
-            cv2.imwrite(str(dbg_dir / "_debug_mask.png"), (full_mask * 255).astype(np.uint8))
+            full_mask = _binarize(gray, T=T)
+            if dbg is not None:
+                dbg.image("_debug_warp_skipped_det.png", gray)
+                dbg.image("_debug_mask.png", (full_mask * 255).astype(np.uint8))
+                dbg.fail("perspective transform is degenerate, warp skipped")
     else:
-        full_mask = full_mask_raw
-        cv2.imwrite(str(dbg_dir / "_debug_mask.png"), (full_mask * 255).astype(np.uint8))
-        if dbg_fid is not None:
-            cv2.imwrite(str(dbg_dir / "_debug_fiducials_REJECTED.png"), dbg_fid)
+        full_mask = _binarize(gray, T=T)
+        if dbg is not None:
+            dbg.image("_debug_mask.png", (full_mask * 255).astype(np.uint8))
+            if dbg_fid is not None:
+                dbg.image("_debug_fiducials_REJECTED.png", dbg_fid)
+                dbg.fail("fiducial quad rejected for template")
+            else:
+                dbg.fail("fiducials not found")
 
     # 4) Grid-Zellen
     cells, _, _ = grid_cells_px(tpl, dpi=DPI_DEFAULT, W=Wt, H=Ht)
 
-    letters = letters or ""
-    n = min(len(cells), len(letters))
-
-    results: list[tuple[int, str, Image.Image]] = []
-
-    for i in range(n):
-        letter = letters[i]
-        if not letter:
-            continue
-
-        y0, y1, x0, x1 = cells[i]
-        cell = full_mask[y0:y1, x0:x1].copy()
-        ch, cw = y1 - y0, x1 - x0
-
-        # Gridlinien trimmen
-        border = max(2, min(ch, cw) // 50)
-        if ch > 2 * border and cw > 2 * border:
-            cell = cell[border:ch - border, border:cw - border]
-            ch, cw = cell.shape
-
-        # Index-Ecke killen
-        idx_h = max(8, ch // 5)  # ~20 %
-        idx_w = max(8, cw // 5)
-        cell[:idx_h, :idx_w] = 0
-
-        if cell.sum() < 50:
-            continue
-
-        cropped = _tight_crop(cell)
-        if cropped.sum() == 0:
-            continue
-
-        im = _place_on_canvas(cropped, size=1024, margin=96)
-        results.append((i, letter, im))
-
-    return results
+    # 5) Zellen ausschneiden + normalisieren (parallel, siehe extract_cells)
+    glyph = tpl.get("glyph") or {}
+    return extract_cells(
+        full_mask,
+        cells,
+        letters or "",
+        canvas_size=int(glyph.get("canvas_px") or GLYPH_CANVAS_SIZE),
+        canvas_margin=int(glyph.get("margin_px", GLYPH_CANVAS_MARGIN)),
+    )
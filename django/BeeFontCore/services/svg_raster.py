@@ -0,0 +1,203 @@
+# BeeFontCore/services/svg_raster.py
+#
+# Minimaler SVG-Rasterizer für Glyph-SVGs (ohne cairo / ImageMagick).
+#
+# Unterstützt, was BeeFont selbst erzeugt bzw. potrace ausgibt:
+#   - path, line, polyline, polygon, rect, circle, ellipse
+#   - verschachtelte <g> mit transform (matrix/translate/scale/rotate/skewX/skewY)
+#   - fill / stroke / stroke-width (auch über style="...") inkl. Vererbung
+#
+# Kurven werden zu Polylinien geglättet; Flächen werden pro Element mit
+# even-odd gefüllt und die Elemente vereinigt. Striche (Editor-SVGs haben
+# fill="none") werden mit runden Enden in die Maske gezeichnet.
+
+import math
+import re
+from pathlib import Path
+
+import cv2
+import numpy as np
+from fontTools.misc.transform import Identity, Transform
+from fontTools.pens.basePen import BasePen
+from fontTools.pens.transformPen import TransformPen
+from fontTools.svgLib.path.parser import parse_path
+from fontTools.svgLib.path.shapes import PathBuilder
+import xml.etree.ElementTree as ET
+
+
+_SKIP_TAGS = {"defs", "clipPath", "mask", "symbol", "title", "desc", "metadata", "style"}
+_TRANSFORM_RE = re.compile(r"([a-zA-Z]+)\s*\(([^)]*)\)")
+_NUM_RE = re.compile(r"[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?")
+
+# Unterabtastung pro Kurvensegment
+_CURVE_STEPS = 16
+
+
+def _tag(el: ET.Element) -> str:
+    return el.tag.rsplit("}", 1)[-1]
+
+
+def _num(value, default: float = 0.0) -> float:
+    if value is None:
+        return default
+    m = _NUM_RE.search(str(value))
+    return float(m.group(0)) if m else default
+
+
+def parse_transform(raw: str | None) -> Transform:
+    t = Identity
+    if not raw:
+        return t
+    for name, args in _TRANSFORM_RE.findall(raw):
+        v = [float(a) for a in _NUM_RE.findall(args)]
+        if name == "matrix" and len(v) == 6:
+            t = t.transform(v)
+        elif name == "translate" and v:
+            t = t.translate(v[0], v[1] if len(v) > 1 else 0.0)
+        elif name == "scale" and v:
+            t = t.scale(v[0], v[1] if len(v) > 1 else v[0])
+        elif name == "rotate" and v:
+            if len(v) == 3:
+                t = t.translate(v[1], v[2]).rotate(math.radians(v[0])).translate(-v[1], -v[2])
+            else:
+                t = t.rotate(math.radians(v[0]))
+        elif name == "skewX" and v:
+            t = t.skew(math.radians(v[0]), 0)
+        elif name == "skewY" and v:
+            t = t.skew(0, math.radians(v[0]))
+    return t
+
+
+def _style(el: ET.Element, inherited: dict) -> dict:
+    style = dict(inherited)
+    for key in ("fill", "stroke", "stroke-width"):
+        if key in el.attrib:
+            style[key] = el.attrib[key].strip()
+    for decl in el.attrib.get("style", "").split(";"):
+        if ":" in decl:
+            k, v = decl.split(":", 1)
+            k = k.strip()
+            if k in ("fill", "stroke", "stroke-width"):
+                style[k] = v.strip()
+    return style
+
+
+class _FlattenPen(BasePen):
+    """Sammelt Subpfade als Polylinien (Liste von (N,2)-Arrays)."""
+
+    def __init__(self):
+        super().__init__(glyphSet=None)
+        self.subpaths: list[tuple[list[tuple[float, float]], bool]] = []
+        self._current: list[tuple[float, float]] = []
+
+    def _flush(self, closed: bool) -> None:
+        if len(self._current) > 1:
+            self.subpaths.append((self._current, closed))
+        self._current = []
+
+    def _moveTo(self, pt):
+        self._flush(False)
+        self._current = [pt]
+
+    def _lineTo(self, pt):
+        self._current.append(pt)
+
+    def _qCurveToOne(self, pt1, pt2):
+        p0 = self._getCurrentPoint()
+        for i in range(1, _CURVE_STEPS + 1):
+            t = i / _CURVE_STEPS
+            u = 1 - t
+            self._current.append((
+                u * u * p0[0] + 2 * u * t * pt1[0] + t * t * pt2[0],
+                u * u * p0[1] + 2 * u * t * pt1[1] + t * t * pt2[1],
+            ))
+
+    def _curveToOne(self, pt1, pt2, pt3):
+        p0 = self._getCurrentPoint()
+        for i in range(1, _CURVE_STEPS + 1):
+            t = i / _CURVE_STEPS
+            u = 1 - t
+            self._current.append((
+                u**3 * p0[0] + 3 * u * u * t * pt1[0] + 3 * u * t * t * pt2[0] + t**3 * pt3[0],
+                u**3 * p0[1] + 3 * u * u * t * pt1[1] + 3 * u * t * t * pt2[1] + t**3 * pt3[1],
+            ))
+
+    def _closePath(self):
+        self._flush(True)
+
+    def _endPath(self):
+        self._flush(False)
+
+
+def svg_viewbox(root: ET.Element) -> tuple[float, float, float, float]:
+    vb = root.attrib.get("viewBox")
+    if vb:
+        v = [float(x) for x in _NUM_RE.findall(vb)]
+        if len(v) == 4 and v[2] > 0 and v[3] > 0:
+            return v[0], v[1], v[2], v[3]
+    w = _num(root.attrib.get("width"), 0.0)
+    h = _num(root.attrib.get("height"), 0.0)
+    if w <= 0 or h <= 0:
+        raise ValueError("SVG has neither a usable viewBox nor width/height")
+    return 0.0, 0.0, w, h
+
+
+def rasterize_svg(svg: Path | str, height_px: int) -> np.ndarray:
+    """
+    Rendert eine Glyph-SVG als 0/1-Maske (1 = Tinte).
+    Die viewBox-Höhe wird auf height_px skaliert, die Breite proportional.
+    """
+    root = ET.parse(str(svg)).getroot()
+    min_x, min_y, vb_w, vb_h = svg_viewbox(root)
+
+    scale = height_px / vb_h
+    width_px = max(1, int(round(vb_w * scale)))
+    base = Identity.scale(scale).translate(-min_x, -min_y)
+
+    mask = np.zeros((height_px, width_px), dtype=np.uint8)
+    root_style = _style(root, {"fill": "#000", "stroke": "none", "stroke-width": "1"})
+    _draw_children(root, base, root_style, mask)
+    return mask
+
+
+def _draw_children(parent: ET.Element, t: Transform, style: dict, mask: np.ndarray) -> None:
+    for el in parent:
+        tag = _tag(el)
+        if tag in _SKIP_TAGS:
+            continue
+        el_t = t.transform(parse_transform(el.attrib.get("transform")))
+        el_style = _style(el, style)
+
+        if tag in ("g", "svg", "a"):
+            _draw_children(el, el_t, el_style, mask)
+            continue
+
+        pb = PathBuilder()
+        pb.add_path_from_element(el)
+        if not pb.paths:
+            continue
+
+        pen = _FlattenPen()
+        # transform-Attribut ist in el_t schon enthalten → PathBuilder-Transform ignorieren
+        parse_path(pb.paths[0], TransformPen(pen, el_t))
+        _paint(pen.subpaths, el_style, el_t, mask)
+
+
+def _paint(subpaths, style: dict, t: Transform, mask: np.ndarray) -> None:
+    if not subpaths:
+        return
+
+    polys = [np.round(np.asarray(pts, dtype=np.float64)).astype(np.int32) for pts, _ in subpaths]
+
+    if style.get("fill", "#000").lower() not in ("none", "transparent"):
+        layer = np.zeros_like(mask)
+        cv2.fillPoly(layer, polys, 1)
+        mask |= layer
+
+    if style.get("stroke", "none").lower() not in ("none", "transparent"):
+        # Strichbreite mit mittlerem Skalierungsfaktor der Transformation
+        sx = math.hypot(t[0], t[1])
+        sy = math.hypot(t[2], t[3])
+        width = max(1, int(round(_num(style.get("stroke-width"), 1.0) * (sx + sy) / 2)))
+        for poly, (_, closed) in zip(polys, subpaths):
+            cv2.polylines(mask, [poly], closed, 1, thickness=width, lineType=cv2.LINE_8)
@@ -0,0 +1,58 @@
+# BeeFontCore/services/template_render_cache.py
+#
+# Plattencache für die gerenderten Template-Bögen von template_image.
+#
+# Ein Bogen (A4 bei Template-DPI, ~2480x3508) kostet Raster + Zellen +
+# TrueType-Font + PNG-Encode. Die Ergebnisse hängen nur ab von:
+#   Template-Code, Modus, Prefill-Stil, Buchstaben, Ausgabeformat (png/svg/pdf),
+#   TemplateDefinition.updated_at
+# → sha256 darüber ist Cache-Key und ETag zugleich.
+#
+# Ablage: MEDIA_ROOT/beefont/template_cache/<kk>/<key>.<png|svg|pdf>
+# (disk_cache.DiskCache: LRU über mtime), Obergrenze
+# BEEFONT_TEMPLATE_CACHE_MB. 0 schaltet den Cache ab (ETag bleibt).
+#
+# RENDER_VERSION erhöhen, wenn sich das Rendering (PNG oder template_vector)
+# sichtbar ändert, sonst werden alte Bögen weiter ausgeliefert.
+
+import hashlib
+import json
+from pathlib import Path
+
+from django.conf import settings
+
+from ..models import TemplateDefinition
+from .disk_cache import DiskCache
+
+
+RENDER_VERSION = 1
+CACHE_DIRNAME = "template_cache"
+
+
+def render_key(
+    template: TemplateDefinition,
+    mode: str,
+    prefill_style: str | None,
+    letters: list[str],
+    output: str = "png",
+) -> str:
+    payload = {
+        "v": RENDER_VERSION,
+        "code": template.code,
+        "updated": template.updated_at.isoformat() if template.updated_at else "",
+        "mode": mode,
+        "style": prefill_style or "",
+        "letters": "".join(letters),
+        "output": output,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class TemplateRenderCache(DiskCache):
+    @classmethod
+    def from_settings(cls) -> "TemplateRenderCache":
+        max_mb = int(getattr(settings, "BEEFONT_TEMPLATE_CACHE_MB", 128) or 0)
+        if max_mb <= 0:
+            return cls(None, 0)
+        root = Path(settings.MEDIA_ROOT) / "beefont" / CACHE_DIRNAME
+        return cls(root, max_mb * 1024 * 1024)
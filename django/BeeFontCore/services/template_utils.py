@@ -1,5 +1,6 @@
 # BeeFontCore/services/template_utils.py
 
+from dataclasses import dataclass
 from typing import List, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
@@ -51,6 +52,10 @@ def template_to_config(t: TemplateDefinition) -> dict:
             "size_mm": float(t.fiducial_size_mm),
             "margin_mm": float(t.fiducial_margin_mm),
         },
+        "glyph": {
+            "canvas_px": int(t.glyph_canvas_px),
+            "margin_px": int(t.glyph_margin_px),
+        },
     }
     return tpl
 
@@ -118,14 +123,30 @@ def _get_prefill_font(prefill_style: str | None, cell_h: int) -> tuple[ImageFont
     return font, GLYPH_COLOR_DEFAULT
 
 
-def render_template_png(
+@dataclass
+class TemplateLayout:
+    """
+    Seitengeometrie im Template-Raster (Pixel bei tpl-DPI). Gemeinsame
+    Grundlage für PNG (render_template_png) und Vektor-Ausgabe
+    (template_vector), damit alle Formate exakt dasselbe Layout haben.
+    """
+    dpi: int
+    width_mm: float
+    height_mm: float
+    W: int
+    H: int
+    fiducials: list[tuple[int, int, int]]              # (x, y, size)
+    cells: list[tuple[int, int, int, int, str]]        # (x0, y0, x1, y1, label)
+    cell_h: int
+
+
+def template_layout(
     tpl: dict,
     order: List[str],
     *,
     prefill: bool,
     show_indices: bool = True,
-    prefill_style: str | None = None,
-) -> Image.Image:
+) -> TemplateLayout:
     paper = tpl["paper"]
     dpi = int(paper.get("dpi", DPI_DEFAULT))
 
@@ -145,9 +166,6 @@ def render_template_png(
     fid_size_px = _mm_to_px(fid_size_mm, dpi)
     fid_margin_px = _mm_to_px(fid_margin_mm, dpi)
 
-    im = Image.new("RGB", (W, H), "white")
-    d = ImageDraw.Draw(im)
-
     # Fiducials
     corners = [
         (fid_margin_px, fid_margin_px),
@@ -155,21 +173,14 @@ def render_template_png(
         (W - fid_margin_px - fid_size_px, H - fid_margin_px - fid_size_px),
         (fid_margin_px, H - fid_margin_px - fid_size_px),
     ]
-    for (x, y) in corners:
-        d.rectangle([x, y, x + fid_size_px, y + fid_size_px], fill="black")
-
-    # Font & Farbe abhängig vom Stil
-    font, text_color = _get_prefill_font(prefill_style, cell_h)
+    fiducials = [(x, y, fid_size_px) for (x, y) in corners]
 
+    cells = []
     idx = 0
     for r in range(rows):
         for c in range(cols):
             x0 = m_left + c * (cell_w + gap_x)
             y0 = m_top + r * (cell_h + gap_y)
-            x1 = x0 + cell_w
-            y1 = y0 + cell_h
-
-            d.rectangle([x0, y0, x1, y1], outline=GRID_COLOR, width=1)
 
             label = ""
             if idx < len(order) and prefill:
@@ -177,16 +188,52 @@ def render_template_png(
             elif show_indices:
                 label = str(idx + 1)
 
-            if label:
-                bbox = d.textbbox((0, 0), label, font=font)
-                tw = bbox[2] - bbox[0]
-                th = bbox[3] - bbox[1]
-                tx = x0 + (cell_w - tw) / 2
-                ty = y0 + (cell_h - th) / 2
-                d.text((tx, ty), label, fill=text_color, font=font)
-
+            cells.append((x0, y0, x0 + cell_w, y0 + cell_h, label))
             idx += 1
 
+    return TemplateLayout(
+        dpi=dpi,
+        width_mm=w_mm,
+        height_mm=h_mm,
+        W=W,
+        H=H,
+        fiducials=fiducials,
+        cells=cells,
+        cell_h=cell_h,
+    )
+
+
+def render_template_png(
+    tpl: dict,
+    order: List[str],
+    *,
+    prefill: bool,
+    show_indices: bool = True,
+    prefill_style: str | None = None,
+) -> Image.Image:
+    layout = template_layout(tpl, order, prefill=prefill, show_indices=show_indices)
+
+    im = Image.new("RGB", (layout.W, layout.H), "white")
+    d = ImageDraw.Draw(im)
+
+    # Fiducials
+    for (x, y, size) in layout.fiducials:
+        d.rectangle([x, y, x + size, y + size], fill="black")
+
+    # Font & Farbe abhängig vom Stil
+    font, text_color = _get_prefill_font(prefill_style, layout.cell_h)
+
+    for (x0, y0, x1, y1, label) in layout.cells:
+        d.rectangle([x0, y0, x1, y1], outline=GRID_COLOR, width=1)
+
+        if label:
+            bbox = d.textbbox((0, 0), label, font=font)
+            tw = bbox[2] - bbox[0]
+            th = bbox[3] - bbox[1]
+            tx = x0 + (x1 - x0 - tw) / 2
+            ty = y0 + (y1 - y0 - th) / 2
+            d.text((tx, ty), label, fill=text_color, font=font)
+
     return im
 
 
@@ -0,0 +1,320 @@
+# BeeFontCore/services/template_vector.py
+#
+# Vektor-Ausgabe der Template-Bögen (SVG / PDF) für template_image.
+#
+# - gleiche Geometrie wie render_template_png (template_layout, Pixel im
+#   Template-Raster), auf die exakten Papiermaße in mm skaliert → gedruckt
+#   liegen Raster und Fiducials dort, wo die Segmentierung sie erwartet
+# - Rechtecke decken dieselben Pixel ab wie die Pillow-Variante
+#   (Pillow zeichnet [x0, x1] inklusive)
+# - Prefill-Buchstaben/Indizes als Umrisse aus derselben TrueType-Datei
+#   wie beim PNG (fontTools), kein Font-Embedding, keine Abhängigkeit vom
+#   Viewer; nur wenn Pillow keine TrueType-Datei findet, Text-Fallback
+# - byte-genau deterministisch: keine Zeitstempel, keine IDs, feste
+#   Zahlformatierung → gut cachebar (template_render_cache / ETag)
+
+import zlib
+from functools import lru_cache
+from typing import List
+
+from fontTools.pens.basePen import BasePen
+from fontTools.pens.boundsPen import BoundsPen
+from fontTools.pens.svgPathPen import SVGPathPen
+from fontTools.pens.transformPen import TransformPen
+from fontTools.ttLib import TTFont
+from PIL import ImageColor
+
+from .template_utils import (
+    GRID_COLOR,
+    TemplateLayout,
+    _get_prefill_font,
+    template_layout,
+)
+
+
+MM_PER_INCH = 25.4
+PT_PER_INCH = 72.0
+
+
+def _n(v: float, digits: int = 3) -> str:
+    """Feste Zahlformatierung (max. digits Nachkommastellen, ohne Nullen)."""
+    s = f"{v:.{digits}f}".rstrip("0").rstrip(".")
+    return "0" if s in ("", "-0") else s
+
+
+def _rgb(color) -> tuple[int, int, int]:
+    if isinstance(color, str):
+        return ImageColor.getrgb(color)[:3]
+    return tuple(color)[:3]
+
+
+@lru_cache(maxsize=8)
+def _load_ttfont(path: str) -> TTFont:
+    return TTFont(path, lazy=True)
+
+
+def _label_font(prefill_style: str | None, cell_h: int):
+    """
+    (TTFont | None, Schriftgröße in px, Farbe) – dieselbe Auswahl wie beim PNG.
+    None, wenn Pillow nur den eingebauten Bitmap-Font gefunden hat.
+    """
+    font, color = _get_prefill_font(prefill_style, cell_h)
+    size = getattr(font, "size", max(10, int(cell_h * 0.5)))
+    path = getattr(font, "path", None)
+    if not isinstance(path, str):
+        return None, size, color
+    try:
+        return _load_ttfont(path), size, color
+    except Exception:
+        return None, size, color
+
+
+def _draw_label(ttfont: TTFont, text: str, size: float, cell, pen_factory):
+    """
+    Zeichnet text als Umrisse, Tinten-Bounding-Box in der Zelle zentriert.
+    pen_factory(glyph_set) liefert den Ziel-Pen (Raster-Koordinaten, y nach
+    unten); glyph_set wird für zusammengesetzte Glyphen (Ä, é, …) gebraucht.
+    """
+    x0, y0, x1, y1 = cell[:4]
+    glyph_set = ttfont.getGlyphSet()
+    cmap = ttfont.getBestCmap() or {}
+    hmtx = ttfont["hmtx"]
+    scale = size / float(ttfont["head"].unitsPerEm)
+
+    # Glyphen + Vorschub in Font-Einheiten
+    placed = []
+    advance = 0
+    for ch in text:
+        gname = cmap.get(ord(ch), ".notdef")
+        if gname not in glyph_set:
+            continue
+        placed.append((gname, advance))
+        advance += hmtx[gname][0]
+
+    bounds = BoundsPen(glyph_set)
+    for gname, dx in placed:
+        glyph_set[gname].draw(TransformPen(bounds, (1, 0, 0, 1, dx, 0)))
+    if bounds.bounds is None:
+        return
+    bx0, by0, bx1, by1 = bounds.bounds
+
+    cx = (x0 + x1) / 2.0
+    cy = (y0 + y1) / 2.0
+    tx = cx - (bx0 + bx1) / 2.0 * scale
+    baseline = cy + (by0 + by1) / 2.0 * scale
+
+    pen = pen_factory(glyph_set)
+    for gname, dx in placed:
+        glyph_set[gname].draw(
+            TransformPen(pen, (scale, 0, 0, -scale, tx + dx * scale, baseline))
+        )
+    return pen
+
+
+# -------------------------------------------------------------------
+# SVG
+# -------------------------------------------------------------------
+
+
+def _svg_hex(color) -> str:
+    r, g, b = _rgb(color)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _svg_escape(text: str) -> str:
+    return (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+    )
+
+
+def _svg_document(layout: TemplateLayout, prefill_style: str | None) -> str:
+    W, H = layout.W, layout.H
+    out = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        (
+            f'<svg xmlns="http://www.w3.org/2000/svg" version="1.1" '
+            f'width="{_n(layout.width_mm)}mm" height="{_n(layout.height_mm)}mm" '
+            f'viewBox="0 0 {W} {H}" preserveAspectRatio="none">'
+        ),
+        f'<rect x="0" y="0" width="{W}" height="{H}" fill="#ffffff"/>',
+        '<g fill="#000000">',
+    ]
+    for (x, y, size) in layout.fiducials:
+        out.append(f'<rect x="{x}" y="{y}" width="{size + 1}" height="{size + 1}"/>')
+    out.append("</g>")
+
+    out.append(f'<g fill="none" stroke="{_svg_hex(GRID_COLOR)}" stroke-width="1">')
+    for (x0, y0, x1, y1, _label) in layout.cells:
+        out.append(
+            f'<rect x="{_n(x0 + 0.5)}" y="{_n(y0 + 0.5)}" width="{x1 - x0}" height="{y1 - y0}"/>'
+        )
+    out.append("</g>")
+
+    labelled = [cell for cell in layout.cells if cell[4]]
+    if labelled:
+        ttfont, size, color = _label_font(prefill_style, layout.cell_h)
+        out.append(f'<g fill="{_svg_hex(color)}">')
+        for cell in labelled:
+            if ttfont is not None:
+                pen = _draw_label(ttfont, cell[4], size, cell, lambda gs: SVGPathPen(gs, ntos=_n))
+                if pen is not None:
+                    out.append(f'<path d="{pen.getCommands()}"/>')
+            else:
+                x0, y0, x1, y1, label = cell
+                out.append(
+                    f'<text x="{_n((x0 + x1) / 2)}" y="{_n((y0 + y1) / 2)}" '
+                    f'font-family="DejaVu Sans, sans-serif" font-size="{size}" '
+                    f'text-anchor="middle" dominant-baseline="central">{_svg_escape(label)}</text>'
+                )
+        out.append("</g>")
+
+    out.append("</svg>")
+    return "\n".join(out) + "\n"
+
+
+def render_template_svg(
+    tpl: dict,
+    order: List[str],
+    *,
+    prefill: bool,
+    show_indices: bool = True,
+    prefill_style: str | None = None,
+) -> bytes:
+    layout = template_layout(tpl, order, prefill=prefill, show_indices=show_indices)
+    return _svg_document(layout, prefill_style).encode("utf-8")
+
+
+# -------------------------------------------------------------------
+# PDF
+# -------------------------------------------------------------------
+
+
+class _PdfPathPen(BasePen):
+    """Sammelt Pfad-Operatoren für einen PDF-Content-Stream."""
+
+    def __init__(self, glyph_set=None):
+        super().__init__(glyph_set)
+        self.ops: list[str] = []
+
+    def _moveTo(self, pt):
+        self.ops.append(f"{_n(pt[0])} {_n(pt[1])} m")
+
+    def _lineTo(self, pt):
+        self.ops.append(f"{_n(pt[0])} {_n(pt[1])} l")
+
+    def _curveToOne(self, pt1, pt2, pt3):
+        self.ops.append(
+            f"{_n(pt1[0])} {_n(pt1[1])} {_n(pt2[0])} {_n(pt2[1])} {_n(pt3[0])} {_n(pt3[1])} c"
+        )
+
+    def _closePath(self):
+        self.ops.append("h")
+
+
+def _pdf_rgb(color) -> str:
+    return " ".join(_n(v / 255.0) for v in _rgb(color))
+
+
+def _pdf_string(text: str) -> str:
+    raw = text.encode("latin-1", errors="replace").decode("latin-1")
+    return "(" + raw.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+def _pdf_content(layout: TemplateLayout, prefill_style: str | None) -> tuple[str, bool]:
+    """Content-Stream in Raster-Koordinaten. Rückgabe: (Stream, Text-Fallback benutzt)."""
+    w_pt = layout.width_mm / MM_PER_INCH * PT_PER_INCH
+    h_pt = layout.height_mm / MM_PER_INCH * PT_PER_INCH
+
+    ops = [
+        # Raster-Pixel (y nach unten) → Punkte, exakt auf Papiergröße
+        # (Skalierung mit 8 Stellen: 3 Stellen wären auf A4 ~0.03 mm daneben)
+        f"{_n(w_pt / layout.W, 8)} 0 0 {_n(-h_pt / layout.H, 8)} 0 {_n(h_pt)} cm",
+        "0 0 0 rg",
+    ]
+    for (x, y, size) in layout.fiducials:
+        ops.append(f"{x} {y} {size + 1} {size + 1} re")
+    ops.append("f")
+
+    ops.append(f"{_pdf_rgb(GRID_COLOR)} RG 1 w")
+    for (x0, y0, x1, y1, _label) in layout.cells:
+        ops.append(f"{_n(x0 + 0.5)} {_n(y0 + 0.5)} {x1 - x0} {y1 - y0} re")
+    ops.append("S")
+
+    uses_text = False
+    labelled = [cell for cell in layout.cells if cell[4]]
+    if labelled:
+        ttfont, size, color = _label_font(prefill_style, layout.cell_h)
+        ops.append(f"{_pdf_rgb(color)} rg")
+        for cell in labelled:
+            if ttfont is not None:
+                pen = _draw_label(ttfont, cell[4], size, cell, _PdfPathPen)
+                if pen is not None and pen.ops:
+                    ops.extend(pen.ops)
+                    ops.append("f")
+            else:
+                x0, y0, x1, y1, label = cell
+                uses_text = True
+                # Text-Matrix spiegelt die y-Achse zurück (Schrift aufrecht)
+                ops.append(
+                    f"BT /F1 {size} Tf 1 0 0 -1 {_n(x0 + (x1 - x0) * 0.3)} "
+                    f"{_n((y0 + y1) / 2 + size * 0.35)} Tm {_pdf_string(label)} Tj ET"
+                )
+
+    return "\n".join(ops) + "\n", uses_text
+
+
+def _pdf_document(layout: TemplateLayout, prefill_style: str | None) -> bytes:
+    content, uses_text = _pdf_content(layout, prefill_style)
+    stream = zlib.compress(content.encode("latin-1"), 9)
+
+    w_pt = layout.width_mm / MM_PER_INCH * PT_PER_INCH
+    h_pt = layout.height_mm / MM_PER_INCH * PT_PER_INCH
+
+    resources = "<< /Font << /F1 5 0 R >> >>" if uses_text else "<< >>"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {_n(w_pt)} {_n(h_pt)}] "
+            f"/Resources {resources} /Contents 4 0 R >>"
+        ).encode("ascii"),
+        f"<< /Length {len(stream)} /Filter /FlateDecode >>\nstream\n".encode("ascii")
+        + stream
+        + b"\nendstream",
+    ]
+    if uses_text:
+        objects.append(
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"
+        )
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{num} 0 obj\n".encode("ascii") + body + b"\nendobj\n"
+
+    xref_pos = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n".encode("ascii")
+    out += b"0000000000 65535 f \n"
+    for off in offsets:
+        out += f"{off:010d} 00000 n \n".encode("ascii")
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_pos}\n%%EOF\n"
+    ).encode("ascii")
+    return bytes(out)
+
+
+def render_template_pdf(
+    tpl: dict,
+    order: List[str],
+    *,
+    prefill: bool,
+    show_indices: bool = True,
+    prefill_style: str | None = None,
+) -> bytes:
+    layout = template_layout(tpl, order, prefill=prefill, show_indices=show_indices)
+    return _pdf_document(layout, prefill_style)
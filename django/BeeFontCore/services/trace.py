@@ -0,0 +1,265 @@
+# BeeFontCore/services/trace.py
+#
+# In-Process-Vektorisierung von Glyph-Masken (Alternative zu convert + potrace).
+#
+# - Konturen mit cv2.findContours (Außenkonturen + Löcher)
+# - Treppenstufen glätten, Polygon mit approxPolyDP vereinfachen
+# - Kurvenfit im TrueType-Stil: flache Ecken werden zu quadratischen
+#   Kontrollpunkten (implizite On-Curve-Punkte auf den Kantenmitten),
+#   spitze Ecken bleiben On-Curve.
+#
+# Ergebnis ist ein GlyphOutline in Bildkoordinaten (px, y nach unten),
+# das direkt als SVG geschrieben oder in einen Font-Pen gezeichnet werden kann.
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import json
+
+import cv2
+import numpy as np
+
+from django.conf import settings
+
+
+TRACE_BACKEND_POTRACE = "potrace"
+TRACE_BACKEND_OPENCV = "opencv"
+TRACE_BACKENDS = (TRACE_BACKEND_POTRACE, TRACE_BACKEND_OPENCV)
+
+# Default-Parameter (gehen auch in die Cache-Keys ein, siehe trace_params)
+TRACE_TOLERANCE_PX = 1.5
+TRACE_CORNER_DEGREES = 120.0
+TRACE_MIN_AREA_PX = 12.0
+# bei Änderungen am Algorithmus erhöhen → alte Cache-Einträge ungültig
+TRACE_VERSION = 1
+
+# (x, y, on_curve)
+OutlinePoint = tuple[float, float, bool]
+
+
+def trace_backend() -> str:
+    backend = str(getattr(settings, "BEEFONT_TRACE_BACKEND", TRACE_BACKEND_POTRACE)).lower()
+    if backend not in TRACE_BACKENDS:
+        raise RuntimeError(
+            f"Unknown BEEFONT_TRACE_BACKEND {backend!r}, expected one of {TRACE_BACKENDS}"
+        )
+    return backend
+
+
+def trace_params() -> dict:
+    return {
+        "version": TRACE_VERSION,
+        "tolerance": TRACE_TOLERANCE_PX,
+        "corner_degrees": TRACE_CORNER_DEGREES,
+        "min_area": TRACE_MIN_AREA_PX,
+    }
+
+
+@dataclass(frozen=True)
+class GlyphOutline:
+    """
+    Vektorisierte Glyphe.
+
+    width/height: Größe des Quellrasters (px)
+    contours    : Liste geschlossener Konturen, je Liste von (x, y, on_curve).
+                  Außenkonturen und Löcher haben entgegengesetzten Umlaufsinn
+                  (nonzero fill rule).
+    """
+
+    width: int
+    height: int
+    contours: tuple[tuple[OutlinePoint, ...], ...]
+
+    def to_svg_path(self) -> str:
+        return " ".join(_contour_to_svg_path(c) for c in self.contours if c)
+
+    def to_svg(self) -> str:
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{self.width}" height="{self.height}" '
+            f'viewBox="0 0 {self.width} {self.height}">\n'
+            f'<path fill="#000000" fill-rule="nonzero" d="{self.to_svg_path()}"/>\n'
+            "</svg>\n"
+        )
+
+    def to_json(self) -> bytes:
+        return json.dumps(
+            {
+                "w": self.width,
+                "h": self.height,
+                "c": [[[x, y, int(on)] for x, y, on in c] for c in self.contours],
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    @classmethod
+    def from_json(cls, data: bytes) -> "GlyphOutline":
+        raw = json.loads(data)
+        return cls(
+            width=raw["w"],
+            height=raw["h"],
+            contours=tuple(
+                tuple((float(x), float(y), bool(on)) for x, y, on in c) for c in raw["c"]
+            ),
+        )
+
+
+def _fmt(v: float) -> str:
+    s = f"{v:.2f}".rstrip("0").rstrip(".")
+    return s if s not in ("-0", "") else "0"
+
+
+def _mid(a: OutlinePoint, b: OutlinePoint) -> OutlinePoint:
+    return ((a[0] + b[0]) / 2.0, (a[1] + b[1]) / 2.0, True)
+
+
+def _contour_to_svg_path(points: tuple[OutlinePoint, ...]) -> str:
+    """
+    TrueType-artige Punktliste (implizite On-Curve-Mittelpunkte zwischen
+    zwei Off-Curve-Punkten) → SVG-Pfad mit M/L/Q/Z.
+    """
+    if len(points) < 2:
+        return ""
+
+    start_idx = next((i for i, p in enumerate(points) if p[2]), None)
+    if start_idx is None:
+        # nur Kontrollpunkte → auf der Mitte der ersten Kante starten
+        start = _mid(points[0], points[1])
+        seq = list(points[1:]) + [points[0]]
+    else:
+        start = points[start_idx]
+        seq = list(points[start_idx + 1:]) + list(points[:start_idx])
+
+    seq.append(start)  # Kontur schließen
+    parts = [f"M{_fmt(start[0])} {_fmt(start[1])}"]
+
+    pending: OutlinePoint | None = None
+    for p in seq:
+        if p[2]:
+            if pending is None:
+                parts.append(f"L{_fmt(p[0])} {_fmt(p[1])}")
+            else:
+                parts.append(
+                    f"Q{_fmt(pending[0])} {_fmt(pending[1])} {_fmt(p[0])} {_fmt(p[1])}"
+                )
+                pending = None
+        else:
+            if pending is not None:
+                m = _mid(pending, p)
+                parts.append(
+                    f"Q{_fmt(pending[0])} {_fmt(pending[1])} {_fmt(m[0])} {_fmt(m[1])}"
+                )
+            pending = p
+
+    parts.append("Z")
+    return "".join(parts)
+
+
+def _smooth_closed(pts: np.ndarray, window: int = 5) -> np.ndarray:
+    """Zirkulärer gleitender Mittelwert gegen die Pixel-Treppen."""
+    if len(pts) < window * 2:
+        return pts.astype(np.float32)
+    k = np.ones(window, dtype=np.float32) / window
+    pad = window // 2
+    out = np.empty_like(pts, dtype=np.float32)
+    for axis in (0, 1):
+        col = pts[:, axis].astype(np.float32)
+        wrapped = np.concatenate([col[-pad:], col, col[:pad]])
+        out[:, axis] = np.convolve(wrapped, k, mode="valid")
+    return out
+
+
+def _fit_contour(
+    pts: np.ndarray,
+    tolerance: float,
+    corner_cos: float,
+) -> tuple[OutlinePoint, ...]:
+    smooth = _smooth_closed(pts)
+    poly = cv2.approxPolyDP(smooth.reshape(-1, 1, 2), tolerance, True).reshape(-1, 2)
+    if len(poly) < 3:
+        return ()
+
+    prev = np.roll(poly, 1, axis=0)
+    nxt = np.roll(poly, -1, axis=0)
+    v1 = prev - poly
+    v2 = nxt - poly
+    norms = np.linalg.norm(v1, axis=1) * np.linalg.norm(v2, axis=1)
+    cos = np.einsum("ij,ij->i", v1, v2) / np.maximum(norms, 1e-9)
+    # Innenwinkel klein (cos groß) → spitze Ecke → On-Curve behalten
+    corners = cos > corner_cos
+
+    return tuple(
+        (float(x), float(y), bool(on))
+        for (x, y), on in zip(poly, corners)
+    )
+
+
+def trace_mask(
+    mask01: np.ndarray,
+    *,
+    tolerance: float = TRACE_TOLERANCE_PX,
+    corner_degrees: float = TRACE_CORNER_DEGREES,
+    min_area: float = TRACE_MIN_AREA_PX,
+) -> GlyphOutline:
+    """
+    Vektorisiert eine 0/1-Maske (1 = Tinte).
+    """
+    mask_u8 = (mask01 > 0).astype(np.uint8) * 255
+    H, W = mask_u8.shape[:2]
+
+    cnts, hierarchy = cv2.findContours(mask_u8, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_NONE)
+    if not cnts:
+        return GlyphOutline(width=W, height=H, contours=())
+
+    corner_cos = float(np.cos(np.deg2rad(corner_degrees)))
+    contours: list[tuple[OutlinePoint, ...]] = []
+
+    for idx, c in enumerate(cnts):
+        signed = cv2.contourArea(c, oriented=True)
+        if abs(signed) < min_area:
+            continue
+
+        pts = c.reshape(-1, 2)
+        is_hole = hierarchy[0][idx][3] != -1
+
+        # Außen: positiver Umlauf, Loch: negativer Umlauf (Bildkoordinaten)
+        if (signed < 0) != is_hole:
+            pts = pts[::-1]
+
+        fitted = _fit_contour(pts, tolerance, corner_cos)
+        if fitted:
+            contours.append(fitted)
+
+    return GlyphOutline(width=W, height=H, contours=tuple(contours))
+
+
+def load_glyph_mask(png: Path) -> np.ndarray:
+    """
+    Glyph-PNG → 0/1-Maske. Schwelle 50 % wie bei `convert -threshold 50%`.
+    """
+    gray = cv2.imread(str(png), cv2.IMREAD_GRAYSCALE)
+    if gray is None:
+        raise RuntimeError(f"trace: could not read PNG: {png}")
+    return (gray < 128).astype(np.uint8)
+
+
+def trace_png(png: Path, **params) -> GlyphOutline:
+    return trace_mask(load_glyph_mask(Path(png)), **params)
+
+
+def png_to_svg_inprocess(png: Path, svg: Path) -> None:
+    """
+    Drop-in für build_font._png_to_svg ohne Subprozesse und Temp-Dateien.
+    """
+    png = Path(png)
+    svg = Path(svg)
+    if not png.is_file():
+        raise RuntimeError(f"png_to_svg_inprocess: PNG not found: {png}")
+
+    outline = trace_png(png)
+    if not outline.contours:
+        raise RuntimeError(f"trace: no ink found in {png}")
+
+    svg.parent.mkdir(parents=True, exist_ok=True)
+    svg.write_text(outline.to_svg(), encoding="utf-8")
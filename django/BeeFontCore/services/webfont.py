@@ -0,0 +1,183 @@
+# BeeFontCore/services/webfont.py
+#
+# Web-Font-Varianten der gebauten TTFs:
+#
+# - WOFF2 (Brotli) und WOFF (zlib) liegen neben der Store-Datei:
+#     build/<hash>.ttf → build/<hash>.woff2, build/<hash>.woff
+#   build_store.commit() erzeugt sie direkt nach dem Build
+#   (BEEFONT_BUILD_WEBFONTS), für ältere Builds entstehen sie beim ersten
+#   Abruf. gc_beefont behandelt sie wie die zugehörige TTF.
+# - WOFF2 braucht das Python-Paket "brotli"; fehlt es, wird nur WOFF
+#   angeboten (available_flavors()).
+# - subset_font(): Font auf die Codepoints einer Seite reduziert (?text=),
+#   Ergebnis im SubsetCache (Key = Font-Hash + Codepoint-Menge + Format).
+#   Die Codepoints werden vorher mit der cmap des Fonts geschnitten
+#   (font_codepoints) → Zeichen, die der Font nicht hat, ergeben keine
+#   neuen Keys; die Zahl möglicher Subsets ist durch den Font begrenzt.
+#   COLR-Fonts: die Layer-Glyphen werden vom fontTools-Subsetter über die
+#   COLR-Closure mitgenommen.
+#
+# SUBSET_VERSION erhöhen, wenn sich die Subsetting-Optionen ändern.
+
+import hashlib
+import io
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from fontTools import subset
+from fontTools.ttLib import TTFont
+
+from .disk_cache import DiskCache
+
+
+SUBSET_VERSION = 1
+CACHE_DIRNAME = "subset_cache"
+
+FLAVORS = ("woff2", "woff")
+CONTENT_TYPES = {
+    "ttf": "font/ttf",
+    "woff": "font/woff",
+    "woff2": "font/woff2",
+}
+
+# Obergrenze für ?text= (verschiedene Codepoints)
+MAX_SUBSET_CODEPOINTS = 5000
+
+
+def woff2_supported() -> bool:
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def available_flavors() -> tuple[str, ...]:
+    """Web-Formate, die in dieser Installation erzeugt werden können."""
+    return tuple(f for f in FLAVORS if f != "woff2" or woff2_supported())
+
+
+def flavor_path(ttf: Path, flavor: str) -> Path:
+    return ttf.with_suffix(f".{flavor}")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _save(font: TTFont, flavor: str | None) -> bytes:
+    font.flavor = flavor
+    buf = io.BytesIO()
+    font.save(buf)
+    return buf.getvalue()
+
+
+def ensure_flavor(ttf: Path, flavor: str) -> Path:
+    """
+    Pfad der WOFF/WOFF2-Variante von ttf (wird bei Bedarf erzeugt).
+    Raises FileNotFoundError, wenn die TTF fehlt.
+    """
+    target = flavor_path(ttf, flavor)
+    if target.exists():
+        return target
+    with TTFont(str(ttf), recalcTimestamp=False) as font:
+        data = _save(font, flavor)
+    _atomic_write(target, data)
+    return target
+
+
+def emit_web_fonts(ttf: Path) -> list[Path]:
+    """Alle verfügbaren Web-Formate neben ttf ablegen (nach dem Build)."""
+    if not getattr(settings, "BEEFONT_BUILD_WEBFONTS", True):
+        return []
+    return [ensure_flavor(ttf, flavor) for flavor in available_flavors()]
+
+
+# ---------------------------
+# Subsetting
+# ---------------------------
+
+class SubsetCache(DiskCache):
+    @classmethod
+    def from_settings(cls) -> "SubsetCache":
+        max_mb = int(getattr(settings, "BEEFONT_SUBSET_CACHE_MB", 64) or 0)
+        if max_mb <= 0:
+            return cls(None, 0)
+        root = Path(settings.MEDIA_ROOT) / "beefont" / CACHE_DIRNAME
+        return cls(root, max_mb * 1024 * 1024)
+
+
+def text_codepoints(text: str) -> tuple[int, ...]:
+    """Sortierte, eindeutige Codepoints eines Textes."""
+    return tuple(sorted({ord(ch) for ch in text}))
+
+
+@lru_cache(maxsize=64)
+def font_codepoints(ttf: Path, font_hash: str) -> frozenset[int]:
+    """
+    Codepoints der cmap. font_hash (Inhalts-Hash) gehört zum Cache-Key:
+    ein neuer Build unter demselben Pfad wird neu gelesen.
+    """
+    with TTFont(str(ttf), lazy=True) as font:
+        return frozenset(font.getBestCmap() or ())
+
+
+def covered_codepoints(
+    ttf: Path, font_hash: str, codepoints: tuple[int, ...]
+) -> tuple[int, ...]:
+    """codepoints ∩ cmap (sortiert). Raises FileNotFoundError."""
+    available = font_codepoints(ttf, font_hash)
+    return tuple(cp for cp in codepoints if cp in available)
+
+
+def subset_key(font_hash: str, codepoints: tuple[int, ...], flavor: str) -> str:
+    h = hashlib.sha256(",".join(f"{cp:x}" for cp in codepoints).encode("ascii"))
+    return f"{font_hash}-{h.hexdigest()[:32]}-{flavor}-v{SUBSET_VERSION}"
+
+
+def _subset_options(flavor: str) -> subset.Options:
+    options = subset.Options()
+    options.flavor = None if flavor == "ttf" else flavor
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+    options.recalc_timestamp = False
+    return options
+
+
+def render_subset(ttf: Path, codepoints: tuple[int, ...], flavor: str) -> bytes:
+    """ttf auf codepoints reduziert, kodiert als flavor ("ttf"/"woff"/"woff2")."""
+    options = _subset_options(flavor)
+    with TTFont(str(ttf), recalcTimestamp=False) as font:
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+        return _save(font, options.flavor)
+
+
+def subset_font(
+    ttf: Path,
+    codepoints: tuple[int, ...],
+    flavor: str,
+    key: str,
+    cache: SubsetCache,
+) -> bytes:
+    """Subset-Bytes (aus dem Cache oder frisch erzeugt)."""
+    data = cache.get_bytes(key, flavor)
+    if data is None:
+        data = render_subset(ttf, codepoints, flavor)
+        cache.put(key, data, flavor)
+    return data
@@ -0,0 +1,90 @@
+# BeeFontCore/services/zip_stream.py
+#
+# ZIP-Archive als Byte-Stream erzeugen (für StreamingHttpResponse):
+#
+# - zipfile schreibt in eine nicht-seekbare Senke (Data-Descriptor-Modus),
+#   nach jedem Block wird der bisher erzeugte Output herausgegeben
+# - Quelldateien werden blockweise aus dem Storage gelesen, nie komplett
+# - bereits komprimierte Formate (PNG, TTF, WOFF, …) werden nur
+#   gespeichert (ZIP_STORED), Text/SVG wird deflated
+#
+# Speicherbedarf pro Request: ein Block + zipfile-Verwaltung, unabhängig
+# von der Archivgröße. Das erste Byte geht raus, sobald die erste Datei
+# angefangen ist.
+
+import os
+import time
+import zipfile
+from typing import Iterable, Iterator
+
+from django.core.files.storage import default_storage
+from django.http import StreamingHttpResponse
+
+
+CHUNK_SIZE = 64 * 1024
+
+# schon komprimiert → Deflate bringt nichts außer CPU-Zeit
+STORED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".ttf", ".otf", ".woff", ".woff2", ".zip", ".gz"}
+
+
+class _ChunkSink:
+    """Minimales file-like Ziel für zipfile: sammelt, was geschrieben wird."""
+
+    def __init__(self):
+        self._parts: list[bytes] = []
+
+    def write(self, data) -> int:
+        if data:
+            self._parts.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> Iterator[bytes]:
+        if self._parts:
+            data = b"".join(self._parts)
+            self._parts = []
+            yield data
+
+
+def compress_type_for(arcname: str) -> int:
+    ext = os.path.splitext(arcname)[1].lower()
+    return zipfile.ZIP_STORED if ext in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+
+def stream_zip(entries: Iterable[tuple[str, str]], storage=default_storage) -> Iterator[bytes]:
+    """
+    entries: (arcname, Storage-Pfad). Fehlende Dateien werden übersprungen.
+    Liefert die Bytes des ZIP-Archivs blockweise.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w") as zf:
+        for arcname, rel_path in entries:
+            if not rel_path or not storage.exists(rel_path):
+                continue
+
+            try:
+                mtime = storage.get_modified_time(rel_path).timestamp()
+            except (NotImplementedError, OSError):
+                mtime = time.time()
+
+            zinfo = zipfile.ZipInfo(arcname, date_time=time.localtime(mtime)[:6])
+            zinfo.compress_type = compress_type_for(arcname)
+            zinfo.external_attr = 0o644 << 16
+
+            with storage.open(rel_path, "rb") as src, zf.open(zinfo, "w") as dst:
+                for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+                    dst.write(chunk)
+                    yield from sink.drain()
+            yield from sink.drain()
+
+    # Central Directory
+    yield from sink.drain()
+
+
+def zip_response(entries: Iterable[tuple[str, str]], filename: str):
+    """StreamingHttpResponse mit Content-Disposition für stream_zip()."""
+    response = StreamingHttpResponse(stream_zip(entries), content_type="application/zip")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
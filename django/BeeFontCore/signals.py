@@ -0,0 +1,18 @@
+# BeeFontCore/signals.py
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import FontBuild, FontJob
+
+
+@receiver(post_save, sender=FontBuild)
+@receiver(post_delete, sender=FontBuild)
+def bump_builds_version(sender, instance: FontBuild, **kwargs):
+    """
+    download_ttf-Cache (font_delivery) nach jeder Build-Änderung verwerfen:
+    builds_version liegt in der DB, damit sehen es alle Worker-Prozesse
+    (innerhalb der Transaktion → sichtbar zusammen mit der neuen Build-Zeile).
+    """
+    FontJob.objects.filter(pk=instance.job_id).update(builds_version=F("builds_version") + 1)
@@ -0,0 +1,36 @@
+# BeeFontCore/tests/conftest.py
+import pytest
+from django.contrib.auth import get_user_model
+
+from BeeFontCore.models import FontJob, JobPage, TemplateDefinition
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+@pytest.fixture
+def job(db, media_root):
+    user = get_user_model().objects.create_user(username="beefont", password="x")
+    return FontJob.objects.create(user=user, name="Test")
+
+
+@pytest.fixture
+def make_page(job):
+    template = TemplateDefinition.objects.create(code="T_2x2", description="Test", rows=2, cols=2)
+
+    def make(page_index=None, scan=True, **kwargs):
+        if page_index is None:
+            page_index = job.pages.count()
+        return JobPage.objects.create(
+            job=job,
+            page_index=page_index,
+            template=template,
+            letters="ABCD",
+            scan_image_path=f"scan_{page_index}.png" if scan else "",
+            **kwargs,
+        )
+
+    return make
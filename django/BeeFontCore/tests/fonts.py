@@ -0,0 +1,47 @@
+# BeeFontCore/tests/fonts.py
+#
+# Kleine Test-Fonts (fontTools) und Glyph-Bitmaps ohne FontForge/potrace.
+
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from PIL import Image, ImageDraw
+
+
+def _box(width: int):
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((0, 500))
+    pen.lineTo((width, 500))
+    pen.lineTo((width, 0))
+    pen.closePath()
+    return pen.glyph()
+
+
+def write_ttf(path, widths: dict[str, int] | str = "AB") -> None:
+    """TTF mit einem Rechteck pro Zeichen; widths: {Zeichen: Breite} oder Zeichenkette."""
+    if isinstance(widths, str):
+        widths = {ch: 500 for ch in widths}
+    names = {ch: f"uni{ord(ch):04X}" for ch in widths}
+    order = [".notdef", *names.values()]
+    glyphs = {".notdef": _box(500), **{names[ch]: _box(w) for ch, w in widths.items()}}
+
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder(order)
+    fb.setupCharacterMap({ord(ch): name for ch, name in names.items()})
+    fb.setupGlyf(glyphs)
+    fb.setupHorizontalMetrics({name: (600, 0) for name in order})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+    fb.setupOS2()
+    fb.setupPost()
+    fb.save(str(path))
+
+
+def write_glyph_png(path, width: int = 100, size: int = 256) -> None:
+    """Glyph-Bitmap im Format der Segmentierung: weißer Canvas, schwarzer Balken (width px)."""
+    im = Image.new("L", (size, size), 255)
+    ImageDraw.Draw(im).rectangle(
+        [(size - width) // 2, size // 4, (size + width) // 2, size * 3 // 4], fill=0
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    im.save(path)
@@ -0,0 +1,48 @@
+import unicodedata
+
+from BeeFontCore.services.alphabet import graphemes, merge_alphabets, parse_alphabet
+
+
+def test_graphemes_plain_letters():
+    assert graphemes("ABC") == ["A", "B", "C"]
+
+
+def test_graphemes_combining_marks_stay_attached():
+    nfd = unicodedata.normalize("NFD", "Åé")
+    assert graphemes(nfd) == ["Å", "é"]
+    # ohne vorkomponierte Form
+    assert graphemes("ŋ̈x") == ["ŋ̈", "x"]
+
+
+def test_graphemes_emoji_sequences():
+    family = "\U0001F469‍\U0001F4BB"          # ZWJ-Folge
+    thumbs = "\U0001F44D\U0001F3FD"                # Hautton-Modifier
+    heart = "❤️"                         # Variation Selector
+    assert graphemes(family + thumbs + heart) == [family, thumbs, heart]
+
+
+def test_graphemes_regional_indicator_pairs():
+    de = "\U0001F1E9\U0001F1EA"
+    fr = "\U0001F1EB\U0001F1F7"
+    assert graphemes(de + fr) == [de, fr]
+
+
+def test_parse_alphabet_normalizes_and_deduplicates():
+    alphabet = parse_alphabet(unicodedata.normalize("NFD", "AÅ Å\nB\tA"))
+    assert alphabet.tokens == ("A", "Å", "B")
+    assert alphabet.codepoint_set == {ord("A"), ord("Å"), ord("B")}
+    assert unicodedata.normalize("NFD", "Å") in alphabet
+    # NFD-Schreibweise für die Glyph-Abfrage
+    assert unicodedata.normalize("NFD", "Å") in alphabet.lookup_letters
+
+
+def test_multi_codepoint_tokens_do_not_count_for_coverage():
+    alphabet = parse_alphabet("ABŋ̈")
+    assert alphabet.unmapped == ("ŋ̈",)
+    assert alphabet.missing({"A"}) == ["B"]
+    assert alphabet.missing({"A", "B"}) == []
+
+
+def test_merge_alphabets_keeps_first_occurrence_order():
+    merged = merge_alphabets([parse_alphabet("CAB"), parse_alphabet("BDA")])
+    assert merged.tokens == ("C", "A", "B", "D")
@@ -0,0 +1,77 @@
+from django.db import connection
+from django.utils.timezone import now
+
+from BeeFontCore.models import PageAnalysisTask
+from BeeFontCore.services import analysis_queue
+
+
+def _url(job):
+    return f"/api/beefont/jobs/{job.sid}/pages/analyse-pending/"
+
+
+def test_returns_202_with_open_tasks(api_client, job, make_page):
+    pages = [make_page(), make_page()]
+    make_page(scan=False)
+    make_page(analysed_at=now())
+    api_client.force_authenticate(job.user)
+
+    res = api_client.post(_url(job))
+
+    assert res.status_code == 202
+    assert res.data["queued_pages"] == 2
+    assert [t["page_id"] for t in res.data["tasks"]] == [p.pk for p in pages]
+    assert {t["status"] for t in res.data["tasks"]} == {"queued"}
+
+
+def test_pages_are_enqueued_once(api_client, job, make_page):
+    make_page()
+    make_page()
+    api_client.force_authenticate(job.user)
+
+    first = api_client.post(_url(job))
+    second = api_client.post(_url(job))
+
+    assert second.data["queued_pages"] == 0
+    assert [t["id"] for t in second.data["tasks"]] == [t["id"] for t in first.data["tasks"]]
+    assert PageAnalysisTask.objects.filter(job=job).count() == 2
+
+
+def test_page_with_open_task_is_not_enqueued_again(job, make_page):
+    page = make_page()
+    task = analysis_queue.enqueue_page_analysis(job, page)
+
+    created, tasks = analysis_queue.enqueue_pending_pages(job)
+
+    assert created == 0
+    assert [t.pk for t in tasks] == [task.pk]
+
+
+def test_pending_pages_are_read_under_the_job_lock(job, make_page, monkeypatch):
+    make_page()
+    calls = []
+    lock_job, pending_pages = analysis_queue._lock_job, analysis_queue.pending_pages
+
+    def spy_lock(j):
+        calls.append(("lock", len(connection.atomic_blocks)))
+        return lock_job(j)
+
+    def spy_pending(j):
+        calls.append(("pending", len(connection.atomic_blocks)))
+        return pending_pages(j)
+
+    monkeypatch.setattr(analysis_queue, "_lock_job", spy_lock)
+    monkeypatch.setattr(analysis_queue, "pending_pages", spy_pending)
+
+    depth = len(connection.atomic_blocks)
+    analysis_queue.enqueue_pending_pages(job)
+
+    # Sperre vor dem Lesen der offenen Seiten, beides im selben atomic()-Block
+    assert calls == [("lock", depth + 1), ("pending", depth + 1)]
+
+
+def test_other_users_job_is_not_found(api_client, job, make_page, django_user_model):
+    make_page()
+    api_client.force_authenticate(django_user_model.objects.create_user(username="other", password="x"))
+
+    assert api_client.post(_url(job)).status_code == 404
+    assert not PageAnalysisTask.objects.exists()
@@ -0,0 +1,125 @@
+import time
+from datetime import timedelta
+
+from django.utils.timezone import now
+
+from BeeFontCore.models import PageAnalysisTask
+from BeeFontCore.services import analysis_queue
+from BeeFontCore.services.analysis_queue import (
+    claim_next_task,
+    enqueue_page_analysis,
+    requeue_stale_tasks,
+    requeue_tasks,
+    run_worker,
+    send_heartbeat,
+)
+
+
+Status = PageAnalysisTask.Status
+
+
+def hang(task_id):
+    """Pool-Funktion für run_worker(execute=...): simuliert einen hängenden Analyse-Prozess."""
+    time.sleep(600)
+    return True
+
+
+def _running(task, *, heartbeat_age=None, started_age=0, attempts=1, worker="w1"):
+    PageAnalysisTask.objects.filter(pk=task.pk).update(
+        status=Status.RUNNING,
+        attempts=attempts,
+        worker=worker,
+        started_at=now() - timedelta(seconds=started_age),
+        heartbeat_at=None if heartbeat_age is None else now() - timedelta(seconds=heartbeat_age),
+    )
+    task.refresh_from_db()
+    return task
+
+
+def test_enqueue_returns_open_task(job, make_page):
+    page = make_page()
+    first = enqueue_page_analysis(job, page)
+
+    assert enqueue_page_analysis(job, page).pk == first.pk
+    assert PageAnalysisTask.objects.count() == 1
+
+
+def test_claim_takes_oldest_queued_task(job, make_page):
+    first = enqueue_page_analysis(job, make_page())
+    second = enqueue_page_analysis(job, make_page())
+
+    claimed = claim_next_task("w1")
+
+    assert claimed.pk == first.pk
+    assert claimed.status == Status.RUNNING
+    assert claimed.attempts == 1
+    assert claimed.worker == "w1"
+    assert claimed.heartbeat_at is not None
+    assert claim_next_task("w2").pk == second.pk
+    assert claim_next_task("w3") is None
+
+
+def test_heartbeat_only_touches_own_running_tasks(job, make_page):
+    own = _running(enqueue_page_analysis(job, make_page()), heartbeat_age=100)
+    other = _running(enqueue_page_analysis(job, make_page()), heartbeat_age=100, worker="w2")
+
+    assert send_heartbeat("w1", [own.pk, other.pk]) == 1
+    own.refresh_from_db()
+    other.refresh_from_db()
+    assert now() - own.heartbeat_at < timedelta(seconds=5)
+    assert now() - other.heartbeat_at > timedelta(seconds=90)
+
+
+def test_requeue_stale_tasks(job, make_page, settings):
+    settings.BEEFONT_ANALYSIS_HEARTBEAT_TIMEOUT = 60
+    settings.BEEFONT_ANALYSIS_MAX_ATTEMPTS = 3
+
+    alive = _running(enqueue_page_analysis(job, make_page()), heartbeat_age=10, started_age=3600)
+    stale = _running(enqueue_page_analysis(job, make_page()), heartbeat_age=120)
+    legacy = _running(enqueue_page_analysis(job, make_page()), started_age=120)
+    exhausted = _running(enqueue_page_analysis(job, make_page()), heartbeat_age=120, attempts=3)
+
+    assert requeue_stale_tasks() == 3
+
+    statuses = dict(PageAnalysisTask.objects.values_list("pk", "status"))
+    assert statuses[alive.pk] == Status.RUNNING
+    assert statuses[stale.pk] == Status.QUEUED
+    assert statuses[legacy.pk] == Status.QUEUED
+    assert statuses[exhausted.pk] == Status.FAILED
+
+
+def test_requeue_tasks_leaves_finished_tasks(job, make_page):
+    running = _running(enqueue_page_analysis(job, make_page()))
+    done = _running(enqueue_page_analysis(job, make_page()))
+    PageAnalysisTask.objects.filter(pk=done.pk).update(status=Status.DONE)
+
+    assert requeue_tasks([running.pk, done.pk]) == 1
+    assert PageAnalysisTask.objects.get(pk=done.pk).status == Status.DONE
+
+
+def test_hung_task_is_failed_after_deadline(job, make_page):
+    task = enqueue_page_analysis(job, make_page())
+    logs = []
+
+    t0 = time.monotonic()
+    run_worker(
+        concurrency=1,
+        poll_interval=0.05,
+        once=True,
+        log=logs.append,
+        task_timeout=1,
+        execute=hang,
+    )
+
+    assert time.monotonic() - t0 < 60
+    task.refresh_from_db()
+    assert task.status == Status.FAILED
+    assert "Timeout" in task.error
+    assert any("timed out" in line for line in logs)
+
+
+def test_fail_timed_out_task_keeps_finished_task(job, make_page):
+    task = _running(enqueue_page_analysis(job, make_page()))
+    PageAnalysisTask.objects.filter(pk=task.pk).update(status=Status.DONE)
+
+    assert analysis_queue.fail_timed_out_task(task.pk, 10) == 0
@@ -0,0 +1,73 @@
+import pytest
+
+from BeeFontCore.models import FontBuild, Glyph, SupportedLanguage
+from BeeFontCore.services import batch_build, build_font, build_store
+from BeeFontCore.services.job_paths import job_sid_media
+
+from .fonts import write_glyph_png
+
+
+@pytest.fixture
+def languages(db):
+    return [
+        SupportedLanguage.objects.create(code="zz", name="Test", alphabet="AB"),
+        SupportedLanguage.objects.create(code="zy", name="Test 2", alphabet="BA"),
+    ]
+
+
+@pytest.fixture
+def glyphs(job, media_root, settings):
+    settings.BEEFONT_FONT_BUILDER = "fonttools"
+    settings.BEEFONT_TRACE_BACKEND = "opencv"
+    settings.BEEFONT_BUILD_WEBFONTS = False
+    for letter in "AB":
+        rel = f"{job_sid_media(job)}/glyphs/{letter}_v0.png"
+        write_glyph_png(media_root / rel)
+        Glyph.objects.create(
+            job=job, cell_index=-1, letter=letter, variant_index=0,
+            image_path=rel, formattype="png", is_default=True,
+        )
+
+
+def _builds(job):
+    return {b.language_id: b for b in FontBuild.objects.filter(job=job)}
+
+
+def test_failed_target_keeps_previous_build(job, languages, glyphs, monkeypatch):
+    first = batch_build.run_batch_build(job, languages, [build_font.BUILD_KIND_PNG])
+    assert all(b.success for b in first.builds)
+    before = _builds(job)
+
+    build_incremental = build_font.build_font_incremental
+
+    def fail_for_zy(kind, job, language, *args, **kwargs):
+        if language.code == "zy":
+            raise RuntimeError("trace failed")
+        return build_incremental(kind, job, language, *args, **kwargs)
+
+    monkeypatch.setattr(build_font, "build_font_incremental", fail_for_zy)
+    batch_build.run_batch_build(job, languages, [build_font.BUILD_KIND_PNG])
+    after = _builds(job)
+
+    assert after["zz"].success
+    assert not after["zy"].success
+    assert after["zy"].log == "trace failed"
+    assert after["zy"].ttf_path == before["zy"].ttf_path
+    assert after["zy"].manifest == before["zy"].manifest
+
+    # nächster Build findet das Manifest wieder → kein kompletter Neubau
+    monkeypatch.setattr(build_font, "build_font_incremental", build_incremental)
+    batch_build.run_batch_build(job, languages, [build_font.BUILD_KIND_PNG])
+    rebuilt = _builds(job)["zy"]
+    assert rebuilt.success
+    assert rebuilt.manifest["last_build"]["mode"] == "reuse"
+
+
+def test_failed_first_build_stores_empty_path(job, languages):
+    build = build_store.save_build_result(
+        job, languages[0], "png", FontBuild.FontBuildStyle.MONO, success=False, log="boom"
+    )
+
+    assert build.ttf_path == ""
+    assert build.manifest == {}
+    assert not build.success
@@ -0,0 +1,163 @@
+import unicodedata
+
+import pytest
+from fontTools.ttLib import TTFont
+
+from BeeFontCore.models import Glyph, SupportedLanguage
+from BeeFontCore.services import build_font
+from BeeFontCore.services.build_font import (
+    BUILD_KIND_PNG,
+    _changed_tokens,
+    _splice_glyphs,
+    build_font_incremental,
+)
+from BeeFontCore.services.job_paths import job_sid_media
+
+from .fonts import write_glyph_png, write_ttf
+
+
+HEADER = {"version": 1, "kind": "png", "builder": "fonttools"}
+
+
+def _manifest(glyphs: dict[str, str | None], **header):
+    return {
+        **HEADER,
+        **header,
+        "glyphs": {t: {"sha256": sha, "name": f"uni{ord(t):04X}" if sha else None} for t, sha in glyphs.items()},
+    }
+
+
+@pytest.fixture
+def ttf(tmp_path):
+    path = tmp_path / "font.ttf"
+    write_ttf(path, "AB")
+    return path
+
+
+# ---------------------------
+# _changed_tokens
+# ---------------------------
+
+def test_changed_tokens(ttf):
+    previous = _manifest({"A": "a1", "B": "b1"})
+    assert _changed_tokens(previous, HEADER, {"A": "a1", "B": "b2"}, ttf) == {"B"}
+    assert _changed_tokens(previous, HEADER, {"A": "a1", "B": "b1"}, ttf) == set()
+
+
+def test_changed_tokens_retries_failed_glyphs(ttf):
+    previous = _manifest({"A": "a1", "B": None})
+    assert _changed_tokens(previous, HEADER, {"A": "a1", "B": "b1"}, ttf) == {"B"}
+
+
+@pytest.mark.parametrize(
+    "previous, hashes",
+    [
+        (None, {"A": "a1"}),                                        # erster Build
+        (_manifest({"A": "a1"}, builder="fontforge"), {"A": "a1"}),  # anderer Builder
+        (_manifest({"A": "a1"}), {"A": "a1", "B": "b1"}),            # andere Glyphenmenge
+    ],
+)
+def test_changed_tokens_requires_full_build(ttf, previous, hashes):
+    assert _changed_tokens(previous, HEADER, hashes, ttf) is None
+
+
+def test_changed_tokens_requires_existing_ttf(tmp_path):
+    previous = _manifest({"A": "a1"})
+    assert _changed_tokens(previous, HEADER, {"A": "a1"}, tmp_path / "missing.ttf") is None
+
+
+# ---------------------------
+# _splice_glyphs
+# ---------------------------
+
+def _x_max(path, ch):
+    font = TTFont(str(path))
+    glyph = font["glyf"][font.getBestCmap()[ord(ch)]]
+    glyph.recalcBounds(font["glyf"])
+    return glyph.xMax
+
+
+def test_splice_replaces_only_given_glyphs(tmp_path, ttf):
+    partial = tmp_path / "partial.ttf"
+    write_ttf(partial, {"A": 300})
+
+    assert _splice_glyphs(ttf, partial, ["A"]) == 1
+    assert _x_max(ttf, "A") == 300
+    assert _x_max(ttf, "B") == 500
+
+
+def test_splice_rejects_changed_glyph_set(tmp_path, ttf):
+    partial = tmp_path / "partial.ttf"
+    write_ttf(partial, {"C": 300})
+
+    with pytest.raises(ValueError):
+        _splice_glyphs(ttf, partial, ["C"])
+    assert _x_max(ttf, "A") == 500
+
+
+# ---------------------------
+# build_font_incremental
+# ---------------------------
+
+@pytest.fixture
+def fonttools_build(settings):
+    settings.BEEFONT_FONT_BUILDER = "fonttools"
+    settings.BEEFONT_TRACE_BACKEND = "opencv"
+    settings.BEEFONT_OUTLINE_CACHE_MB = 0
+
+
+def _glyph(job, media_root, letter, width):
+    rel = f"{job_sid_media(job)}/glyphs/{len(letter)}_{ord(letter[0]):x}.png"
+    write_glyph_png(media_root / rel, width)
+    return Glyph.objects.create(
+        job=job, cell_index=-1, letter=letter, variant_index=0,
+        image_path=rel, formattype="png", is_default=True,
+    )
+
+
+def _build(job, language, out, previous=None):
+    glyphs = Glyph.objects.filter(job=job, is_default=True)
+    log, manifest = build_font_incremental(BUILD_KIND_PNG, job, language, glyphs, out, previous)
+    return log.text(), manifest
+
+
+def test_incremental_build_counts(job, media_root, fonttools_build, tmp_path):
+    # Å als NFD gespeichert (z.B. ZIP-Namen von macOS)
+    language = SupportedLanguage.objects.create(code="zz", name="Test", alphabet="AÅ")
+    _glyph(job, media_root, "A", 100)
+    nfd = _glyph(job, media_root, unicodedata.normalize("NFD", "Å"), 100)
+    out = tmp_path / "out.ttf"
+
+    log, manifest = _build(job, language, out)
+    assert manifest["last_build"] == {"mode": "full", "reused": 0, "rebuilt": 2}
+    assert set(manifest["glyphs"]) == {"A", "Å"}
+
+    log, manifest = _build(job, language, out, manifest)
+    assert manifest["last_build"] == {"mode": "reuse", "reused": 2, "rebuilt": 0}
+
+    write_glyph_png(media_root / nfd.image_path, 160)
+    log, manifest = _build(job, language, out, manifest)
+    assert manifest["last_build"] == {"mode": "patch", "reused": 1, "rebuilt": 1}
+    assert "full rebuild" not in log
+
+
+def test_patch_builds_only_changed_glyphs(job, media_root, fonttools_build, tmp_path, monkeypatch):
+    language = SupportedLanguage.objects.create(code="zz", name="Test", alphabet="AB")
+    _glyph(job, media_root, "A", 100)
+    b = _glyph(job, media_root, "B", 100)
+    out = tmp_path / "out.ttf"
+    _log, manifest = _build(job, language, out)
+
+    built = []
+    build_png = build_font.build_ttf_png
+
+    def spy(job, language, default_glyphs, out_ttf, cache=None):
+        built.append(sorted(g.letter for g in default_glyphs))
+        return build_png(job, language, default_glyphs, out_ttf, cache)
+
+    monkeypatch.setattr(build_font, "build_ttf_png", spy)
+    write_glyph_png(media_root / b.image_path, 160)
+    _log, manifest = _build(job, language, out, manifest)
+
+    assert built == [["B"]]
+    assert manifest["last_build"]["mode"] == "patch"
@@ -0,0 +1,39 @@
+import os
+import time
+
+from BeeFontCore.services import build_store
+
+from .fonts import write_ttf
+
+
+def test_commit_is_content_addressed(job, media_root, settings):
+    settings.BEEFONT_BUILD_WEBFONTS = False
+
+    with build_store.workspace(job, "Test_de_png.ttf") as work:
+        write_ttf(work)
+        first = build_store.commit(job, work)
+    with build_store.workspace(job, "Test_fr_png.ttf") as work:
+        write_ttf(work)
+        second = build_store.commit(job, work)
+
+    assert first == second
+    assert build_store.is_store_name(os.path.basename(first))
+    # Arbeitsverzeichnisse sind wieder weg
+    assert os.listdir(build_store.build_dir(job)) == [os.path.basename(first)]
+
+
+def test_commit_refreshes_mtime_of_reused_file(job, media_root, settings):
+    settings.BEEFONT_BUILD_WEBFONTS = False
+
+    with build_store.workspace(job, "Test_de_png.ttf") as work:
+        write_ttf(work)
+        rel = build_store.commit(job, work)
+    target = media_root / rel
+    old = time.time() - 48 * 3600
+    os.utime(target, (old, old))
+
+    with build_store.workspace(job, "Test_de_png.ttf") as work:
+        write_ttf(work)
+        assert build_store.commit(job, work) == rel
+
+    assert target.stat().st_mtime > old + 3600
@@ -0,0 +1,145 @@
+import pytest
+from django.utils.http import http_date
+
+from BeeFontCore.models import FontBuild, FontJob, SupportedLanguage
+from BeeFontCore.services import font_delivery
+from BeeFontCore.services.job_paths import job_sid_media
+
+
+FONT_BYTES = bytes(range(256)) * 4   # 1024 Bytes, kein echter Font nötig (TTF wird nicht geparst)
+
+
+@pytest.fixture
+def language(db):
+    return SupportedLanguage.objects.get_or_create(code="zz", defaults={"name": "Test", "alphabet": "AB"})[0]
+
+
+def _store_build(job, language, media_root, content_hash, data=FONT_BYTES, **kwargs):
+    rel = f"{job_sid_media(job)}/build/{content_hash}.ttf"
+    path = media_root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return FontBuild.objects.create(job=job, language=language, ttf_path=rel, **kwargs)
+
+
+@pytest.fixture
+def build(job, language, media_root):
+    return _store_build(job, language, media_root, "a" * 32)
+
+
+def _url(job):
+    return f"/api/beefont/jobs/{job.sid}/download/ttf/zz/"
+
+
+def test_full_download(api_client, job, build):
+    res = api_client.get(_url(job))
+
+    assert res.status_code == 200
+    assert b"".join(res.streaming_content) == FONT_BYTES
+    assert res["ETag"] == f'"{"a" * 32}"'
+    assert res["Accept-Ranges"] == "bytes"
+    assert res["Content-Type"] == "font/ttf"
+
+
+def test_if_none_match_returns_304(api_client, job, build):
+    etag = api_client.get(_url(job))["ETag"]
+
+    res = api_client.get(_url(job), HTTP_IF_NONE_MATCH=etag)
+
+    assert res.status_code == 304
+    assert res["ETag"] == etag
+    assert not res.content
+
+
+def test_if_none_match_other_etag_returns_200(api_client, job, build):
+    res = api_client.get(_url(job), HTTP_IF_NONE_MATCH='"other"')
+    assert res.status_code == 200
+
+
+def test_if_modified_since_returns_304(api_client, job, build):
+    last_modified = api_client.get(_url(job))["Last-Modified"]
+
+    res = api_client.get(_url(job), HTTP_IF_MODIFIED_SINCE=last_modified)
+
+    assert res.status_code == 304
+
+
+def test_if_modified_since_older_returns_200(api_client, job, build):
+    res = api_client.get(_url(job), HTTP_IF_MODIFIED_SINCE=http_date(0))
+    assert res.status_code == 200
+
+
+def test_range_returns_206(api_client, job, build):
+    res = api_client.get(_url(job), HTTP_RANGE="bytes=10-19")
+
+    assert res.status_code == 206
+    assert res.content == FONT_BYTES[10:20]
+    assert res["Content-Range"] == f"bytes 10-19/{len(FONT_BYTES)}"
+
+
+def test_suffix_range_returns_206(api_client, job, build):
+    res = api_client.get(_url(job), HTTP_RANGE="bytes=-16")
+
+    assert res.status_code == 206
+    assert res.content == FONT_BYTES[-16:]
+
+
+def test_unsatisfiable_range_returns_416(api_client, job, build):
+    res = api_client.get(_url(job), HTTP_RANGE=f"bytes={len(FONT_BYTES)}-")
+
+    assert res.status_code == 416
+    assert res["Content-Range"] == f"bytes */{len(FONT_BYTES)}"
+
+
+def test_if_range_matching_etag_returns_206(api_client, job, build):
+    etag = api_client.get(_url(job))["ETag"]
+
+    res = api_client.get(_url(job), HTTP_RANGE="bytes=0-3", HTTP_IF_RANGE=etag)
+
+    assert res.status_code == 206
+    assert res.content == FONT_BYTES[:4]
+
+
+def test_if_range_stale_etag_returns_full_file(api_client, job, build):
+    res = api_client.get(_url(job), HTTP_RANGE="bytes=0-3", HTTP_IF_RANGE='"stale"')
+
+    assert res.status_code == 200
+    assert b"".join(res.streaming_content) == FONT_BYTES
+
+
+def test_no_build_returns_404(api_client, job, language):
+    assert api_client.get(_url(job)).status_code == 404
+
+
+def test_build_save_and_delete_bump_builds_version(job, language, media_root):
+    before = FontJob.objects.get(pk=job.pk).builds_version
+
+    build = _store_build(job, language, media_root, "a" * 32)
+    after_save = FontJob.objects.get(pk=job.pk).builds_version
+    build.delete()
+    after_delete = FontJob.objects.get(pk=job.pk).builds_version
+
+    assert before < after_save < after_delete
+
+
+def test_new_build_replaces_cached_font(api_client, job, language, media_root, build):
+    assert api_client.get(_url(job))["ETag"] == f'"{"a" * 32}"'   # jetzt im Cache
+
+    _store_build(job, language, media_root, "b" * 32, style=FontBuild.FontBuildStyle.COLOR)
+
+    assert api_client.get(_url(job))["ETag"] == f'"{"b" * 32}"'
+
+
+def test_deleted_build_is_not_served_from_cache(api_client, job, build):
+    assert api_client.get(_url(job)).status_code == 200
+
+    build.delete()
+
+    assert api_client.get(_url(job)).status_code == 404
+
+
+def test_vanished_file_is_resolved_again(api_client, job, language, media_root, build):
+    assert font_delivery.resolve_font(job.sid, "zz") is not None   # im Cache
+    (media_root / build.ttf_path).unlink()
+
+    assert api_client.get(_url(job)).status_code == 404
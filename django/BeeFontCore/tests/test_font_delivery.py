@@ -0,0 +1,43 @@
+import pytest
+
+from BeeFontCore.services.font_delivery import UNSATISFIABLE, parse_range
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("bytes=0-99", (0, 99)),
+        ("bytes=10-", (10, 999)),
+        ("bytes=-100", (900, 999)),
+        ("bytes=-5000", (0, 999)),       # Suffix länger als Datei → ganze Datei
+        ("bytes=990-5000", (990, 999)),  # Ende wird gekappt
+        ("bytes=999-999", (999, 999)),
+    ],
+)
+def test_parse_range_valid(header, expected):
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize(
+    "header",
+    [
+        None,
+        "",
+        "items=0-10",
+        "bytes=0-10,20-30",   # mehrteilig → ganze Datei
+        "bytes=abc",
+        "bytes=a-b",
+        "bytes=20-10",
+    ],
+)
+def test_parse_range_ignored(header):
+    assert parse_range(header, 1000) is None
+
+
+@pytest.mark.parametrize("header", ["bytes=1000-", "bytes=5000-6000", "bytes=-0"])
+def test_parse_range_unsatisfiable(header):
+    assert parse_range(header, 1000) == UNSATISFIABLE
+
+
+def test_parse_range_empty_file():
+    assert parse_range("bytes=0-", 0) == UNSATISFIABLE
@@ -0,0 +1,79 @@
+import pytest
+from django.core.exceptions import SuspiciousFileOperation
+
+from BeeFontCore.models import Glyph
+from BeeFontCore.services.glyph_ingest import GlyphUpload, glyph_rel_path, ingest_glyphs
+
+
+def _variants(job):
+    return list(
+        Glyph.objects.filter(job=job)
+        .order_by("letter", "formattype", "variant_index")
+        .values_list("letter", "formattype", "variant_index", "is_default")
+    )
+
+
+def test_first_variant_becomes_default(job):
+    created = ingest_glyphs(job, [
+        GlyphUpload(letter="A", formattype="png", data=b"a0"),
+        GlyphUpload(letter="A", formattype="png", data=b"a1"),
+        GlyphUpload(letter="A", formattype="svg", data=b"<svg/>"),
+        GlyphUpload(letter="B", formattype="png", data=b"b0"),
+    ])
+    assert [g.letter for g in created] == ["A", "A", "A", "B"]
+    assert _variants(job) == [
+        ("A", "png", 0, True),
+        ("A", "png", 1, False),
+        ("A", "svg", 0, True),
+        ("B", "png", 0, True),
+    ]
+
+
+def test_variant_index_continues_after_existing(job, media_root):
+    ingest_glyphs(job, [GlyphUpload(letter="A", formattype="png", data=b"a0")])
+    created = ingest_glyphs(job, [GlyphUpload(letter="A", formattype="png", data=b"a1")])
+
+    assert _variants(job) == [("A", "png", 0, True), ("A", "png", 1, False)]
+    assert (media_root / created[0].image_path).read_bytes() == b"a1"
+
+
+def test_new_variant_becomes_default_when_none_exists(job):
+    ingest_glyphs(job, [
+        GlyphUpload(letter="A", formattype="png", data=b"a0"),
+        GlyphUpload(letter="A", formattype="png", data=b"a1"),
+    ])
+    Glyph.objects.filter(job=job, is_default=True).delete()
+
+    created = ingest_glyphs(job, [GlyphUpload(letter="A", formattype="png", data=b"a2")])
+
+    assert created[0].variant_index == 2
+    assert created[0].is_default
+    assert Glyph.objects.filter(job=job, letter="A", is_default=True).count() == 1
+
+
+def test_existing_file_is_not_overwritten(job, media_root):
+    stale = media_root / glyph_rel_path(job, "A", 0, "png")
+    stale.parent.mkdir(parents=True)
+    stale.write_bytes(b"stale")
+
+    created = ingest_glyphs(job, [GlyphUpload(letter="A", formattype="png", data=b"new")])
+
+    assert stale.read_bytes() == b"stale"
+    assert created[0].image_path != glyph_rel_path(job, "A", 0, "png")
+    assert (media_root / created[0].image_path).read_bytes() == b"new"
+
+
+def test_src_path_is_moved_into_place(job, media_root):
+    src = media_root / "upload.tmp"
+    src.write_bytes(b"moved")
+
+    created = ingest_glyphs(job, [GlyphUpload(letter="A", formattype="png", src_path=src)])
+
+    assert not src.exists()
+    assert (media_root / created[0].image_path).read_bytes() == b"moved"
+
+
+def test_path_traversal_is_rejected(job):
+    with pytest.raises(SuspiciousFileOperation):
+        ingest_glyphs(job, [GlyphUpload(letter="../" * 6 + "x", formattype="png", data=b"x")])
+    assert not Glyph.objects.filter(job=job).exists()
@@ -0,0 +1,124 @@
+import io
+import os
+import time
+import zipfile
+
+import pytest
+
+from BeeFontCore.models import Glyph
+from BeeFontCore.services.glyph_zip_import import (
+    PNG_SIGNATURE,
+    STAGING_PREFIX,
+    ZipImportError,
+    import_glyph_zip,
+    letter_from_name,
+)
+from BeeFontCore.services.job_paths import job_sid_media
+from BeeFontCore.services.media_gc import collect_garbage
+
+
+def _png(size=64):
+    return PNG_SIGNATURE + b"\0" * (size - len(PNG_SIGNATURE))
+
+
+def _zip(members: dict[str, bytes]) -> io.BytesIO:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    buf.seek(0)
+    return buf
+
+
+@pytest.mark.parametrize(
+    "name, letter",
+    [("A.png", "A"), ("A_v3.png", "A"), ("Ä_foo.svg", "Ä"), ("_x.png", "")],
+)
+def test_letter_from_name(name, letter):
+    assert letter_from_name(name) == letter
+
+
+def test_import_counts_skipped_members(job, media_root):
+    upload = _zip({
+        "A.png": _png(),
+        "dir/B_v2.png": _png(),
+        "C.svg": b"<svg/>",
+        "_x.png": _png(),
+        "D.png": b"not a png",
+    })
+
+    result = import_glyph_zip(job, "png", upload)
+
+    assert result.imported == 2
+    assert result.skipped_non_matching_ext == 1
+    assert result.skipped_empty_letter == 1
+    assert result.skipped_invalid == 1
+    assert not result.truncated
+    assert sorted(Glyph.objects.filter(job=job).values_list("letter", flat=True)) == ["A", "B"]
+    # Staging (neben glyphs/) ist wieder weg
+    job_dir = (media_root / Glyph.objects.filter(job=job).first().image_path).parent.parent
+    assert not [p for p in job_dir.iterdir() if p.name.startswith(STAGING_PREFIX)]
+
+
+def test_member_limit_truncates(job, settings):
+    settings.BEEFONT_ZIP_IMPORT_MAX_MEMBERS = 3
+    upload = _zip({f"L{i}.png": _png() for i in range(5)})
+
+    result = import_glyph_zip(job, "png", upload)
+
+    assert result.imported == 3
+    assert result.truncated
+
+
+def test_oversized_member_is_skipped(job, settings):
+    settings.BEEFONT_ZIP_IMPORT_MAX_MEMBER_MB = 1 / 1024  # 1 KiB
+    upload = _zip({"A.png": _png(), "B.png": _png(4096), "C.png": _png()})
+
+    result = import_glyph_zip(job, "png", upload)
+
+    assert result.imported == 2
+    assert result.skipped_too_large == 1
+    assert not result.truncated
+
+
+def test_total_limit_truncates(job, settings):
+    settings.BEEFONT_ZIP_IMPORT_MAX_TOTAL_MB = 2.5 / 1024  # 2.5 KiB
+    upload = _zip({f"L{i}.png": _png(1024) for i in range(4)})
+
+    result = import_glyph_zip(job, "png", upload)
+
+    assert result.imported == 2
+    assert result.bytes_extracted == 2048
+    assert result.truncated
+
+
+def test_failed_batch_is_reported(job, monkeypatch):
+    def fail(job, batch):
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr("BeeFontCore.services.glyph_zip_import.ingest_glyphs", fail)
+
+    result = import_glyph_zip(job, "png", _zip({"A.png": _png(), "B.png": _png()}))
+
+    assert result.imported == 0
+    assert result.skipped_errors == 2
+    assert result.errors == ["batch of 2 glyphs failed: RuntimeError: disk full"]
+
+
+def test_invalid_archive(job):
+    with pytest.raises(ZipImportError):
+        import_glyph_zip(job, "png", io.BytesIO(b"junk"))
+
+
+def test_gc_removes_abandoned_staging(job, media_root):
+    staging = media_root / job_sid_media(job) / f"{STAGING_PREFIX}abc"
+    staging.mkdir(parents=True)
+    (staging / "1.png").write_bytes(_png())
+    t = time.time() - 48 * 3600
+    for path in (staging / "1.png", staging):
+        os.utime(path, (t, t))
+
+    stats = collect_garbage()
+
+    assert not staging.exists()
+    assert stats.files == {"staging": 1}
@@ -0,0 +1,65 @@
+import os
+import time
+
+from BeeFontCore.models import FontBuild, Glyph, SupportedLanguage
+from BeeFontCore.services.job_paths import job_sid_media
+from BeeFontCore.services.media_gc import _referenced_paths, collect_garbage
+
+
+def _touch(path, age_hours=48):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x")
+    t = time.time() - age_hours * 3600
+    os.utime(path, (t, t))
+    return path
+
+
+def _build(job, ttf_path, fmt="png"):
+    lang, _ = SupportedLanguage.objects.get_or_create(code="zz", defaults={"name": "Test", "alphabet": "AB"})
+    return FontBuild.objects.create(job=job, language=lang, glyph_formattype=fmt, ttf_path=ttf_path)
+
+
+def test_referenced_paths_include_web_font_siblings(job):
+    base = f"{job_sid_media(job)}/build/abc"
+    _build(job, f"{base}.ttf")
+    _build(job, "", fmt="svg")
+    Glyph.objects.create(
+        job=job, cell_index=-1, letter="A", variant_index=0,
+        image_path=f"{job_sid_media(job)}/glyphs/A_v0.png", formattype="png",
+    )
+
+    builds, glyphs = _referenced_paths()
+
+    assert builds == {os.path.normpath(f"{base}.{ext}") for ext in ("ttf", "woff", "woff2")}
+    assert glyphs == {os.path.normpath(f"{job_sid_media(job)}/glyphs/A_v0.png")}
+
+
+def test_collect_garbage(job, media_root):
+    job_dir = media_root / job_sid_media(job)
+    _build(job, f"{job_sid_media(job)}/build/abc.ttf")
+
+    keep = [
+        _touch(job_dir / "build" / "abc.ttf"),
+        _touch(job_dir / "build" / "abc.woff2"),
+        _touch(job_dir / "build" / "new.ttf", age_hours=0),   # Schonfrist
+    ]
+    gone = [
+        _touch(job_dir / "build" / "old.ttf"),
+        _touch(job_dir / "build" / "old.woff"),
+        _touch(job_dir / "glyphs" / "orphan.png"),
+    ]
+
+    stats = collect_garbage(debug_days=7)
+
+    assert all(p.exists() for p in keep)
+    assert not any(p.exists() for p in gone)
+    assert stats.files == {"build": 2, "glyphs": 1}
+
+
+def test_collect_garbage_dry_run(job, media_root):
+    orphan = _touch(media_root / job_sid_media(job) / "glyphs" / "orphan.png")
+
+    stats = collect_garbage(dry_run=True)
+
+    assert orphan.exists()
+    assert stats.total_files == 1
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from BeeFontCore.services import segment
+from BeeFontCore.services.segment import _cell_worker_count, extract_cells
+
+
+def _page(rows=4, cols=5, cell=120, seed=7):
+    """Maske mit einem Gitter aus Zellen, zufällige Striche pro Zelle, einige leer."""
+    rng = np.random.default_rng(seed)
+    mask = np.zeros((rows * cell, cols * cell), dtype=np.uint8)
+    cells = []
+    for r in range(rows):
+        for c in range(cols):
+            y0, x0 = r * cell, c * cell
+            cells.append((y0, y0 + cell, x0, x0 + cell))
+            if rng.random() < 0.2:
+                continue
+            for _ in range(3):
+                y, x = rng.integers(40, cell - 30, 2)
+                h, w = rng.integers(5, 25, 2)
+                mask[y0 + y:y0 + y + h, x0 + x:x0 + x + w] = 1
+    return mask, cells
+
+
+def test_extract_cells_same_result_with_threads(settings):
+    mask, cells = _page()
+    letters = "ABCDEFGHIJKLMNOPQRST"
+
+    settings.BEEFONT_CELL_WORKERS = 1
+    serial = extract_cells(mask, cells, letters, canvas_size=128, canvas_margin=8)
+    settings.BEEFONT_CELL_WORKERS = 4
+    threaded = extract_cells(mask, cells, letters, canvas_size=128, canvas_margin=8)
+
+    assert serial
+    assert threaded == serial
+
+
+@pytest.mark.parametrize(
+    "cell_workers, analysis_workers, cpus, expected",
+    [
+        (3, 0, 8, 3),    # explizit gesetzt
+        (0, 0, 8, 2),    # Default: ein Analyse-Prozess pro Kern → trotzdem 2 Threads
+        (0, 2, 8, 4),    # CPUs auf die Analyse-Prozesse aufgeteilt
+        (0, 0, 1, 2),
+    ],
+)
+def test_cell_worker_count(settings, monkeypatch, cell_workers, analysis_workers, cpus, expected):
+    settings.BEEFONT_CELL_WORKERS = cell_workers
+    settings.BEEFONT_ANALYSIS_WORKERS = analysis_workers
+    monkeypatch.setattr(segment.os, "cpu_count", lambda: cpus)
+
+    assert _cell_worker_count() == expected
@@ -19,12 +19,18 @@ from .views import (
     analyse_page,           # POST: run OCR / segmentation to create glyphs
     retry_page_analysis,    # POST: rerun analysis if needed
     create_page,            # POST: upload scan file and create associated page
+    analyse_pending_pages,  # POST: queue analysis of all pending pages of a job
+    AnalysisTaskList,       # GET: analysis tasks (queue) of a job
+    analysis_task_detail,   # GET: status/progress of one analysis task
 
     # Glyphs (logical variants, formattype-agnostic)
     list_glyphs,            # GET: all glyphs for a job, optional filter via query (?letter=...)
     glyph_detail,           # GET: all variants for a letter in a job
     select_glyph_variant,   # POST: mark one variant as default
     delete_glyph_variant,   # DELETE : remove a variante
+    glyph_thumbnail,        # GET: downsized preview of one variant (64/128/256 px)
+    glyph_sprite_atlas,     # GET: JSON atlas for the default-glyph sprite sheet
+    glyph_sprite_image,     # GET: sprite sheet PNG of all default glyphs
 
     # Single-glyph upload (formattype-specific)
     upload_glyph_from,
@@ -37,12 +43,15 @@ from .views import (
     list_builds,            # GET : list of all builds for a job
     build_ttf,              # POST: build font for a given language + formattype
     build_ttf_color,
-    download_ttf,           # GET: download TTF for job+language
+    build_batch,            # POST: several languages/formattypes in one run
+    download_ttf,           # GET: download TTF/WOFF/WOFF2 for job+language
+    download_font_subset,   # GET: font restricted to ?text= (WOFF2 by default)
     download_job_zip,       # GET: zip of all builds + metadata for a job
 
     # Status per language (formattype-specific)
     job_languages_status,   # GET: overview per language (ready/missing chars) for given formattype
     job_language_status,    # GET: status for one language for given formattype 
+    job_coverage_status,    # GET: status for all languages, png + svg in one call
 
     job_palette
 )
@@ -69,6 +78,11 @@ urlpatterns = [
         job_language_status,
         name="job_language_status",
     ),
+    path(
+        "jobs/<str:sid>/missingcharstatus/",
+        job_coverage_status,
+        name="job_coverage_status",
+    ),
 
     # ------------------------------------------------------------------
     # Template catalogue
@@ -129,6 +143,25 @@ urlpatterns = [
         name="create_page",
     ),
 
+    # POST /jobs/<sid>/pages/analyse-pending/ → alle offenen Seiten einplanen (202)
+    path(
+        "jobs/<str:sid>/pages/analyse-pending/",
+        analyse_pending_pages,
+        name="analyse_pending_pages",
+    ),
+
+    # Analyse-Queue: GET /jobs/<sid>/analysis-tasks/[<task_id>/]
+    path(
+        "jobs/<str:sid>/analysis-tasks/",
+        AnalysisTaskList.as_view(),
+        name="analysis_tasks",
+    ),
+    path(
+        "jobs/<str:sid>/analysis-tasks/<int:task_id>/",
+        analysis_task_detail,
+        name="analysis_task_detail",
+    ),
+
 
 
     # ------------------------------------------------------------------
@@ -180,6 +213,21 @@ urlpatterns = [
         delete_glyph_variant,
         name="delete_glyph_variant",
     ),
+    path(
+        "jobs/<str:sid>/glyphs/<str:formattype>/<int:glyph_id>/thumb/<int:size>/",
+        glyph_thumbnail,
+        name="glyph_thumbnail",
+    ),
+    path(
+        "jobs/<str:sid>/glyphs/<str:formattype>/sprite/<int:size>/",
+        glyph_sprite_atlas,
+        name="glyph_sprite_atlas",
+    ),
+    path(
+        "jobs/<str:sid>/glyphs/<str:formattype>/sprite/<int:size>/image/",
+        glyph_sprite_image,
+        name="glyph_sprite_image",
+    ),
     path(
         "jobs/<str:sid>/glyphs/<str:formattype>/<str:letter>/",
         glyph_detail,
@@ -208,11 +256,23 @@ urlpatterns = [
         name="build_ttf_color",
     ),
 
+    # POST /jobs/<sid>/build-batch/ { "languages": [...], "formattypes": [...] }
+    path(
+        "jobs/<str:sid>/build-batch/",
+        build_batch,
+        name="build_batch",
+    ),
+
     path(
         "jobs/<str:sid>/download/ttf/<str:language>/",
         download_ttf,
         name="download_ttf",
     ),
+    path(
+        "jobs/<str:sid>/download/subset/<str:language>/",
+        download_font_subset,
+        name="download_font_subset",
+    ),
     path(
         "jobs/<str:sid>/download/zip/",
         download_job_zip,
@@ -4,8 +4,12 @@ import os
 from datetime import datetime
 
 from django.conf import settings
-from django.http import FileResponse, Http404, HttpResponse
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_etags
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
  
 from django.utils.timezone import now
 from django.core.files.storage import default_storage
@@ -19,7 +23,6 @@ from rest_framework.decorators import      parser_classes
 from rest_framework.parsers import MultiPartParser, FormParser
 #from rest_framework.views import APIView
 from rest_framework import generics, permissions
-from django.db.models import Case, When, IntegerField
 
 # RAUS:
 # from rest_framework.decorators import api_view, permission_classes
@@ -43,6 +46,7 @@ from .models import (
     Glyph,
     FontBuild,
     GlyphFormatType,
+    PageAnalysisTask,
 )
 
 from .serializers import (
@@ -54,18 +58,42 @@ from .serializers import (
     GlyphSerializer,
     GlyphVariantSelectionSerializer,
     FontBuildSerializer, 
+    BatchBuildRequestSerializer,
     LanguageStatusSerializer,
+    PageAnalysisTaskSerializer,
 )
  
 
 
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import (
+    api_view,
+    content_negotiation_class,
+    permission_classes,
+    throttle_classes,
+)
+from rest_framework.exceptions import NotAcceptable
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
 from rest_framework.response import Response
 from rest_framework import permissions
  
 from BeeFontCore.services import template_utils 
-from BeeFontCore.services.segment import analyse_job_page_scan 
+from BeeFontCore.services import template_render_cache
+from BeeFontCore.services import template_vector
 from BeeFontCore.services import build_font
+from BeeFontCore.services import build_store
+from BeeFontCore.services import font_delivery
+from BeeFontCore.services import glyph_coverage
+from BeeFontCore.services import glyph_thumbs
+from BeeFontCore.services import webfont
+from BeeFontCore.services.alphabet import alphabet_for
+from BeeFontCore.services.glyph_ingest import GlyphUpload, ingest_glyphs
+from BeeFontCore.services.glyph_zip_import import ZipImportError, import_glyph_zip
+from BeeFontCore.services.job_paths import font_build_rel_path, job_sid_media
+from BeeFontCore.services.batch_build import run_batch_build
+from BeeFontCore.services import analysis_queue, zip_stream
+from BeeFontCore.services.analysis_queue import enqueue_page_analysis
  
 # -------------------------------------------------------------------
 # Helper
@@ -78,10 +106,6 @@ def get_job_or_404_for_user(sid, user):
     return get_object_or_404(FontJob, sid=sid, user=user)
 
 
-def job_sid_media(job: FontJob): 
-    return os.path.join( "beefont", "jobs", job.sid)
-  
-
 def get_job_or_404_by_sid(sid: str) -> FontJob:
     """Job lookup without user restriction (for public / font-preview use)."""
     return get_object_or_404(FontJob, sid=sid)
@@ -100,6 +124,49 @@ def normalize_formattype_or_400(formattype: str):
     return fmt, None
 
 
+def not_modified_or_none(request, etag: str, headers: dict):
+    """304 (mit denselben Cache-Headern), wenn If-None-Match den ETag enthält."""
+    client_etags = parse_etags(request.headers.get("If-None-Match", ""))
+    if etag in client_etags or "*" in client_etags:
+        resp = HttpResponseNotModified()
+        for name, value in headers.items():
+            resp[name] = value
+        return resp
+    return None
+
+
+class FontContentNegotiation(DefaultContentNegotiation):
+    """Accept: font/woff2 wählt das Font-Format, nicht den DRF-Renderer (sonst 406)."""
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        try:
+            return super().select_renderer(request, renderers, format_suffix)
+        except NotAcceptable:
+            return renderers[0], renderers[0].media_type
+
+
+def unavailable_flavor_400():
+    return Response(
+        {
+            "detail": f"flavor must be one of: {', '.join(('ttf',) + webfont.available_flavors())}",
+            "code": "invalid_flavor",
+        },
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+def normalize_thumb_size_or_400(size: int):
+    if size not in glyph_thumbs.THUMB_SIZES:
+        return Response(
+            {
+                "detail": f"size must be one of: {', '.join(map(str, glyph_thumbs.THUMB_SIZES))}",
+                "code": "invalid_size",
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return None
+
+
 
 # -------------------------------------------------------------------
 # Status per language
@@ -153,41 +220,30 @@ def job_languages_status(request, sid: str, formattype: str):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    # All default glyphs for this job in the requested formattype
-    default_glyphs = Glyph.objects.filter(job=job, is_default=True, formattype=fmt)
-    default_count = default_glyphs.count()
+    # Default-Buchstaben einmal (gecacht), fehlende Zeichen per Mengenoperation
+    results = glyph_coverage.languages_status(job, fmt)
 
-    #print(
-    #    "[BeeFont][job_languages_status] job_id={} sid={} fmt={} default_glyphs={}".formattype(
-    #        job.id, job.sid, fmt, default_count
-    #    )
-    #)
+    serializer = LanguageStatusSerializer(results, many=True)
+    return Response(serializer.data)
 
-    results = []
-    for lang in SupportedLanguage.objects.all():
-        alphabet = lang.alphabet or ""
-        alphabet_chars = list(alphabet)
-        covered = {g.letter for g in default_glyphs}
-        missing = [c for c in alphabet_chars if c not in covered]
 
-        #print(
-        #    "[BeeFont][job_languages_status] "
-        #    f"lang={lang.code} required={len(alphabet_chars)} "
-        #    f"covered={len(covered)} missing={len(missing)}"
-        #)
-
-        results.append(
-            {
-                "language": lang.code,
-                "ready": len(missing) == 0,
-                "required_chars": alphabet,
-                "missing_chars": "".join(missing),
-                "missing_count": len(missing),
-            }
-        )
+# GET /jobs/<sid>/missingcharstatus/
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def job_coverage_status(request, sid: str):
+    """
+    LanguageStatus aller Sprachen für png UND svg in einem Aufruf:
+    { "png": [LanguageStatus, ...], "svg": [LanguageStatus, ...] }
+    """
+    job = get_job_or_404_for_user(sid, request.user)
 
-    serializer = LanguageStatusSerializer(results, many=True)
-    return Response(serializer.data)
+    matrix = glyph_coverage.coverage_matrix(job)
+    return Response(
+        {
+            fmt: LanguageStatusSerializer(results, many=True).data
+            for fmt, results in matrix.items()
+        }
+    )
 
 
 # GET /jobs/<sid>/language/<language>/status/<formattype>/
@@ -253,34 +309,9 @@ def job_language_status(request, sid: str, language: str, formattype: str):
             status=status.HTTP_404_NOT_FOUND,
         )
 
-    alphabet = lang.alphabet or ""
-    alphabet_chars = list(alphabet)
-
-    default_glyphs = Glyph.objects.filter(job=job, is_default=True, formattype=fmt)
-    default_count = default_glyphs.count()
-    covered = {g.letter for g in default_glyphs}
-    missing = [c for c in alphabet_chars if c not in covered]
-
-    #print(
-    #    "[BeeFont][job_language_status] job_id={} sid={} lang={} fmt={} "
-    #    "required={} covered={} missing={}".format(
-    #        job.id,
-    #        job.sid,
-    #        lang.code,
-    #        fmt,
-    #        len(alphabet_chars),
-    #        len(covered),
-    #        len(missing),
-    #    )
-    #)
-
-    payload = {
-        "language": lang.code,
-        "ready": len(missing) == 0,
-        "required_chars": alphabet,
-        "missing_chars": "".join(missing),
-        "missing_count": len(missing),
-    }
+    payload = glyph_coverage.language_status(
+        lang, glyph_coverage.default_letters(job, fmt)
+    )
     serializer = LanguageStatusSerializer(payload)
     return Response(serializer.data)
 
@@ -301,19 +332,35 @@ def list_templates(request):
 
  
 
+TEMPLATE_OUTPUT_CONTENT_TYPES = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+    "pdf": "application/pdf",
+}
+
+
 @api_view(["GET"])
 @permission_classes([permissions.IsAuthenticated])  # oder AllowAny, wenn du willst
 def template_image(request, code: str):
 
     """
-    Render PNG on the fly, ähnlich wie V2:
+    Render PNG/SVG/PDF (mit Plattencache + ETag, siehe template_render_cache), ähnlich wie V2:
     - mode=blank        → Grid + Indizes
     - mode=blankpure    → nur Grid
     - mode=prefill*     → Grid + vorgefüllte Zeichen (Platzhalter),
                           Buchstaben kommen aus ?letters=...
                           Suffix nach 'prefill' steuert Stil (b, i, m, ...)
+    - output=png|svg|pdf → Rasterbild (Default) oder Vektor in exakten mm
+                          (nicht "format": das wertet DRF selbst aus)
     """
     mode_raw = request.GET.get("mode", "blank")
+    output = request.GET.get("output", "png").lower()
+    if output not in TEMPLATE_OUTPUT_CONTENT_TYPES:
+        return Response(
+            {"detail": f"output must be one of: {', '.join(TEMPLATE_OUTPUT_CONTENT_TYPES)}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    content_type = TEMPLATE_OUTPUT_CONTENT_TYPES[output]
     template = get_object_or_404(TemplateDefinition, code=code)
 
     tpl_cfg = template_utils.template_to_config(template)
@@ -348,40 +395,60 @@ def template_image(request, code: str):
             order = list(letters_param)
             if len(order) > capacity:
                 order = order[:capacity]
+    else:
+        order = []
+        if mode != "blankpure":
+            mode = "blank"
+
+    # Render-Cache: Key = ETag, hängt an TemplateDefinition.updated_at
+    key = template_render_cache.render_key(template, mode, prefill_style, order, output)
+    etag = f'"{key}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=3600",
+    }
 
-        im = template_utils.render_template_png(
-            tpl_cfg,
-            order,
-            prefill=True,
-            show_indices=False,
-            prefill_style=prefill_style,
-        )
-
-    elif mode == "blankpure":
-        im = template_utils.render_template_png(
-            tpl_cfg,
-            [],
-            prefill=False,
-            show_indices=False,
-            prefill_style=None,
-        )
-    else:  # "blank"
-        im = template_utils.render_template_png(
-            tpl_cfg,
-            [],
-            prefill=False,
-            show_indices=True,
-            prefill_style=None,
-        )
-
-    buf = io.BytesIO()
-    im.save(buf, format="PNG")
-    buf.seek(0)
+    resp = not_modified_or_none(request, etag, headers)
+    if resp is not None:
+        return resp
 
-    resp = HttpResponse(buf.getvalue(), content_type="image/png")
     # für den Dateinamen das originale mode_raw verwenden, damit man den Stil sieht
-    resp["Cache-Control"] = "public, max-age=3600"
-    resp["Content-Disposition"] = f'inline; filename="{code}_{mode_raw}.png"'
+    filename = f"{code}_{mode_raw}.{output}"
+
+    cache = template_render_cache.TemplateRenderCache.from_settings()
+    cached_path = cache.get_path(key, output)
+    if cached_path is not None:
+        try:
+            resp = FileResponse(open(cached_path, "rb"), content_type=content_type, filename=filename)
+        except FileNotFoundError:
+            # zwischen get_path und open evicted → neu rendern
+            resp = None
+        if resp is not None:
+            resp["Content-Disposition"] = f'inline; filename="{filename}"'
+            for name, value in headers.items():
+                resp[name] = value
+            return resp
+
+    render_kwargs = dict(
+        prefill=(mode == "prefill"),
+        show_indices=(mode == "blank"),
+        prefill_style=prefill_style,
+    )
+    if output == "svg":
+        data = template_vector.render_template_svg(tpl_cfg, order, **render_kwargs)
+    elif output == "pdf":
+        data = template_vector.render_template_pdf(tpl_cfg, order, **render_kwargs)
+    else:
+        im = template_utils.render_template_png(tpl_cfg, order, **render_kwargs)
+        buf = io.BytesIO()
+        im.save(buf, format="PNG")
+        data = buf.getvalue()
+    cache.put(key, data, output)
+
+    resp = HttpResponse(data, content_type=content_type)
+    resp["Content-Disposition"] = f'inline; filename="{filename}"'
+    for name, value in headers.items():
+        resp[name] = value
     return resp
 
 # -------------------------------------------------------------------
@@ -541,6 +608,12 @@ class JobPageDetail(generics.RetrieveDestroyAPIView):
         job = get_job_or_404_for_user(self.kwargs["sid"], self.request.user)
         return JobPage.objects.filter(job=job)
 
+    def perform_destroy(self, instance):
+        # Glyphen der Seite gehen per CASCADE mit
+        job = instance.job
+        super().perform_destroy(instance)
+        glyph_coverage.invalidate(job)
+
 
  
 @api_view(["POST"])
@@ -555,7 +628,8 @@ def create_page(request, sid: str):
       - letters (str, optional)
       - page_index (int, optional; if missing → auto)
       - file (the uploaded PNG/JPEG)
-      - auto_analyse (optional: "1"/"true" → run analyse_page immediately)
+      - auto_analyse (optional: "1"/"true" → queue analysis, response 202
+        with the analysis task to poll)
     """
     job = get_job_or_404_for_user(sid, request.user)
 
@@ -621,7 +695,7 @@ def create_page(request, sid: str):
 
     if auto_analyse:
         try:
-            analysis_payload = _run_page_analysis(job, page)
+            task = enqueue_page_analysis(job, page)
         except ValueError as e:
             # missing scan should not happen here, but be explicit
             return Response(
@@ -631,142 +705,68 @@ def create_page(request, sid: str):
                 },
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        except FileNotFoundError as e:
-            return Response(
-                {
-                    "page": result_payload,
-                    "analyse_error": {"detail": str(e)},
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-        except Exception as e:
-            return Response(
-                {
-                    "page": result_payload,
-                    "analyse_error": {
-                        "detail": "Analyse fehlgeschlagen",
-                        "error": str(e),
-                    },
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-
-        result_payload = {
-            "page": result_payload,
-            "analysis": analysis_payload,
-        }
-
-    return Response(result_payload, status=status.HTTP_201_CREATED)
-
-
-def _run_page_analysis(job: FontJob, page: JobPage) -> dict:
-    """
-    Core analysis logic for a JobPage.
-    Returns a plain dict payload, raises exceptions on fatal errors.
-    """
-    from pathlib import Path
-    from .models import Glyph  # local import
-
-    if not page.scan_image_path:
-        raise ValueError("Für diese Seite ist noch kein Scan hochgeladen.")
-
-    media_root = Path(settings.MEDIA_ROOT)
-
-    scan_path = Path(page.scan_image_path)
-    if not scan_path.is_absolute():
-        abs_scan_path = media_root / scan_path
-    else:
-        abs_scan_path = scan_path
-
-    if not abs_scan_path.exists():
-        raise FileNotFoundError(f"Scan-Datei nicht gefunden: {abs_scan_path}")
-
-    # Job root: media/beefont/jobs/<sid>/
-    job_root_rel = job_sid_media(job)          # "beefont/jobs/<sid>"
-    job_root_abs = media_root / job_root_rel
-
-    # Debug directory for this page
-    dbg_dir = job_root_abs / "debug" / f"page_{page.page_index}"
-
-    # Template config from DB
-    template = page.template
-    tpl = template_utils.template_to_config(template)
-
-    glyphs_created = 0
-
-    # Segmentation
-    glyph_info = analyse_job_page_scan(
-        abs_scan_path=abs_scan_path,
-        tpl=tpl,
-        letters=page.letters or "",
-        dbg_dir=dbg_dir,
-    )
-
-    for cell_index, letter, im in glyph_info:
-        last = (
-            Glyph.objects.filter(job=job, letter=letter)
-            .order_by("-variant_index")
-            .first()
-        )
-        next_idx = (last.variant_index + 1) if last else 0
 
-        filename = f"{letter}_v{next_idx}.png"
-        rel_path = os.path.join(job_root_rel, "glyphs", filename)
-        abs_path = media_root / rel_path
-        abs_path.parent.mkdir(parents=True, exist_ok=True)
-
-        im.save(abs_path)
-
-        # no canonical <LETTER>.png anymore
-        Glyph.objects.create(
-            job=job,
-            page=page,
-            cell_index=cell_index,
-            letter=letter,
-            variant_index=next_idx,
-            image_path=str(rel_path).replace("\\", "/"),
-            is_default=(next_idx == 0),
-            formattype=GlyphFormatType.PNG,
+        # Analyse läuft im Worker → 202 + Task zum Pollen
+        return Response(
+            {
+                "page": result_payload,
+                "analysis_task": PageAnalysisTaskSerializer(task).data,
+            },
+            status=status.HTTP_202_ACCEPTED,
         )
 
-        glyphs_created += 1
-
-    page.analysed_at = now()
-    page.save(update_fields=["analysed_at"])
-
-    return {
-        "detail": "Analyse abgeschlossen.",
-        "glyph_variants_created": glyphs_created,
-    }
-
+    return Response(result_payload, status=status.HTTP_201_CREATED)
 
 
 @api_view(["POST"])
 @permission_classes([permissions.IsAuthenticated])
 def analyse_page(request, sid: str, page_id: int):
+    """
+    Plant die Analyse einer Seite ein (HTTP 202).
+    Status/Fortschritt über GET /jobs/<sid>/analysis-tasks/<task_id>/.
+    """
     job = get_job_or_404_for_user(sid, request.user)
     page = get_object_or_404(JobPage, job=job, pk=page_id)
 
     try:
-        payload = _run_page_analysis(job, page)
+        task = enqueue_page_analysis(job, page)
     except ValueError as e:
         # missing scan
         return Response(
             {"detail": str(e)},
             status=status.HTTP_400_BAD_REQUEST,
         )
-    except FileNotFoundError as e:
-        return Response(
-            {"detail": str(e)},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
-    except Exception as e:
-        return Response(
-            {"detail": "Analyse fehlgeschlagen", "error": str(e)},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
 
-    return Response(payload, status=status.HTTP_200_OK)
+    return Response(
+        {
+            "detail": "Analyse eingeplant.",
+            "task": PageAnalysisTaskSerializer(task).data,
+        },
+        status=status.HTTP_202_ACCEPTED,
+    )
+
+
+@api_view(["POST"])
+@permission_classes([permissions.IsAuthenticated])
+def analyse_pending_pages(request, sid: str):
+    """
+    POST /jobs/<sid>/pages/analyse-pending/
+
+    Plant alle Seiten ohne analysed_at in der Analyse-Queue ein und antwortet
+    sofort mit 202 und den offenen Tasks des Jobs. Fortschritt über
+    analysis-tasks/ bzw. analysis-tasks/<task_id>/.
+    """
+    job = get_job_or_404_for_user(sid, request.user)
+    created, tasks = analysis_queue.enqueue_pending_pages(job)
+
+    return Response(
+        {
+            "detail": f"{created} Seite(n) zur Analyse eingeplant.",
+            "queued_pages": created,
+            "tasks": PageAnalysisTaskSerializer(tasks, many=True).data,
+        },
+        status=status.HTTP_202_ACCEPTED,
+    )
 
 
 @api_view(["POST"])
@@ -776,6 +776,43 @@ def retry_page_analysis(request, sid: str, page_id: int):
     return analyse_page(request, sid, page_id)
 
 
+class AnalysisTaskList(generics.ListAPIView):
+    """
+    GET /jobs/<sid>/analysis-tasks/ – alle Analyse-Tasks eines Jobs (neueste zuerst).
+    Optional: ?status=queued|running|done|failed
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = PageAnalysisTaskSerializer
+
+    def get_queryset(self):
+        job = get_job_or_404_for_user(self.kwargs["sid"], self.request.user)
+        qs = (
+            PageAnalysisTask.objects
+            .filter(job=job)
+            .select_related("page")
+            .order_by("-created_at")
+        )
+        task_status = self.request.GET.get("status")
+        if task_status:
+            qs = qs.filter(status=task_status)
+        return qs
+
+
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def analysis_task_detail(request, sid: str, task_id: int):
+    """
+    Status + Fortschritt eines Analyse-Tasks (zum Pollen nach 202).
+    """
+    job = get_job_or_404_for_user(sid, request.user)
+    task = get_object_or_404(
+        PageAnalysisTask.objects.select_related("page"),
+        job=job,
+        pk=task_id,
+    )
+    return Response(PageAnalysisTaskSerializer(task).data)
+
+
 # -------------------------------------------------------------------
 # Glyphs
 # -------------------------------------------------------------------
@@ -828,6 +865,122 @@ def glyph_detail(request, sid: str, formattype: str, letter: str):
     serializer = GlyphSerializer(qs, many=True)
     return Response(serializer.data)
 
+
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def glyph_thumbnail(request, sid: str, formattype: str, glyph_id: int, size: int):
+    """
+    Verkleinerte Vorschau einer Glyph-Variante (PNG, size x size, 64/128/256),
+    gecacht und mit starkem ETag (siehe glyph_thumbs).
+    """
+    job = get_job_or_404_for_user(sid, request.user)
+
+    fmt, error_response = normalize_formattype_or_400(formattype)
+    if error_response is not None:
+        return error_response
+    error_response = normalize_thumb_size_or_400(size)
+    if error_response is not None:
+        return error_response
+
+    glyph = get_object_or_404(Glyph, id=glyph_id, job=job, formattype=fmt)
+    try:
+        key = glyph_thumbs.thumb_key(glyph, size)
+    except FileNotFoundError:
+        return Response({"detail": "Glyph file not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    etag = f'"{key}"'
+    # privat: Job-Inhalte, aber unveränderlich pro ETag
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=86400"}
+    resp = not_modified_or_none(request, etag, headers)
+    if resp is not None:
+        return resp
+
+    try:
+        data = glyph_thumbs.thumbnail_png(glyph, size, key, glyph_thumbs.ThumbnailCache.from_settings())
+    except Exception as e:
+        return Response(
+            {"detail": f"Thumbnail konnte nicht erzeugt werden: {e}"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    resp = HttpResponse(data, content_type="image/png")
+    for name, value in headers.items():
+        resp[name] = value
+    return resp
+
+
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def glyph_sprite_atlas(request, sid: str, formattype: str, size: int):
+    """
+    JSON-Atlas zum Sprite-Sheet aller Default-Glyphen (x/y/w/h pro Glyph).
+    Der ETag ist derselbe wie der des Sprite-Bildes.
+    """
+    job = get_job_or_404_for_user(sid, request.user)
+
+    fmt, error_response = normalize_formattype_or_400(formattype)
+    if error_response is not None:
+        return error_response
+    error_response = normalize_thumb_size_or_400(size)
+    if error_response is not None:
+        return error_response
+
+    sprite = glyph_thumbs.sprite_layout(job, fmt, size)
+    etag = f'"{sprite.key}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    resp = not_modified_or_none(request, etag, headers)
+    if resp is not None:
+        return resp
+
+    payload = sprite.atlas()
+    payload["image"] = reverse(
+        "beefont:glyph_sprite_image", kwargs={"sid": sid, "formattype": fmt, "size": size}
+    )
+    resp = Response(payload)
+    for name, value in headers.items():
+        resp[name] = value
+    return resp
+
+
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def glyph_sprite_image(request, sid: str, formattype: str, size: int):
+    """Sprite-Sheet (PNG) aller Default-Glyphen, Anordnung siehe glyph_sprite_atlas."""
+    job = get_job_or_404_for_user(sid, request.user)
+
+    fmt, error_response = normalize_formattype_or_400(formattype)
+    if error_response is not None:
+        return error_response
+    error_response = normalize_thumb_size_or_400(size)
+    if error_response is not None:
+        return error_response
+
+    sprite = glyph_thumbs.sprite_layout(job, fmt, size)
+    if not sprite.entries:
+        return Response(
+            {"detail": "Keine Default-Glyphen für diesen Formattype."},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    etag = f'"{sprite.key}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    resp = not_modified_or_none(request, etag, headers)
+    if resp is not None:
+        return resp
+
+    try:
+        data = glyph_thumbs.sprite_png(sprite, glyph_thumbs.ThumbnailCache.from_settings())
+    except Exception as e:
+        return Response(
+            {"detail": f"Sprite-Sheet konnte nicht erzeugt werden: {e}"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    resp = HttpResponse(data, content_type="image/png")
+    for name, value in headers.items():
+        resp[name] = value
+    return resp
+
  
 @api_view(["POST"])
 @permission_classes([permissions.IsAuthenticated])
@@ -864,6 +1017,7 @@ def select_glyph_variant(request, sid: str, formattype: str, letter: str):
     qs.update(is_default=False)
     glyph.is_default = True
     glyph.save(update_fields=["is_default"])
+    glyph_coverage.invalidate(job)
 
     return Response(GlyphSerializer(glyph).data, status=status.HTTP_200_OK)
 
@@ -920,6 +1074,8 @@ def delete_glyph_variant(request, sid: str, formattype: str, glyph_id: int):
             first.is_default = True
             first.save(update_fields=["is_default"])
 
+    glyph_coverage.invalidate(job)
+
     return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -958,28 +1114,16 @@ def build_ttf(request, sid: str, language: str, formattype: str):
 
     lang = get_object_or_404(SupportedLanguage, code=language)
     #print(        "[BeeFont][build_ttf] 4  "    )
-    alphabet = lang.alphabet or ""
-    alphabet_chars = list(alphabet)
+    alphabet = alphabet_for(lang)
 
-    # Default-Glyphs dieses Jobs in dem gewünschten Formattype
-    default_glyphs = Glyph.objects.filter(
-        job=job,
-        is_default=True,
-        formattype=fmt,
+    # Coverage aus dem Cache (glyph_coverage), Glyphen erst für den Build laden
+    status_data = glyph_coverage.language_status(
+        lang, glyph_coverage.default_letters(job, fmt)
     )
     #print(        "[BeeFont][build_ttf] 5  "    )
-    covered = {g.letter for g in default_glyphs}
-    missing = [c for c in alphabet_chars if c not in covered]
 
-    if missing:
+    if not status_data["ready"]:
         print(        "[BeeFont][build_ttf] 6  "    )
-        status_data = {
-            "language": lang.code,
-            "ready": False,
-            "required_chars": alphabet,
-            "missing_chars": "".join(missing),
-            "missing_count": len(missing),
-        }
         return Response(
             {
                 "detail": "Nicht alle Zeichen sind abgedeckt.",
@@ -989,46 +1133,59 @@ def build_ttf(request, sid: str, language: str, formattype: str):
         )
 
     #print(        "[BeeFont][build_ttf] 7  "    )
-    media_root = Path(settings.MEDIA_ROOT)
-    job_root_rel = job_sid_media(job)
-    build_rel_dir = os.path.join(job_root_rel, "build")
-    filename = f"{job.name}_{lang.code}_{fmt}.ttf".replace(" ", "_")
-    rel_path = os.path.join(build_rel_dir, filename)
-    full_path = media_root / rel_path
-    full_path.parent.mkdir(parents=True, exist_ok=True)
+    rel_path = font_build_rel_path(job, lang.code, fmt)
     #print(        "[BeeFont][build_ttf] 8  "    )
-    glyphs_for_lang = default_glyphs.filter(letter__in=alphabet_chars)
-
-    try:
-        if fmt == "png":
+    # Default-Glyphs dieses Jobs in dem gewünschten Formattype
+    glyphs_for_lang = Glyph.objects.filter(
+        job=job,
+        is_default=True,
+        formattype=fmt,
+        letter__in=alphabet.lookup_letters,
+    )
 
-            print(        "[BeeFont][build_ttf] 91  "    )
-            # Alte Pipeline: PNG → SVG (potrace) → FontForge
-            build_font.build_ttf_png(job, lang, glyphs_for_lang, full_path)
-        else:
-            # Neue Pipeline: echte SVG-Glyphen direkt in FontForge
-            print(        "[BeeFont][build_ttf] 92  "    )
-            build_font.build_ttf_svg(job, lang, glyphs_for_lang, full_path)
+    previous = (
+        FontBuild.objects
+        .filter(
+            job=job,
+            language=lang,
+            glyph_formattype=fmt,
+            style=FontBuild.FontBuildStyle.MONO,
+        )
+        # auch nach einem Fehlschlag: die Zeile hält weiter den letzten
+        # erfolgreichen Build (build_store.save_build_result)
+        .values_list("manifest", "ttf_path")
+        .first()
+    ) or (None, None)
 
+    try:
+        # PNG: PNG → SVG (potrace) → FontForge, SVG: echte SVG-Glyphen direkt.
+        # Nur Glyphen, deren Quelle sich seit dem letzten Build geändert hat,
+        # werden neu gebaut und in die bestehende TTF eingesetzt.
+        # Ergebnis landet inhaltsadressiert im Build-Store (build_store).
+        with build_store.workspace(job, os.path.basename(rel_path), previous[1]) as work_ttf:
+            build_log, manifest = build_font.build_font_incremental(
+                fmt, job, lang, glyphs_for_lang, work_ttf, previous_manifest=previous[0]
+            )
+            rel_path = build_store.commit(job, work_ttf)
         success = True
-        log = ""
+        log = build_log.text()
     except Exception as e:
         success = False
         log = str(e)
+        manifest = {}
 
     #print(        "[BeeFont][build_ttf] 10  "    )
  
 
-    font_build, _created = FontBuild.objects.update_or_create(
-        job=job,
-        language=lang,
-        glyph_formattype=fmt,
-        style=FontBuild.FontBuildStyle.MONO,   # oder einfach "mono"
-        defaults={
-            "ttf_path": rel_path,
-            "success": success,
-            "log": log,
-        },
+    font_build = build_store.save_build_result(
+        job,
+        lang,
+        fmt,
+        FontBuild.FontBuildStyle.MONO,
+        success=success,
+        log=log,
+        ttf_path=rel_path,
+        manifest=manifest,
     )
 
 
@@ -1049,74 +1206,183 @@ def build_ttf(request, sid: str, language: str, formattype: str):
 # @permission_classes([permissions.AllowAny])
 @api_view(["GET"])
 @permission_classes([permissions.AllowAny])
+@content_negotiation_class(FontContentNegotiation)
 def download_ttf(request, sid: str, language: str):
-    # IMPORTANT: no user filter → works for AnonymousUser / font preview
-    job = get_job_or_404_by_sid(sid)
-    lang = get_object_or_404(SupportedLanguage, code=language)
+    """
+    TTF für @font-face / Vorschau. ETag + Last-Modified aus dem Build
+    (304 ohne die Datei zu öffnen), Byte-Ranges (206), Auflösung des
+    besten Builds gecacht (font_delivery).
 
+    Format: ?flavor=ttf|woff|woff2 oder Accept (font/woff2, font/woff),
+    ohne Angabe TTF.
+    """
+    flavor = font_delivery.negotiate_flavor(
+        request.query_params.get("flavor"), request.headers.get("Accept", "")
+    )
+    if flavor is None:
+        return unavailable_flavor_400()
 
+    # IMPORTANT: no user filter → works for AnonymousUser / font preview
+    return respond_with_font(sid, language, flavor, lambda font: font_file_response(request, font))
 
-    build = (
-        FontBuild.objects
-        .filter(job=job, language=lang, success=True)
-        .order_by(
-            Case(
-                When(style=FontBuild.FontBuildStyle.COLOR, then=0),
-                default=1,
-                output_field=IntegerField(),
-            ),
-            "-created_at",
-        )
-        .first()
-    )
 
-    if not build:
+def respond_with_font(sid: str, language: str, flavor: str, respond):
+    """
+    respond(font) für den besten Build. Fehlt dessen Datei (Build zwischen
+    Auflösen und Öffnen ersetzt und von gc_beefont abgeräumt), wird einmal
+    neu aufgelöst statt 404 zu liefern.
+    """
+    font = font_delivery.resolve_font(sid, language, flavor)
+    if font is not None:
+        try:
+            return respond(font)
+        except FileNotFoundError:
+            font_delivery.invalidate(sid, language)
+            font = font_delivery.resolve_font(sid, language, flavor)
+    if font is None:
         raise Http404("Kein erfolgreicher Build für diese Sprache gefunden.")
-
-    if not default_storage.exists(build.ttf_path):
+    try:
+        return respond(font)
+    except FileNotFoundError:
         raise Http404("TTF nicht gefunden")
 
-    file = default_storage.open(build.ttf_path, "rb")
-    filename = os.path.basename(build.ttf_path)
+
+def font_file_response(request, font: font_delivery.ServedFont):
+    """Raises FileNotFoundError, wenn die Datei fehlt."""
+    headers = {
+        "ETag": font.etag,
+        "Last-Modified": http_date(font.last_modified),
+        # URL bleibt gleich, Inhalt ändert sich mit jedem Build → immer revalidieren
+        "Cache-Control": "public, no-cache",
+        "Accept-Ranges": "bytes",
+        "Vary": "Accept",
+    }
+    resp = get_conditional_response(request, etag=font.etag, last_modified=font.last_modified)
+    if resp is not None:
+        for name, value in headers.items():
+            resp[name] = value
+        return resp
+
+    byte_range = font_delivery.parse_range(request.headers.get("Range"), font.size)
+    if_range = request.headers.get("If-Range")
+    if byte_range is not None and if_range and if_range not in (font.etag, headers["Last-Modified"]):
+        byte_range = None  # Datei hat sich geändert → ganze Datei
+
+    if byte_range == font_delivery.UNSATISFIABLE:
+        resp = HttpResponse(status=416)
+        resp["Content-Range"] = f"bytes */{font.size}"
+        return resp
+
+    file = open(font.abs_path, "rb")
+    if byte_range is not None:
+        start, end = byte_range
+        with file:
+            file.seek(start)
+            data = file.read(end - start + 1)
+        response = HttpResponse(data, status=206, content_type=font.content_type)
+        response["Content-Range"] = f"bytes {start}-{end}/{font.size}"
+    else:
+        response = FileResponse(file, content_type=font.content_type)
 
     # For @font-face it’s nicer to serve inline, but attachment also works.
-    response = FileResponse(file, content_type="font/ttf")
-    response["Content-Disposition"] = f'inline; filename="{filename}"'
+    response["Content-Disposition"] = f'inline; filename="{font.filename}"'
+    for name, value in headers.items():
+        response[name] = value
     return response
 
+
+class FontSubsetThrottle(SimpleRateThrottle):
+    """Öffentlich und teuer (fontTools-Subsetting) → eigenes Limit pro Client."""
+
+    scope = "beefont_subset"
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {"scope": self.scope, "ident": ident}
+
+
+@api_view(["GET"])
+@permission_classes([permissions.AllowAny])
+@throttle_classes([*api_settings.DEFAULT_THROTTLE_CLASSES, FontSubsetThrottle])
+@content_negotiation_class(FontContentNegotiation)
+def download_font_subset(request, sid: str, language: str):
+    """
+    Font reduziert auf die Zeichen aus ?text= (z.B. die Zeichen einer Seite).
+    Format wie download_ttf, Default WOFF2 (bzw. WOFF ohne brotli).
+    Ergebnis im Plattencache, Key/ETag = Build-Hash + Codepoint-Menge.
+    """
+    text = request.query_params.get("text", "")
+    if not text:
+        return Response(
+            {"detail": "text parameter is required.", "code": "missing_text"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    codepoints = webfont.text_codepoints(text)
+    if len(codepoints) > webfont.MAX_SUBSET_CODEPOINTS:
+        return Response(
+            {
+                "detail": f"text must not contain more than {webfont.MAX_SUBSET_CODEPOINTS} distinct characters.",
+                "code": "text_too_long",
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    flavor = font_delivery.negotiate_flavor(
+        request.query_params.get("flavor"),
+        request.headers.get("Accept", ""),
+        default=webfont.available_flavors()[0],
+    )
+    if flavor is None:
+        return unavailable_flavor_400()
+
+    def respond(font: font_delivery.ServedFont):
+        # nur Zeichen, die der Font hat: beliebiger ?text= erzeugt keine neuen Subsets
+        covered = webfont.covered_codepoints(font.abs_path, font.content_hash, codepoints)
+        key = webfont.subset_key(font.content_hash, covered, flavor)
+        etag = f'"{key}"'
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "public, no-cache",
+            "Vary": "Accept",
+        }
+        not_modified = not_modified_or_none(request, etag, headers)
+        if not_modified is not None:
+            return not_modified
+
+        data = webfont.subset_font(
+            font.abs_path, covered, flavor, key, webfont.SubsetCache.from_settings()
+        )
+        response = HttpResponse(data, content_type=webfont.CONTENT_TYPES[flavor])
+        filename = f"{os.path.splitext(font.filename)[0]}_subset.{flavor}"
+        response["Content-Disposition"] = f'inline; filename="{filename}"'
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+    return respond_with_font(sid, language, "ttf", respond)
+
 import os
 
 @api_view(["GET"])
 @permission_classes([permissions.IsAuthenticated])
 def download_job_zip(request, sid: str):
-    import io
-    import zipfile
-
     job = get_job_or_404_for_user(sid, request.user)
-    builds = FontBuild.objects.filter(job=job, success=True)
+    builds = list(FontBuild.objects.filter(job=job, success=True).select_related("job"))
 
-    if not builds.exists():
+    if not builds:
         return Response(
             {"detail": "Keine erfolgreichen Builds für diesen Job."},
             status=status.HTTP_404_NOT_FOUND,
         )
 
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        for build in builds:
-            if default_storage.exists(build.ttf_path):
-                with default_storage.open(build.ttf_path, "rb") as f:
-                    data = f.read()
+    # Store-Dateien heißen nach ihrem Hash → sprechende Namen fürs ZIP
+    entries = [(build_store.download_name(build), build.ttf_path) for build in builds]
 
-                # WICHTIG: echten Dateinamen aus dem Pfad nehmen
-                arcname = os.path.basename(build.ttf_path)
-                zf.writestr(arcname, data)
-
-    buffer.seek(0)
     filename = f"{job.name}_fonts.zip".replace(" ", "_")
-    response = HttpResponse(buffer, content_type="application/zip")
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
-    return response
+    return zip_stream.zip_response(entries, filename)
 
 
 ##########################################
@@ -1128,9 +1394,6 @@ def download_default_glyphs_zip(request, sid: str, formattype: str):
     Download a ZIP containing all files for glyphs that are marked
     as default (is_default=True) for this job + formattype ('png' or 'svg').
     """
-    import io
-    import zipfile
-
     job = get_job_or_404_for_user(sid, request.user)
 
     fmt, error_response = normalize_formattype_or_400(formattype)
@@ -1149,29 +1412,12 @@ def download_default_glyphs_zip(request, sid: str, formattype: str):
             status=status.HTTP_404_NOT_FOUND,
         )
 
-    buffer = io.BytesIO()
     ext = fmt  # 'png' or 'svg'
-    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        for g in glyphs:
-            rel_path = g.image_path
-            if not rel_path:
-                continue
-
-            if not default_storage.exists(rel_path):
-                continue
-
-            with default_storage.open(rel_path, "rb") as f:
-                data = f.read()
-
-            # Default-Archive: nur <LETTER>.<ext>
-            arcname = f"{g.letter}.{ext}"
-            zf.writestr(arcname, data)
+    # Default-Archive: nur <LETTER>.<ext>
+    entries = [(f"{g.letter}.{ext}", g.image_path) for g in glyphs]
 
-    buffer.seek(0)
     filename = f"{job.name}_glyphs_default_{fmt}.zip".replace(" ", "_")
-    response = HttpResponse(buffer.getvalue(), content_type="application/zip")
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
-    return response
+    return zip_stream.zip_response(entries, filename)
 
 
 @api_view(["GET"])
@@ -1183,9 +1429,6 @@ def download_all_glyphs_zip(request, sid: str, formattype: str):
 
     Archive names are "<LETTER>_v<VARIANT>.<ext>".
     """
-    import io
-    import zipfile
-
     job = get_job_or_404_for_user(sid, request.user)
 
     fmt, error_response = normalize_formattype_or_400(formattype)
@@ -1204,28 +1447,11 @@ def download_all_glyphs_zip(request, sid: str, formattype: str):
             status=status.HTTP_404_NOT_FOUND,
         )
 
-    buffer = io.BytesIO()
     ext = fmt
-    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        for g in glyphs:
-            rel_path = g.image_path
-            if not rel_path:
-                continue
-
-            if not default_storage.exists(rel_path):
-                continue
+    entries = [(f"{g.letter}_v{g.variant_index}.{ext}", g.image_path) for g in glyphs]
 
-            with default_storage.open(rel_path, "rb") as f:
-                data = f.read()
-
-            arcname = f"{g.letter}_v{g.variant_index}.{ext}"
-            zf.writestr(arcname, data)
-
-    buffer.seek(0)
     filename = f"{job.name}_glyphs_all_{fmt}.zip".replace(" ", "_")
-    response = HttpResponse(buffer.getvalue(), content_type="application/zip")
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
-    return response
+    return zip_stream.zip_response(entries, filename)
 
 @api_view(["POST"])
 @permission_classes([permissions.IsAuthenticated])
@@ -1237,11 +1463,9 @@ def upload_glyphs_zip(request, sid: str, formattype: str):
     - formattype: 'png' or 'svg'
     - All glyphs imported from ZIP are *not* tied to a JobPage:
       page = None, cell_index = -1.
+    - Read from the temporary upload file, members are extracted in
+      chunks with size caps (see services/glyph_zip_import.py).
     """
-    import io
-    import zipfile
-    import os
-
     job = get_job_or_404_for_user(sid, request.user)
 
     fmt, error_response = normalize_formattype_or_400(formattype)
@@ -1256,114 +1480,27 @@ def upload_glyphs_zip(request, sid: str, formattype: str):
         )
 
     try:
-        zip_bytes = upload.read()
-        zf = zipfile.ZipFile(io.BytesIO(zip_bytes))
-    except Exception:
+        result = import_glyph_zip(job, fmt, upload)
+    except ZipImportError as e:
         return Response(
-            {"detail": "Invalid ZIP archive."},
+            {"detail": str(e)},
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    media_root = Path(settings.MEDIA_ROOT)
-    job_root_rel = job_sid_media(job)              # "beefont/jobs/<sid>"
-    glyphs_rel_dir = os.path.join(job_root_rel, "glyphs")
-    glyphs_abs_dir = media_root / glyphs_rel_dir
-    glyphs_abs_dir.mkdir(parents=True, exist_ok=True)
-
-    imported = 0
-    skipped_non_matching_ext = 0
-    skipped_empty_letter = 0
-    skipped_errors = 0
-
-    expected_ext = f".{fmt}"
-
-    for info in zf.infolist():
-        if info.is_dir():
-            continue
-
-        filename = info.filename
-        base = os.path.basename(filename)
-        if not base:
-            continue
-
-        if not base.lower().endswith(expected_ext):
-            skipped_non_matching_ext += 1
-            continue
-
-        stem, _ext = os.path.splitext(base)
-
-        if "_" in stem:
-            letter = stem.split("_", 1)[0]
-        else:
-            letter = stem
-
-        letter = letter.strip()
-        if not letter:
-            skipped_empty_letter += 1
-            continue
-
-        last = (
-            Glyph.objects
-            .filter(job=job, letter=letter, formattype=fmt)
-            .order_by("-variant_index")
-            .first()
-        )
-        next_idx = (last.variant_index + 1) if last else 0
-
-        new_filename = f"{letter}_v{next_idx}.{fmt}"
-        rel_path = os.path.join(glyphs_rel_dir, new_filename)
-        abs_path = media_root / rel_path
-        abs_path.parent.mkdir(parents=True, exist_ok=True)
+    data = result.as_dict()
 
-        try:
-            data = zf.read(info.filename)
-        except Exception:
-            skipped_errors += 1
-            continue
-
-        try:
-            default_storage.save(rel_path, ContentFile(data))
-        except Exception:
-            skipped_errors += 1
-            continue
-
-        try:
-            Glyph.objects.create(
-                job=job,
-                page=None,        # no JobPage
-                cell_index=-1,    # not bound to a scan cell
-                letter=letter,
-                variant_index=next_idx,
-                image_path=str(rel_path).replace("\\", "/"),
-                is_default=(next_idx == 0),
-                formattype=fmt,
-            )
-            imported += 1
-        except Exception:
-            skipped_errors += 1
-
-    zf.close()
-
-    if imported == 0:
+    if result.imported == 0:
         return Response(
-            {
-                "detail": f"No {fmt.upper()} glyphs imported from ZIP.",
-                "imported": imported,
-                "skipped_non_matching_ext": skipped_non_matching_ext,
-                "skipped_empty_letter": skipped_empty_letter,
-                "skipped_errors": skipped_errors,
-            },
+            {"detail": f"No {fmt.upper()} glyphs imported from ZIP.", **data},
             status=status.HTTP_400_BAD_REQUEST,
         )
 
+    detail = f"{fmt.upper()} glyphs imported from ZIP."
+    if result.truncated:
+        detail += " Import stopped early: ZIP exceeds the configured size/member limits."
+
     return Response(
-        {
-            "detail": f"{fmt.upper()} glyphs imported from ZIP.",
-            "imported": imported,
-            "skipped_non_matching_ext": skipped_non_matching_ext,
-            "skipped_empty_letter": skipped_empty_letter,
-            "skipped_errors": skipped_errors,
-        },
+        {"detail": detail, **data},
         status=status.HTTP_201_CREATED,
     )
 
@@ -1383,8 +1520,6 @@ def upload_glyph_from(request, sid: str, formattype: str):
       - letter: glyph character
       - file:   image/vektor file
     """
-    import os
-
     job = get_job_or_404_for_user(sid, request.user)
 
     fmt, error_response = normalize_formattype_or_400(formattype)
@@ -1406,41 +1541,22 @@ def upload_glyph_from(request, sid: str, formattype: str):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    media_root = Path(settings.MEDIA_ROOT)
-    job_root_rel = job_sid_media(job)
-    glyphs_rel_dir = os.path.join(job_root_rel, "glyphs")
-    (media_root / glyphs_rel_dir).mkdir(parents=True, exist_ok=True)
-
-    last = (
-        Glyph.objects
-        .filter(job=job, letter=letter, formattype=fmt)
-        .order_by("-variant_index")
-        .first()
-    )
-    next_idx = (last.variant_index + 1) if last else 0
-
-    new_filename = f"{letter}_v{next_idx}.{fmt}"
-    rel_path = os.path.join(glyphs_rel_dir, new_filename)
-
     try:
-        saved_path = default_storage.save(rel_path, upload)
+        [glyph] = ingest_glyphs(
+            job,
+            [GlyphUpload(letter=letter, formattype=fmt, data=upload.read())],
+        )
+    except SuspiciousFileOperation:
+        return Response(
+            {"detail": "Invalid letter.", "code": "invalid_letter"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
     except Exception as e:
         return Response(
             {"detail": f"Failed to store glyph file: {e}"},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
 
-    glyph = Glyph.objects.create(
-        job=job,
-        page=None,          # no JobPage
-        cell_index=-1,      # not bound to a scan cell
-        letter=letter,
-        variant_index=next_idx,
-        image_path=str(saved_path).replace("\\", "/"),
-        is_default=(next_idx == 0),
-        formattype=fmt,
-    )
-
     return Response(GlyphSerializer(glyph).data, status=status.HTTP_201_CREATED)
 
 
@@ -1559,26 +1675,14 @@ def build_ttf_color(request, sid: str, language: str):
     fmt = "svg"
 
     lang = get_object_or_404(SupportedLanguage, code=language)
-    alphabet = lang.alphabet or ""
-    alphabet_chars = list(alphabet)
+    alphabet = alphabet_for(lang)
 
-    # Default SVG-Glyphs dieses Jobs
-    default_glyphs = Glyph.objects.filter(
-        job=job,
-        is_default=True,
-        formattype=fmt,
+    # Coverage aus dem Cache (glyph_coverage)
+    status_data = glyph_coverage.language_status(
+        lang, glyph_coverage.default_letters(job, fmt)
     )
-    covered = {g.letter for g in default_glyphs}
-    missing = [c for c in alphabet_chars if c not in covered]
-
-    if missing:
-        status_data = {
-            "language": lang.code,
-            "ready": False,
-            "required_chars": alphabet,
-            "missing_chars": "".join(missing),
-            "missing_count": len(missing),
-        }
+
+    if not status_data["ready"]:
         return Response(
             {
                 "detail": "Nicht alle Zeichen sind abgedeckt (SVG).",
@@ -1587,40 +1691,59 @@ def build_ttf_color(request, sid: str, language: str):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    media_root = Path(settings.MEDIA_ROOT)
-    job_root_rel = job_sid_media(job)
-    build_rel_dir = os.path.join(job_root_rel, "build")
-
     # z.B. MyFont_de_svg_color.ttf
-    filename = f"{job.name}_{lang.code}_{fmt}_color.ttf".replace(" ", "_")
-    rel_path = os.path.join(build_rel_dir, filename)
-    full_path = media_root / rel_path
-    full_path.parent.mkdir(parents=True, exist_ok=True)
+    rel_path = font_build_rel_path(job, lang.code, fmt, color=True)
 
-    glyphs_for_lang = default_glyphs.filter(letter__in=alphabet_chars)
+    # Default SVG-Glyphs dieses Jobs
+    glyphs_for_lang = Glyph.objects.filter(
+        job=job,
+        is_default=True,
+        formattype=fmt,
+        letter__in=alphabet.lookup_letters,
+    )
+
+    previous = (
+        FontBuild.objects
+        .filter(
+            job=job,
+            language=lang,
+            glyph_formattype=fmt,
+            style=FontBuild.FontBuildStyle.COLOR,
+        )
+        # auch nach einem Fehlschlag: die Zeile hält weiter den letzten
+        # erfolgreichen Build (build_store.save_build_result)
+        .values_list("manifest", "ttf_path")
+        .first()
+    ) or (None, None)
 
     try:
-        # SVG → FontForge → COLR/CPAL per Palette
-        build_font.build_ttf_svg_color(job, lang, glyphs_for_lang, full_path)
+        # SVG → FontForge → COLR/CPAL per Palette (inkrementell, siehe build_ttf)
+        with build_store.workspace(job, os.path.basename(rel_path), previous[1]) as work_ttf:
+            build_log, manifest = build_font.build_font_incremental(
+                build_font.BUILD_KIND_COLOR,
+                job,
+                lang,
+                glyphs_for_lang,
+                work_ttf,
+                previous_manifest=previous[0],
+            )
+            rel_path = build_store.commit(job, work_ttf)
         success = True
-        log = ""
+        log = build_log.text()
     except Exception as e:
         success = False
         log = str(e)
-
-    # Fürs erste: wir überschreiben den bisherigen SVG-Build-Eintrag.
-    # Wenn du monochrom + color getrennt verfolgen willst, brauchst du
-    # ein extra Flag/Feld in FontBuild.
-    font_build, _created = FontBuild.objects.update_or_create(
-        job=job,
-        language=lang,
-        glyph_formattype=fmt,                     # fmt = "svg"
-        style=FontBuild.FontBuildStyle.COLOR,     # oder "color"
-        defaults={
-            "ttf_path": rel_path,
-            "success": success,
-            "log": log,
-        },
+        manifest = {}
+
+    font_build = build_store.save_build_result(
+        job,
+        lang,
+        fmt,                                      # fmt = "svg"
+        FontBuild.FontBuildStyle.COLOR,
+        success=success,
+        log=log,
+        ttf_path=rel_path,
+        manifest=manifest,
     )
 
 
@@ -1634,3 +1757,48 @@ def build_ttf_color(request, sid: str, language: str):
         )
 
     return Response(FontBuildSerializer(font_build).data, status=status.HTTP_200_OK)
+
+
+@api_view(["POST"])
+@permission_classes([permissions.IsAuthenticated])
+def build_batch(request, sid: str):
+    """
+    POST /jobs/<sid>/build-batch/
+    Body: { "languages": ["de", "fr"], "formattypes": ["png", "svg", "color"] }
+
+    Baut alle Kombinationen in einem Durchlauf: die Glyphen der Vereinigung
+    aller Alphabete werden nur einmal vektorisiert, die TTFs parallel erzeugt.
+    Nicht abgedeckte Kombinationen landen in "skipped".
+    """
+    job = get_job_or_404_for_user(sid, request.user)
+
+    serializer = BatchBuildRequestSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+
+    languages = list(dict.fromkeys(serializer.validated_data["languages"]))
+    kinds = list(dict.fromkeys(serializer.validated_data["formattypes"]))
+
+    result = run_batch_build(job, languages, kinds)
+
+    if not result.builds:
+        return Response(
+            {
+                "detail": "Keine Sprache/Formattype-Kombination ist vollständig abgedeckt.",
+                "builds": [],
+                "skipped": result.skipped,
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    ok = sum(1 for b in result.builds if b.success)
+    http_status = status.HTTP_200_OK if ok else status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    return Response(
+        {
+            "detail": f"{ok}/{len(result.builds)} Builds erfolgreich.",
+            "builds": FontBuildSerializer(result.builds, many=True).data,
+            "skipped": result.skipped,
+            "log": result.log,
+        },
+        status=http_status,
+    )
@@ -101,6 +101,8 @@ REST_FRAMEWORK = {
         "anon": "50/hour",
         "user": "200/hour",
         "demo_start": "10/hour",
+        # public font subsets (BeeFont download/subset/?text=)
+        "beefont_subset": os.getenv("BEEFONT_SUBSET_THROTTLE_RATE", "120/hour"),
     },
 }
 
@@ -212,6 +214,55 @@ MEDIA_ROOT = Path(os.getenv('MEDIA_ROOT', str(BASE_DIR / 'media')))
 # If you want a subfolder for BeeFont, keep it a Path as well
 BEEFONT_MEDIA_ROOT = Path(os.getenv("BEEFONT_MEDIA_ROOT", str(MEDIA_ROOT / "beefont")))
 BEEFONT_BASE_URL   = os.getenv("BEEFONT_BASE_URL", "/api/beefont")
+
+# BeeFont page-analysis queue (manage.py beefont_worker)
+# 0 workers = one analysis process per CPU core
+BEEFONT_ANALYSIS_WORKERS = int(os.getenv("BEEFONT_ANALYSIS_WORKERS", "0"))
+BEEFONT_ANALYSIS_POLL_SECONDS = float(os.getenv("BEEFONT_ANALYSIS_POLL_SECONDS", "1.0"))
+# running tasks without a worker heartbeat for this many seconds are requeued
+BEEFONT_ANALYSIS_HEARTBEAT_TIMEOUT = int(os.getenv("BEEFONT_ANALYSIS_HEARTBEAT_TIMEOUT", "120"))
+BEEFONT_ANALYSIS_MAX_ATTEMPTS = int(os.getenv("BEEFONT_ANALYSIS_MAX_ATTEMPTS", "3"))
+# wall-clock limit per task; a hung analysis process is killed and its task marked failed
+BEEFONT_ANALYSIS_TASK_TIMEOUT = float(os.getenv("BEEFONT_ANALYSIS_TASK_TIMEOUT", "600"))
+# Fiducial detection / threshold estimation runs on a pyramid-downscaled copy (longest side in px)
+BEEFONT_ANALYSIS_DETECT_MAX_PX = int(os.getenv("BEEFONT_ANALYSIS_DETECT_MAX_PX", "1800"))
+# Threads per page for cell crop/normalize/PNG encode
+# (0 = CPU count / BEEFONT_ANALYSIS_WORKERS, at least 2)
+BEEFONT_CELL_WORKERS = int(os.getenv("BEEFONT_CELL_WORKERS", "0"))
+# Store analysed PNG glyphs as 1-bit PNGs (0 = 8-bit grayscale); canvas size is per TemplateDefinition
+BEEFONT_GLYPH_PNG_BILEVEL = os.getenv("BEEFONT_GLYPH_PNG_BILEVEL", "1") == "1"
+# Page-analysis debug artifacts (media/beefont/jobs/<sid>/debug/page_<n>/):
+# "off", "failure" (only when fiducial/quad checks fail), "sampled", "full"
+BEEFONT_DEBUG_ARTIFACTS = os.getenv("BEEFONT_DEBUG_ARTIFACTS", "failure")
+BEEFONT_DEBUG_SAMPLE_PERCENT = float(os.getenv("BEEFONT_DEBUG_SAMPLE_PERCENT", "10"))
+# manage.py gc_beefont: delete debug artifacts older than this many days
+BEEFONT_DEBUG_RETENTION_DAYS = float(os.getenv("BEEFONT_DEBUG_RETENTION_DAYS", "7"))
+
+# BeeFont font build: parallel glyph vectorization (0 = CPU count)
+BEEFONT_BUILD_WORKERS = int(os.getenv("BEEFONT_BUILD_WORKERS", "0"))
+# PNG glyph tracing: "potrace" (convert + potrace subprocesses) or "opencv" (in-process)
+BEEFONT_TRACE_BACKEND = os.getenv("BEEFONT_TRACE_BACKEND", "potrace")
+# TTF assembly: "fontforge" (generated FontForge scripts) or "fonttools" (in-process, no subprocess)
+BEEFONT_FONT_BUILDER = os.getenv("BEEFONT_FONT_BUILDER", "fontforge")
+# Per-job cache of traced/split glyph artifacts (MB, LRU eviction; 0 disables)
+BEEFONT_OUTLINE_CACHE_MB = int(os.getenv("BEEFONT_OUTLINE_CACHE_MB", "64"))
+# Rendered template sheets for templates/<code>/image/ (MB on disk, LRU eviction; 0 disables)
+BEEFONT_TEMPLATE_CACHE_MB = int(os.getenv("BEEFONT_TEMPLATE_CACHE_MB", "128"))
+# Glyph thumbnails / sprite sheets (MB on disk, LRU eviction; 0 disables)
+BEEFONT_THUMBNAIL_CACHE_MB = int(os.getenv("BEEFONT_THUMBNAIL_CACHE_MB", "64"))
+# Write WOFF2/WOFF next to each built TTF (WOFF2 needs the "brotli" package)
+BEEFONT_BUILD_WEBFONTS = os.getenv("BEEFONT_BUILD_WEBFONTS", "1") == "1"
+# Font subsets for download/subset/?text= (MB on disk, LRU eviction; 0 disables)
+BEEFONT_SUBSET_CACHE_MB = int(os.getenv("BEEFONT_SUBSET_CACHE_MB", "64"))
+# Glyph ZIP import limits (uncompressed bytes actually extracted, zip-bomb guard)
+BEEFONT_ZIP_IMPORT_MAX_MEMBER_MB = float(os.getenv("BEEFONT_ZIP_IMPORT_MAX_MEMBER_MB", "5"))
+BEEFONT_ZIP_IMPORT_MAX_TOTAL_MB = float(os.getenv("BEEFONT_ZIP_IMPORT_MAX_TOTAL_MB", "500"))
+BEEFONT_ZIP_IMPORT_MAX_MEMBERS = int(os.getenv("BEEFONT_ZIP_IMPORT_MAX_MEMBERS", "5000"))
+# FontForge: long-lived worker processes instead of one fontforge process per build
+BEEFONT_FONTFORGE_PERSISTENT = os.getenv("BEEFONT_FONTFORGE_PERSISTENT", "1") == "1"
+BEEFONT_FONTFORGE_WORKERS = int(os.getenv("BEEFONT_FONTFORGE_WORKERS", "1"))
+BEEFONT_FONTFORGE_TIMEOUT = int(os.getenv("BEEFONT_FONTFORGE_TIMEOUT", "120"))
+BEEFONT_FONTFORGE_MAX_BUILDS = int(os.getenv("BEEFONT_FONTFORGE_MAX_BUILDS", "200"))
 INGO_BASE_URL = os.getenv("INGO_BASE_URL", "")
 INGO_TENANT_NAME = os.getenv("INGO_TENANT_NAME", "")
 INGO_CLIENT_ID = os.getenv("INGO_CLIENT_ID", "")